@@ -10,6 +10,7 @@ import time
 import schedule
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Add the rush_ci package to the path
 sys.path.append(str(Path(__file__).parent))
@@ -48,10 +49,15 @@ class RushCISystem:
         for directory in directories:
             Path(directory).mkdir(exist_ok=True)
     
-    def run_full_pipeline(self) -> bool:
+    def run_full_pipeline(self, due_only: bool = False) -> bool:
         """
         Run the complete CI pipeline
         
+        Args:
+            due_only: Only fetch the sources whose adaptive poll time has come.
+                Runs fetch, parse, store and alert only; the weekly brief and
+                summary stay on their own schedule (run_weekly_brief).
+        
         Returns:
             Success status
         """
@@ -59,20 +65,37 @@ class RushCISystem:
         start_time = time.time()
         
         try:
-            # Step 1: Fetch data from all sources
-            logger.info("Step 1: Fetching data from all sources")
-            raw_data = self.fetcher.fetch_all_sources()
-            
-            if not raw_data or not any(raw_data.values()):
-                logger.warning("No data fetched from any source")
-                return False
-            
-            # Save raw data for debugging
-            self._save_raw_data(raw_data)
-            
-            # Step 2: Parse and analyze data
-            logger.info("Step 2: Parsing and analyzing data")
-            parsed_data = self.parser.parse_all_data(raw_data)
+            if config.pipeline_mode == 'streaming':
+                # Steps 1-2: Parse each source's data while the remaining fetches run
+                logger.info("Steps 1-2: Fetching and parsing data from all sources")
+                raw_data = {}
+                parsed_data = self.parser.parse_stream(self.fetcher.iter_sources(due_only=due_only), raw_data)
+                
+                if not any(raw_data.values()):
+                    logger.warning("No data fetched from any source")
+                    # Quiet sources still back off their poll times
+                    self.fetcher.complete_run()
+                    return False
+                
+                # Save raw data for debugging
+                self._save_raw_data(raw_data)
+            else:
+                # Step 1: Fetch data from all sources
+                logger.info("Step 1: Fetching data from all sources")
+                raw_data = self.fetcher.fetch_all_sources(due_only=due_only)
+                
+                if not raw_data or not any(raw_data.values()):
+                    logger.warning("No data fetched from any source")
+                    # Quiet sources still back off their poll times
+                    self.fetcher.complete_run()
+                    return False
+                
+                # Save raw data for debugging
+                self._save_raw_data(raw_data)
+                
+                # Step 2: Parse and analyze data
+                logger.info("Step 2: Parsing and analyzing data")
+                parsed_data = self.parser.parse_all_data(raw_data)
             
             # Save parsed data
             self._save_parsed_data(parsed_data)
@@ -85,9 +108,11 @@ class RushCISystem:
                 logger.error("Data storage failed")
                 return False
             
-            # Step 4: Generate AI summaries
-            logger.info("Step 4: Generating AI summaries")
-            weekly_brief = self.summarizer.generate_weekly_brief(parsed_data)
+            # Step 4: Generate AI summaries (not on adaptive ticks, which only see the due sources)
+            weekly_brief = None
+            if not due_only:
+                logger.info("Step 4: Generating AI summaries")
+                weekly_brief = self.summarizer.generate_weekly_brief(parsed_data)
             
             # Step 5: Send alerts
             logger.info("Step 5: Processing alerts")
@@ -95,7 +120,7 @@ class RushCISystem:
             alert_success = self.alert_manager.process_alerts(alerts)
             
             # Step 6: Send weekly summary (if it's the right time)
-            if self._should_send_weekly_summary():
+            if not due_only and self._should_send_weekly_summary():
                 logger.info("Step 6: Sending weekly summary")
                 self.alert_manager.send_weekly_summary(weekly_brief)
             
@@ -103,12 +128,36 @@ class RushCISystem:
             execution_time = time.time() - start_time
             logger.info(f"Pipeline completed successfully in {execution_time:.2f} seconds")
             
+            # Results are processed, so the next run fetches from scratch
+            self.fetcher.complete_run()
+            
+            # Keep WebSub leases alive for feeds that push new posts
+            self.fetcher.websub.renew_expiring()
+            
             return True
             
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
             return False
     
+    def run_due_sources(self) -> bool:
+        """
+        Run the pipeline for the sources whose adaptive poll time has come
+        
+        Each tick fetches, parses, stores and alerts; the weekly brief runs
+        from its own Sunday job.
+        
+        Returns:
+            Success status (True when nothing is due)
+        """
+        due = self.fetcher.fetch_units(due_only=True)
+        if not due:
+            logger.debug("No sources due for polling")
+            return True
+        
+        logger.info(f"{len(due)} sources due for polling")
+        return self.run_full_pipeline(due_only=True)
+    
     def run_weekly_brief(self) -> bool:
         """
         Run weekly brief generation (typically on Sundays)
@@ -174,10 +223,52 @@ class RushCISystem:
             logger.error(f"Alert check failed: {e}")
             return False
     
-    def run_data_fetch_only(self) -> bool:
+    def process_feed_push(self, subscription: dict, content: bytes) -> bool:
+        """
+        Parse and alert on a feed body pushed by a WebSub hub
+        
+        Only the pushed posts are handled; storage and summaries pick them
+        up on the next full pipeline run.
+        
+        Args:
+            subscription: Authenticated WebSub subscription record
+            content: Pushed feed body
+            
+        Returns:
+            Success status
+        """
+        feed_url = subscription['feed_url']
+        
+        try:
+            blogs, watermark = self.fetcher.receive_feed_push(feed_url, subscription['company'], content)
+            if not blogs:
+                return True
+            
+            logger.info(f"WebSub push from {feed_url}: {len(blogs)} new posts")
+            alerts = self.parser.generate_alerts({'blogs': blogs})
+            success = self.alert_manager.process_alerts(alerts)
+            
+            if success:
+                self.fetcher.commit_feed_push(feed_url, watermark)
+            
+            return success
+            
+        except Exception as e:
+            logger.error(f"WebSub push from {feed_url} failed: {e}")
+            return False
+    
+    def run_data_fetch_only(self, commit: bool = False) -> bool:
         """
         Run only data fetching (for testing or manual runs)
         
+        The run is left open by default: nothing is parsed or alerted, so
+        watermarks and job snapshots stay where they were, and the next
+        pipeline run resumes from this run's checkpoints.
+        
+        Args:
+            commit: Complete the run, advancing watermarks and job snapshots
+                past what was fetched
+        
         Returns:
             Success status
         """
@@ -186,6 +277,8 @@ class RushCISystem:
         try:
             raw_data = self.fetcher.fetch_all_sources()
             self._save_raw_data(raw_data)
+            if commit:
+                self.fetcher.complete_run()
             
             logger.info("Data fetch completed")
             return True
@@ -194,6 +287,34 @@ class RushCISystem:
             logger.error(f"Data fetch failed: {e}")
             return False
     
+    def run_replay(self, as_of: Optional[datetime] = None) -> bool:
+        """
+        Re-run fetching and parsing over archived raw responses, offline
+        
+        Nothing is stored, alerted or committed; the parsed result is saved
+        as data/replay_parsed_data_<ts>.json.
+        
+        Args:
+            as_of: Replay the fetches made at or before this time, defaults to the latest
+        
+        Returns:
+            Success status
+        """
+        logger.info(f"Replaying archived responses as of {as_of or 'latest'}")
+        
+        try:
+            with DataFetcher(replay=True, replay_as_of=as_of) as fetcher:
+                raw_data = fetcher.fetch_all_sources()
+            parsed_data = self.parser.parse_all_data(raw_data)
+            self._save_parsed_data(parsed_data, prefix='replay_parsed_data')
+            
+            logger.info(f"Replay completed. Total: {sum(len(items) for items in raw_data.values())} items")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Replay failed: {e}")
+            return False
+    
     def run_test_mode(self) -> bool:
         """
         Run system in test mode
@@ -234,11 +355,11 @@ class RushCISystem:
         except Exception as e:
             logger.error(f"Error saving raw data: {e}")
     
-    def _save_parsed_data(self, parsed_data: dict) -> None:
+    def _save_parsed_data(self, parsed_data: dict, prefix: str = 'parsed_data') -> None:
         """Save parsed data to file"""
         try:
             import json
-            file_path = f'data/parsed_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+            file_path = f'data/{prefix}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
             with open(file_path, 'w') as f:
                 json.dump(parsed_data, f, default=str, indent=2)
             logger.debug(f"Parsed data saved to {file_path}")
@@ -273,8 +394,12 @@ class RushCISystem:
         """Setup automated scheduling"""
         logger.info("Setting up automated scheduling")
         
-        # Run full pipeline every 6 hours
-        schedule.every(6).hours.do(self.run_full_pipeline)
+        if config.poll_mode == 'adaptive':
+            # Poll each source on its own cadence, checking for due sources every few minutes
+            schedule.every(config.poll_tick_minutes).minutes.do(self.run_due_sources)
+        else:
+            # Run full pipeline every 6 hours
+            schedule.every(6).hours.do(self.run_full_pipeline)
         
         # Run alert check every 2 hours
         schedule.every(2).hours.do(self.run_alert_check)
@@ -304,9 +429,13 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Rush Gaming Competitive Intelligence System')
-    parser.add_argument('--mode', choices=['full', 'weekly', 'alerts', 'fetch', 'test', 'scheduler'], 
+    parser.add_argument('--mode', choices=['full', 'weekly', 'alerts', 'fetch', 'test', 'scheduler', 'replay'], 
                        default='full', help='Run mode')
     parser.add_argument('--config-check', action='store_true', help='Check configuration only')
+    parser.add_argument('--as-of', type=datetime.fromisoformat, default=None,
+                       help='Replay mode: use the archived responses fetched at or before this ISO time')
+    parser.add_argument('--commit-watermarks', action='store_true',
+                       help='Fetch mode: advance watermarks and job snapshots past the fetched items')
     
     args = parser.parse_args()
     
@@ -330,9 +459,11 @@ def main():
     elif args.mode == 'alerts':
         success = ci_system.run_alert_check()
     elif args.mode == 'fetch':
-        success = ci_system.run_data_fetch_only()
+        success = ci_system.run_data_fetch_only(commit=args.commit_watermarks)
     elif args.mode == 'test':
         success = ci_system.run_test_mode()
+    elif args.mode == 'replay':
+        success = ci_system.run_replay(args.as_of)
     elif args.mode == 'scheduler':
         ci_system.setup_scheduling()
         ci_system.run_scheduler()
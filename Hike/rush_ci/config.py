@@ -40,10 +40,96 @@ class Config:
         # System Config
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.alert_email = os.getenv("ALERT_EMAIL", "ci-alerts@rushgaming.com")
+
+        # Fetch engine
+        self.fetch_mode = os.getenv("FETCH_MODE", "async").lower()
+        self.fetch_max_concurrency = int(os.getenv("FETCH_MAX_CONCURRENCY", "16"))
+        self.fetch_per_host_concurrency = int(os.getenv("FETCH_PER_HOST_CONCURRENCY", "2"))
+        self.pipeline_mode = os.getenv("PIPELINE_MODE", "streaming").lower()
+        self.stream_queue_size = int(os.getenv("STREAM_QUEUE_SIZE", "8"))
+        self.fetch_deadline_seconds = float(os.getenv("FETCH_DEADLINE_SECONDS", "1800"))
+        self.fetch_source_budgets = {
+            source_type: float(os.getenv(f"FETCH_BUDGET_{source_type.upper()}_SECONDS", default))
+            for source_type, default in [('blogs', '120'), ('tweets', '60'), ('linkedin', '60'), ('jobs', '120')]
+        }
+        
+        # HTTP client
+        self.http_pool_connections = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+        self.http_pool_maxsize = int(os.getenv("HTTP_POOL_MAXSIZE", "4"))
+        self.http_retries = int(os.getenv("HTTP_RETRIES", "3"))
+        self.http_backoff_factor = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+        self.http_connect_timeout = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+        self.http_read_timeout = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+        self.http_hedge_after_seconds = float(os.getenv("HTTP_HEDGE_AFTER_SECONDS", "0"))
+        self.circuit_failure_threshold = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+        self.circuit_cooldown_seconds = float(os.getenv("CIRCUIT_COOLDOWN_SECONDS", "900"))
         
+        # Local caches
+        self.http_cache_dir = Path(os.getenv("HTTP_CACHE_DIR", "data/http_cache"))
+        self.state_dir = Path(os.getenv("STATE_DIR", "data/state"))
+        self.feed_discovery_ttl_hours = float(os.getenv("FEED_DISCOVERY_TTL_HOURS", "168"))
+        self.watermark_initial_days = int(os.getenv("WATERMARK_INITIAL_DAYS", "7"))
+        self.checkpoint_dir = Path(os.getenv("CHECKPOINT_DIR", "data/checkpoints"))
+        self.checkpoint_max_age_hours = float(os.getenv("CHECKPOINT_MAX_AGE_HOURS", "6"))
+        self.article_cache_dir = Path(os.getenv("ARTICLE_CACHE_DIR", "data/article_cache"))
+        self.archive_dir = Path(os.getenv("ARCHIVE_DIR", "data/archive"))
+        self.archive_enabled = os.getenv("ARCHIVE_ENABLED", "false").lower() == "true"
+
+        # Full-article fetching for blog items
+        self.article_fetch_enabled = os.getenv("ARTICLE_FETCH_ENABLED", "false").lower() == "true"
+        self.article_fetch_workers = int(os.getenv("ARTICLE_FETCH_WORKERS", "4"))
+        self.article_max_chars = int(os.getenv("ARTICLE_MAX_CHARS", "20000"))
+
+        # Head-only OpenGraph/Twitter card previews of item URLs, per source type
+        self.link_preview_enabled = os.getenv("LINK_PREVIEW_ENABLED", "false").lower() == "true"
+        self.link_preview_sources = [
+            source.strip() for source in os.getenv("LINK_PREVIEW_SOURCES", "blogs,jobs").split(",") if source.strip()
+        ]
+        self.link_preview_workers = int(os.getenv("LINK_PREVIEW_WORKERS", "8"))
+        self.link_preview_max_bytes = int(os.getenv("LINK_PREVIEW_MAX_BYTES", "65536"))
+        self.link_preview_ttl_days = float(os.getenv("LINK_PREVIEW_TTL_DAYS", "30"))
+
+        # Sitemap-driven change detection for HTML-only blogs
+        self.sitemap_enabled = os.getenv("SITEMAP_ENABLED", "true").lower() == "true"
+        self.sitemap_max_pages = int(os.getenv("SITEMAP_MAX_PAGES", "20"))
+
+        # Paginated job board ingestion; competitors may set job_page_size per board
+        self.job_page_size = int(os.getenv("JOB_PAGE_SIZE", "100"))
+        self.job_page_concurrency = int(os.getenv("JOB_PAGE_CONCURRENCY", "4"))
+        self.job_max_pages = int(os.getenv("JOB_MAX_PAGES", "50"))
+
+        # Pages of 100 new tweets read per handle and poll, following next_token
+        self.twitter_max_pages = int(os.getenv("TWITTER_MAX_PAGES", "10"))
+
+        # Adaptive polling: each source is polled about once per expected new item,
+        # within its POLL_MIN/MAX_<SOURCE>_MINUTES bounds
+        self.poll_mode = os.getenv("POLL_MODE", "adaptive").lower()
+        self.poll_tick_minutes = int(os.getenv("POLL_TICK_MINUTES", "15"))
+        self.poll_intervals = {
+            source_type: (float(os.getenv(f"POLL_MIN_{source_type.upper()}_MINUTES", min_default)),
+                          float(os.getenv(f"POLL_MAX_{source_type.upper()}_MINUTES", max_default)))
+            for source_type, min_default, max_default in [
+                ('blogs', '60', '10080'), ('tweets', '15', '720'), ('linkedin', '60', '1440'), ('jobs', '120', '2880')
+            ]
+        }
+        self.poll_rate_smoothing = float(os.getenv("POLL_RATE_SMOOTHING", "0.3"))
+        self.poll_priority_factors = {
+            'high': float(os.getenv("POLL_HIGH_PRIORITY_FACTOR", "0.5")),
+            'low': float(os.getenv("POLL_LOW_PRIORITY_FACTOR", "2"))
+        }
+
+        # spaCy batching for the parser; NLP_N_PROCESS > 1 spreads large batches over worker processes
+        self.nlp_batch_size = int(os.getenv("NLP_BATCH_SIZE", "64"))
+        self.nlp_n_process = int(os.getenv("NLP_N_PROCESS", "1"))
+
+        # WebSub push subscriptions; hubs call back on WEBSUB_CALLBACK_URL/<token>
+        self.websub_callback_url = os.getenv("WEBSUB_CALLBACK_URL", "")
+        self.websub_lease_seconds = int(os.getenv("WEBSUB_LEASE_SECONDS", "864000"))
+
         # Load competitor configuration
         self.competitors = self._load_competitors()
         self.alert_rules = self._load_alert_rules()
+        self.rate_limits = self._load_rate_limits()
         
     def _load_competitors(self) -> Dict[str, Any]:
         """Load competitor configuration from JSON file"""
@@ -140,6 +226,20 @@ class Config:
                 }
             }
     
+    def _load_rate_limits(self) -> Dict[str, Any]:
+        """Load per-host rate limit configuration"""
+        config_path = self.base_path / "config" / "rate_limits.json"
+        
+        if config_path.exists():
+            with open(config_path, 'r') as f:
+                return json.load(f)
+        else:
+            # Default: short bursts, then one request every 2 seconds per host
+            return {
+                "default": {"rate": 0.5, "burst": 2},
+                "hosts": {}
+            }
+    
     def get_competitor_by_name(self, name: str) -> Dict[str, Any]:
         """Get competitor config by name"""
         for key, config in self.competitors.items():
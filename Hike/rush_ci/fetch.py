@@ -5,95 +5,627 @@ Scrapes blogs, social media, and job boards for competitor intelligence.
 """
 
 import time
+import queue
+import asyncio
+import threading
+import contextvars
 import feedparser
 import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any, Optional, Callable, Tuple, Iterator
+from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
 import json
+import shutil
+import tempfile
+from pathlib import Path
 
 from .config import config
 from .utils.logger import get_logger
-from .utils.helpers import rate_limit_delay, safe_request, clean_text, generate_content_hash
+from .utils.helpers import safe_request, clean_text, generate_content_hash, is_recent_content
+from .utils.http_client import HttpClient, http_client
+from .utils.http_cache import HttpCache, http_cache
+from .utils.rate_limiter import host_key
+from .utils.state import JsonStateStore
+from .utils.extraction import SelectorSet, FieldRule, find_feed_links
+from .utils.dates import date_parser
+from .utils.checkpoints import FetchCheckpoint
+from .utils.deadline import time_budget, remaining
+from .utils.articles import ArticleFetcher, ArticleCache
+from .utils.sitemap import SitemapWatcher, sitemap_candidates
+from .utils.websub import WebSubSubscriber, find_hub
+from .utils.poll_schedule import PollScheduler
+from .utils.archive import ResponseArchive
+from .utils.link_preview import LinkPreviewFetcher
 
 logger = get_logger(__name__)
 
+# Source type -> (fetch method, label used in log messages)
+SOURCE_FETCHERS = {
+    'blogs': ('fetch_blogs', 'blog posts'),
+    'tweets': ('fetch_tweets', 'tweets'),
+    'linkedin': ('fetch_linkedin_posts', 'LinkedIn posts'),
+    'jobs': ('fetch_jobs', 'job postings')
+}
+
+# Sources served from a fixed API host, and config keys holding the URL for the rest.
+# Per-host fetch limits key these the same way the rate limiter does (host_key).
+SOURCE_HOSTS = {
+    'tweets': 'api.twitter.com',
+    'linkedin': 'www.linkedin.com'
+}
+SOURCE_URL_KEYS = {
+    'blogs': 'blog_url',
+    'jobs': 'careers_url'
+}
+
+FEED_CONTENT_TYPES = ['application/rss+xml', 'application/atom+xml']
+
+TWITTER_API_URL = 'https://api.twitter.com/2'
+TWITTER_USERS_PER_LOOKUP = 100  # users/by accepts up to 100 usernames
+
+# Common blog post selectors, tried in order on HTML blog pages
+BLOG_SELECTORS = [
+    'article',
+    '.post',
+    '.blog-post',
+    '.entry',
+    '[class*="post"]',
+    '[class*="blog"]'
+]
+BLOG_FIELDS = {
+    'title': FieldRule(['h1', 'h2', 'h3', 'h4']),
+    'link': FieldRule(['a'], attribute='href'),
+    'content': FieldRule(['p', 'div'])
+}
+
+# Common job posting selectors, tried in order on HTML careers pages
+JOB_SELECTORS = [
+    '.job',
+    '.position',
+    '.opening',
+    '[class*="job"]',
+    '[class*="position"]'
+]
+JOB_FIELDS = {
+    'title': FieldRule(['h1', 'h2', 'h3', 'h4']),
+    'location': FieldRule(['span', 'div'], class_contains='location'),
+    'link': FieldRule(['a'], attribute='href')
+}
+
+# Paginated job board adapter -> (page parameter, page size parameter, whether the
+# page parameter is an offset); boards without an entry are fetched in one request
+JOB_PAGINATION = {
+    'greenhouse': ('page', 'per_page', False),
+    'lever': ('skip', 'limit', True)
+}
+
+# Watermarks, since_ids and job snapshots held by the unit being fetched in this thread,
+# checkpointed with its items so a resumed run can hold them again
+_unit_held: contextvars.ContextVar[Optional[Dict[str, Dict[str, Any]]]] = \
+    contextvars.ContextVar('rush_ci_unit_held', default=None)
+
+# State stores copied into a replay's scratch state, so it requests the same
+# URLs the archived runs did (link previews stop reading pages at </head>, so
+# those pages are not archived)
+REPLAY_SEEDED_STORES = ['feed_discovery', 'job_adapters', 'twitter_users', 'link_previews']
+
 
 class DataFetcher:
     """Main data fetching class for competitor intelligence"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    def __init__(self, replay: bool = False, replay_as_of: Optional[datetime] = None):
+        """
+        Args:
+            replay: Serve every request from the raw response archive instead of
+                the network, through a client of its own. State and caches are
+                kept in a scratch directory, seeded with the learned feeds, job
+                boards and Twitter users, so the live watermarks, snapshots,
+                schedules and caches are left untouched. Call close() afterwards.
+            replay_as_of: Replay the fetches made at or before this time
+        """
+        self.replay = replay
+        state_dir = None
+        
+        # HTTP client and conditional-GET cache of a replay; None uses the shared ones
+        self._client: Optional[HttpClient] = None
+        self._cache: Optional[HttpCache] = None
+        self._scratch_dir: Optional[Path] = None
+        
+        if replay:
+            state_dir = self._scratch_dir = Path(tempfile.mkdtemp(prefix='rush-ci-replay-'))
+            for name in REPLAY_SEEDED_STORES:
+                seed = Path(config.state_dir) / f"{name}.json"
+                if seed.exists():
+                    shutil.copy(seed, state_dir)
+            archive = ResponseArchive()
+            self._client = HttpClient(archive=archive)
+            self._client.replay(archive, replay_as_of)
+            self._cache = HttpCache(state_dir / 'http_cache')
+            logger.info(f"Replaying archived responses as of {replay_as_of or 'latest'}")
+        
+        # Pooled keep-alive session, shared with safe_request outside replays
+        self.session = self.http_client.session
+        
+        # Blog URL -> {'feed_url': str or None for HTML-only, 'checked_at': datetime}
+        self.feed_discovery = JsonStateStore('feed_discovery', state_dir)
+        
+        # HTML-only blog URL -> {'sitemap_url', 'snapshot', 'checked_at'}, the lastmod
+        # snapshot the next run's sitemap is diffed against; sitemap_url is None for
+        # sites without one
+        self.sitemaps = JsonStateStore('sitemaps', state_dir)
+        
+        # Careers URL -> {'adapter', 'url', 'selector', 'page_size', 'resolved_at'} of the job board that worked
+        self.job_adapters = JsonStateStore('job_adapters', state_dir)
+        
+        # Careers URL -> {'jobs': {posting ID: content hash}, 'synced_at'}, the open postings
+        # as of the last completed run; advances in complete_run() like the watermarks
+        self.job_snapshots = JsonStateStore('job_snapshots', state_dir)
+        self._pending_job_snapshots: Dict[str, Dict[str, Any]] = {}
+        
+        # Lowercased Twitter handle -> user ID, and -> newest tweet ID already delivered;
+        # since_ids advance in complete_run() like the watermarks
+        self.twitter_users = JsonStateStore('twitter_users', state_dir)
+        self.twitter_since_ids = JsonStateStore('twitter_since_ids', state_dir)
+        self._pending_since_ids: Dict[str, str] = {}
+        
+        # Full article text for blog items, cached by canonical URL
+        self.article_fetcher = ArticleFetcher(ArticleCache(state_dir / 'articles') if replay else None, client=self._client)
+        
+        # Canonical item URL -> OpenGraph/Twitter card preview read from the page head
+        self.link_previews = LinkPreviewFetcher(JsonStateStore('link_previews', state_dir), client=self._client)
+        
+        # Hub subscriptions for feeds that push new posts (WebSub)
+        self.websub = WebSubSubscriber('' if replay else None, JsonStateStore('websub_subscriptions', state_dir))
+        
+        # Source key -> {'newest': datetime, 'ids': [...]}, the newest entries already
+        # delivered; advances in complete_run() so a failed run sees the same delta again
+        self.watermarks = JsonStateStore('watermarks', state_dir)
+        self._pending_watermarks: Dict[str, Dict[str, Any]] = {}
+        self._watermark_lock = threading.Lock()
+        
+        # Per-unit results of the current run, for resuming after a crash
+        self.checkpoints = FetchCheckpoint(state_dir / 'checkpoints' if replay else None)
+        
+        # Adaptive next-poll time of every competitor/source pair
+        self.poll_schedule = PollScheduler(JsonStateStore('poll_schedule', state_dir))
+        
+        # Compiled HTML selector sets, keyed by selector order
+        self._extractors: Dict[Tuple, SelectorSet] = {}
+        
+        # time.monotonic() deadline of the current fetch run, if any
+        self._run_deadline: Optional[float] = None
         
-    def fetch_all_sources(self) -> Dict[str, List[Dict]]:
+    @property
+    def http_client(self) -> HttpClient:
+        """HTTP client this fetcher sends requests through"""
+        return self._client or http_client
+    
+    @property
+    def http_cache(self) -> HttpCache:
+        """Conditional-GET cache this fetcher revalidates against"""
+        return self._cache or http_cache
+    
+    def close(self) -> None:
+        """Release a replay's own client and remove its scratch state; a no-op for live fetchers"""
+        if self._client is not None:
+            self._client.close()
+        if self._scratch_dir is not None:
+            shutil.rmtree(self._scratch_dir, ignore_errors=True)
+            self._scratch_dir = None
+    
+    def __enter__(self) -> 'DataFetcher':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def fetch_all_sources(self, on_result: Optional[Callable[[str, List[Dict]], None]] = None,
+                          due_only: bool = False) -> Dict[str, List[Dict]]:
         """
         Fetch data from all sources for all competitors
         
+        Uses the concurrent engine unless FETCH_MODE is set to "sequential".
+        Resumes the latest unfinished run: units it already completed within
+        CHECKPOINT_MAX_AGE_HOURS are reused rather than fetched again. Call
+        complete_run() once the results are safely processed.
+        
+        The run stops starting new units after FETCH_DEADLINE_SECONDS, and
+        each unit's requests share a per-source FETCH_BUDGET_*_SECONDS budget.
+        
+        Args:
+            on_result: Called with (source_type, items) as each competitor/source pair completes
+            due_only: Only fetch the pairs whose adaptive poll time has come
+        
         Returns:
             Dictionary with data by source type
         """
+        if config.fetch_mode == 'async':
+            coroutine = self.fetch_all_sources_async(on_result, due_only)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(coroutine)
+            
+            # asyncio.run() refuses to nest inside a running loop, so give the run its own thread
+            with ThreadPoolExecutor(max_workers=1) as runner:
+                return runner.submit(asyncio.run, coroutine).result()
+        
+        self._start_run()
         logger.info("Starting data fetch for all competitors")
         
-        all_data = {
-            'blogs': [],
-            'tweets': [],
-            'linkedin': [],
-            'jobs': []
-        }
+        all_data = {source_type: [] for source_type in SOURCE_FETCHERS}
         
-        for competitor_key, competitor_config in config.competitors.items():
-            logger.info(f"Fetching data for {competitor_config['name']}")
-            
-            # Fetch blogs
-            try:
-                blogs = self.fetch_blogs(competitor_config)
-                all_data['blogs'].extend(blogs)
-                logger.info(f"Fetched {len(blogs)} blog posts for {competitor_config['name']}")
-            except Exception as e:
-                logger.error(f"Error fetching blogs for {competitor_config['name']}: {e}")
+        for competitor_key, competitor_config, source_type in self.fetch_units(due_only):
+            items = self._fetch_source(competitor_key, competitor_config, source_type)
+            all_data[source_type].extend(items)
+            if on_result:
+                on_result(source_type, items)
+        
+        logger.info(f"Completed data fetch. Total: {sum(len(data) for data in all_data.values())} items")
+        return all_data
+    
+    async def fetch_all_sources_async(self, on_result: Optional[Callable[[str, List[Dict]], None]] = None,
+                                      due_only: bool = False) -> Dict[str, List[Dict]]:
+        """
+        Fetch all competitor/source pairs concurrently
+        
+        Each pair runs in a worker thread, bounded by FETCH_MAX_CONCURRENCY
+        overall and FETCH_PER_HOST_CONCURRENCY per host. Results keep the
+        same ordering as the sequential loop. Opens or resumes the run the
+        same way fetch_all_sources() does.
+        
+        Args:
+            on_result: Called from the worker thread with (source_type, items)
+                as each pair completes; a blocking callback holds that pair's slot
+            due_only: Only fetch the pairs whose adaptive poll time has come
+        
+        Returns:
+            Dictionary with data by source type
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._start_run)
+        logger.info("Starting concurrent data fetch for all competitors")
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, config.fetch_max_concurrency))
+        global_limit = asyncio.Semaphore(config.fetch_max_concurrency)
+        host_limits = defaultdict(lambda: asyncio.Semaphore(config.fetch_per_host_concurrency))
+        
+        def run_unit(competitor_key: str, competitor_config: Dict[str, Any], source_type: str) -> List[Dict]:
+            items = self._fetch_source(competitor_key, competitor_config, source_type)
+            if on_result:
+                on_result(source_type, items)
+            return items
+        
+        async def fetch_unit(competitor_key: str, competitor_config: Dict[str, Any], source_type: str) -> List[Dict]:
+            host = self._source_host(competitor_config, source_type)
+            async with host_limits[host], global_limit:
+                return await loop.run_in_executor(executor, run_unit, competitor_key, competitor_config, source_type)
+        
+        units = self.fetch_units(due_only)
+        
+        try:
+            results = await asyncio.gather(*(fetch_unit(*unit) for unit in units))
+        finally:
+            executor.shutdown(wait=False)
+        
+        all_data = {source_type: [] for source_type in SOURCE_FETCHERS}
+        for (competitor_key, competitor_config, source_type), items in zip(units, results):
+            all_data[source_type].extend(items)
+        
+        logger.info(f"Completed data fetch. Total: {sum(len(data) for data in all_data.values())} items")
+        return all_data
+    
+    def _start_run(self) -> None:
+        """Open or resume the checkpointed run, start its deadline and pre-resolve Twitter users"""
+        self.checkpoints.start_run()
+        self._run_deadline = time.monotonic() + config.fetch_deadline_seconds if config.fetch_deadline_seconds > 0 else None
+        
+        # Resolve every uncached Twitter handle up front in one users/by lookup
+        with time_budget(self._run_time_left()):
+            self.resolve_twitter_users([c.get('twitter_handle') for c in config.competitors.values()])
+    
+    def fetch_units(self, due_only: bool = False) -> List[Tuple[str, Dict[str, Any], str]]:
+        """
+        List the competitor/source pairs of a fetch run, competitor by competitor
+        
+        Args:
+            due_only: Leave out pairs whose adaptive poll time has not come yet
             
-            rate_limit_delay()
+        Returns:
+            List of (competitor key, competitor config, source type)
+        """
+        now = datetime.now()
+        return [
+            (competitor_key, competitor_config, source_type)
+            for competitor_key, competitor_config in config.competitors.items()
+            for source_type in SOURCE_FETCHERS
+            if not due_only or self.poll_schedule.is_due(competitor_key, source_type, now)
+        ]
+    
+    def iter_sources(self, queue_size: Optional[int] = None, due_only: bool = False) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Stream fetch results as each competitor/source pair completes
+        
+        Fetching runs in a background thread and hands batches over through a
+        bounded queue, so the consumer can parse one batch while the next is
+        still on the network. When the queue is full the fetch workers wait.
+        
+        Args:
+            queue_size: Batches buffered ahead of the consumer (default STREAM_QUEUE_SIZE)
+            due_only: Only fetch the pairs whose adaptive poll time has come
             
-            # Fetch tweets
+        Yields:
+            (source_type, items) tuples in completion order
+        """
+        batches = queue.Queue(maxsize=max(1, queue_size or config.stream_queue_size))
+        stopped = threading.Event()
+        done = object()
+        
+        def put(entry) -> None:
+            # Re-check periodically so an abandoned consumer cannot wedge the workers
+            while not stopped.is_set():
+                try:
+                    batches.put(entry, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+        
+        def produce() -> None:
             try:
-                tweets = self.fetch_tweets(competitor_config)
-                all_data['tweets'].extend(tweets)
-                logger.info(f"Fetched {len(tweets)} tweets for {competitor_config['name']}")
+                self.fetch_all_sources(on_result=lambda source_type, items: put((source_type, items)), due_only=due_only)
             except Exception as e:
-                logger.error(f"Error fetching tweets for {competitor_config['name']}: {e}")
-            
-            rate_limit_delay()
+                put(e)
+            finally:
+                put(done)
+        
+        producer = threading.Thread(target=produce, name='rush-ci-fetch', daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                entry = batches.get()
+                if entry is done:
+                    break
+                if isinstance(entry, Exception):
+                    raise entry
+                yield entry
+        finally:
+            stopped.set()
+    
+    def _fetch_source(self, competitor_key: str, competitor_config: Dict[str, Any], source_type: str) -> List[Dict[str, Any]]:
+        """
+        Fetch a single source for a single competitor, logging any failure
+        
+        Reuses the unit's checkpoint from the current run when it is fresh,
+        holding its watermarks, job snapshots and poll observation again
+        (a crash drops the held ones along with the run), and checkpoints the
+        unit with them after a successful fetch. Failed units, and
+        units cut short by the time budget, are not checkpointed, so a
+        resumed run retries them. Units are skipped once the run deadline
+        has passed.
+        
+        Args:
+            competitor_key: Competitor key from competitors.json
+            competitor_config: Competitor configuration
+            source_type: One of the SOURCE_FETCHERS keys
             
-            # Fetch LinkedIn posts
+        Returns:
+            List of fetched items (empty on error)
+        """
+        method_name, label = SOURCE_FETCHERS[source_type]
+        
+        checkpointed = self.checkpoints.load_unit(competitor_key, source_type)
+        if checkpointed is not None:
+            self._hold_again(checkpointed.get('held', {}))
+            self._observe_poll(competitor_key, competitor_config, source_type, checkpointed['items'],
+                               checkpointed['fetched_at'])
+            logger.info(f"Reusing {len(checkpointed['items'])} checkpointed {label} for {competitor_config['name']}")
+            return checkpointed['items']
+        
+        run_time_left = self._run_time_left()
+        if run_time_left is not None and run_time_left <= 0:
+            logger.warning(f"Skipping {label} for {competitor_config['name']}: fetch deadline reached")
+            return []
+        
+        budget = config.fetch_source_budgets.get(source_type)
+        if run_time_left is not None:
+            budget = min(budget, run_time_left) if budget else run_time_left
+        
+        held = {'watermarks': {}, 'job_snapshots': {}, 'since_ids': {}}
+        token = _unit_held.set(held)
+        
+        with time_budget(budget):
             try:
-                linkedin_posts = self.fetch_linkedin_posts(competitor_config)
-                all_data['linkedin'].extend(linkedin_posts)
-                logger.info(f"Fetched {len(linkedin_posts)} LinkedIn posts for {competitor_config['name']}")
+                items = getattr(self, method_name)(competitor_config)
+                logger.info(f"Fetched {len(items)} {label} for {competitor_config['name']}")
+                
+                if items and config.link_preview_enabled and source_type in config.link_preview_sources:
+                    self.link_previews.enrich(items)
             except Exception as e:
-                logger.error(f"Error fetching LinkedIn posts for {competitor_config['name']}: {e}")
-            
-            rate_limit_delay()
+                logger.error(f"Error fetching {label} for {competitor_config['name']}: {e}")
+                return []
+            finally:
+                _unit_held.reset(token)
             
-            # Fetch jobs
-            try:
-                jobs = self.fetch_jobs(competitor_config)
-                all_data['jobs'].extend(jobs)
-                logger.info(f"Fetched {len(jobs)} job postings for {competitor_config['name']}")
-            except Exception as e:
-                logger.error(f"Error fetching jobs for {competitor_config['name']}: {e}")
+            budget_left = remaining()
+            if budget_left is not None and budget_left <= 0:
+                logger.warning(f"Time budget ran out fetching {label} for {competitor_config['name']}")
+                return items
+        
+        self._observe_poll(competitor_key, competitor_config, source_type, items)
+        self.checkpoints.record(competitor_key, source_type, items, held)
+        return items
+    
+    def _observe_poll(self, competitor_key: str, competitor_config: Dict[str, Any], source_type: str,
+                      items: List[Dict], polled_at: Optional[datetime] = None) -> None:
+        """Feed a unit's new items into its adaptive poll interval"""
+        self.poll_schedule.observe(competitor_key, competitor_config, source_type,
+                                   sum(1 for item in items if item.get('is_new', True)), now=polled_at)
+    
+    def _run_time_left(self) -> Optional[float]:
+        """Seconds until the fetch run deadline, or None without one"""
+        if self._run_deadline is None:
+            return None
+        return self._run_deadline - time.monotonic()
+    
+    def complete_run(self) -> None:
+        """
+        Mark the current run's results as processed
+        
+        Advances the per-source watermarks, Twitter since_ids and job board
+        snapshots, so the next run only sees newer entries, commits the next
+        poll times and discards the run's checkpoints.
+        """
+        with self._watermark_lock:
+            snapshots, self._pending_job_snapshots = self._pending_job_snapshots, {}
+            since_ids, self._pending_since_ids = self._pending_since_ids, {}
+        
+        self._commit_watermarks()
+        
+        if snapshots:
+            self.job_snapshots.update(snapshots)
+        if since_ids:
+            self.twitter_since_ids.merge(since_ids, self._newer_tweet_id)
+        
+        self.poll_schedule.commit()
+        self.checkpoints.complete_run()
+    
+    def _hold_watermark(self, key: str, mark: Dict[str, Any]) -> None:
+        """Hold a source's new watermark until complete_run()"""
+        with self._watermark_lock:
+            self._pending_watermarks[key] = self._merge_watermark(self._pending_watermarks.get(key), mark)
+        
+        held = _unit_held.get()
+        if held is not None:
+            held['watermarks'][key] = self._merge_watermark(held['watermarks'].get(key), mark)
+    
+    def _hold_job_snapshot(self, careers_url: str, snapshot: Dict[str, Any]) -> None:
+        """Hold a job board's new snapshot until complete_run()"""
+        with self._watermark_lock:
+            self._pending_job_snapshots[careers_url] = snapshot
+        
+        held = _unit_held.get()
+        if held is not None:
+            held['job_snapshots'][careers_url] = snapshot
+    
+    def _hold_since_id(self, handle_key: str, since_id: str) -> None:
+        """Hold a Twitter handle's newest delivered tweet ID until complete_run()"""
+        with self._watermark_lock:
+            self._pending_since_ids[handle_key] = self._newer_tweet_id(self._pending_since_ids.get(handle_key), since_id)
+        
+        held = _unit_held.get()
+        if held is not None:
+            held['since_ids'][handle_key] = since_id
+    
+    def _hold_again(self, held: Dict[str, Dict[str, Any]]) -> None:
+        """Hold the watermarks, since_ids and job snapshots of a unit reused from its checkpoint"""
+        for key, mark in held.get('watermarks', {}).items():
+            self._hold_watermark(key, mark)
+        for careers_url, snapshot in held.get('job_snapshots', {}).items():
+            self._hold_job_snapshot(careers_url, snapshot)
+        for handle_key, since_id in held.get('since_ids', {}).items():
+            self._hold_since_id(handle_key, since_id)
+    
+    @staticmethod
+    def _newer_tweet_id(current: Optional[str], new: str) -> str:
+        """The later of two tweet IDs, which grow with time"""
+        if current is None or int(new) > int(current):
+            return new
+        return current
+    
+    def _commit_watermarks(self) -> None:
+        """Advance every held watermark, merged with the stored ones under the store's lock"""
+        with self._watermark_lock:
+            pending, self._pending_watermarks = self._pending_watermarks, {}
+        
+        if pending:
+            self.watermarks.merge(pending, self._merge_watermark)
+    
+    def _take_unseen(self, key: str, entries: List[Tuple[Optional[datetime], str, Any]],
+                     first_run_limit: int, held: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Any]:
+        """
+        Keep only the entries newer than a source's watermark, newest first
+        
+        Walks the entries by date and stops at the first one already seen.
+        Before a source has a watermark, only entries from the last
+        WATERMARK_INITIAL_DAYS are kept, up to first_run_limit, plus any
+        undated ones; after that undated entries cannot be placed and are
+        skipped. The new high-water mark is held until complete_run().
+        
+        Args:
+            key: Source key, e.g. "feed:<url>"
+            entries: (date or None, entry ID, payload) tuples
+            first_run_limit: Most entries kept when there is no watermark yet
+            held: Collects the new watermark instead of holding it until complete_run()
             
-            rate_limit_delay()
+        Returns:
+            Payloads of the unseen entries
+        """
+        mark = self.watermarks.get(key)
+        dated = sorted((entry for entry in entries if entry[0] is not None), key=lambda entry: entry[0], reverse=True)
+        fresh = []
         
-        logger.info(f"Completed data fetch. Total: {sum(len(data) for data in all_data.values())} items")
-        return all_data
+        for published_at, entry_id, payload in dated:
+            if mark is not None:
+                if published_at < mark['newest'] or (published_at == mark['newest'] and entry_id in mark['ids']):
+                    break
+            elif not self.replay and not is_recent_content(published_at, days=config.watermark_initial_days):
+                # Archived entries are older than the window, so replays skip it
+                break
+            fresh.append((published_at, entry_id, payload))
+        
+        if mark is None:
+            fresh = (fresh + [entry for entry in entries if entry[0] is None])[:first_run_limit]
+        
+        if fresh and fresh[0][0] is not None:
+            newest = fresh[0][0]
+            mark = {'newest': newest, 'ids': [entry_id for published_at, entry_id, _ in fresh if published_at == newest]}
+            if held is not None:
+                held[key] = mark
+            else:
+                self._hold_watermark(key, mark)
+        
+        return [payload for _, _, payload in fresh]
+    
+    @staticmethod
+    def _merge_watermark(current: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine two watermarks, keeping the newer one and pooling IDs on a tie"""
+        if current is None or new['newest'] > current['newest']:
+            return new
+        if new['newest'] == current['newest']:
+            return {'newest': current['newest'], 'ids': sorted(set(current['ids']) | set(new['ids']))}
+        return current
+    
+    def _source_host(self, competitor_config: Dict[str, Any], source_type: str) -> str:
+        """
+        Get the host a competitor/source pair talks to, for per-host limits
+        
+        Uses the learned feed or job board URL when there is one, since that
+        is the host actually contacted, and keys it like the rate limiter.
+        """
+        if source_type in SOURCE_HOSTS:
+            return host_key(SOURCE_HOSTS[source_type])
+        
+        url = competitor_config.get(SOURCE_URL_KEYS.get(source_type, ''), '')
+        if url and source_type == 'blogs':
+            url = (self.feed_discovery.get(url) or {}).get('feed_url') or url
+        elif url and source_type == 'jobs':
+            url = (self.job_adapters.get(url) or {}).get('url') or url
+        
+        return host_key(url) if '://' in url else competitor_config.get('name', '')
     
     def fetch_blogs(self, competitor_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Fetch blog posts from competitor website
         
+        Uses the feed location learned on earlier runs, so steady-state runs
+        make a single request per blog. Discovery re-runs once the record
+        is older than FEED_DISCOVERY_TTL_HOURS or the learned feed fails.
+        With ARTICLE_FETCH_ENABLED, each post's content is replaced by the
+        full article text, downloading only articles not seen before.
+        
         Args:
             competitor_config: Competitor configuration
             
@@ -106,50 +638,51 @@ class DataFetcher:
         if not blog_url:
             return blogs
         
+        company_name = competitor_config['name']
+        
         try:
-            # Try RSS feed first
-            rss_urls = [
-                f"{blog_url}/feed",
-                f"{blog_url}/rss",
-                f"{blog_url}/feed.xml",
-                f"{blog_url}/rss.xml"
-            ]
-            
-            for rss_url in rss_urls:
-                try:
-                    response = safe_request(rss_url)
-                    if response and response.status_code == 200:
-                        feed = feedparser.parse(response.content)
-                        
-                        for entry in feed.entries[:10]:  # Last 10 posts
-                            blog_data = {
-                                'title': clean_text(entry.get('title', '')),
-                                'url': entry.get('link', ''),
-                                'content': clean_text(entry.get('summary', '')),
-                                'company': competitor_config['name'],
-                                'published_at': self._parse_date(entry.get('published', '')),
-                                'source': 'rss',
-                                'content_hash': generate_content_hash(entry.get('title', '') + entry.get('summary', ''))
-                            }
-                            blogs.append(blog_data)
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"RSS feed failed for {rss_url}: {e}")
-                    continue
-            
-            # Fallback to HTML scraping if RSS fails
-            if not blogs:
-                blogs = self._scrape_blog_html(blog_url, competitor_config['name'])
-                
+            blogs = self._fetch_blog_listing(blog_url, company_name)
         except Exception as e:
             logger.error(f"Error fetching blogs from {blog_url}: {e}")
         
+        if blogs and config.article_fetch_enabled:
+            self.article_fetcher.enrich(blogs)
+        
         return blogs
     
-    def _scrape_blog_html(self, blog_url: str, company_name: str) -> List[Dict[str, Any]]:
+    def _fetch_blog_listing(self, blog_url: str, company_name: str) -> List[Dict[str, Any]]:
+        """Fetch blog posts from the learned feed or HTML page, rediscovering when needed"""
+        record = self.feed_discovery.get(blog_url)
+        
+        if record and self._is_discovery_fresh(record):
+            if record.get('feed_url'):
+                feed_blogs = self._fetch_feed(record['feed_url'], company_name)
+                if feed_blogs is not None:
+                    return feed_blogs
+                logger.info(f"Learned feed {record['feed_url']} failed, rediscovering")
+            else:
+                return self._scrape_blog_html(blog_url, company_name)
+        
+        return self._discover_and_fetch_blogs(blog_url, company_name)
+    
+    def _is_discovery_fresh(self, record: Dict[str, Any]) -> bool:
+        """Check whether a feed discovery record is within its revalidation TTL"""
+        if self.replay:
+            # Rediscovery would request URLs the archive does not have
+            return True
+        
+        checked_at = record.get('checked_at')
+        if not isinstance(checked_at, datetime):
+            return False
+        return datetime.now() - checked_at < timedelta(hours=config.feed_discovery_ttl_hours)
+    
+    def _discover_and_fetch_blogs(self, blog_url: str, company_name: str) -> List[Dict[str, Any]]:
         """
-        Scrape blog posts from HTML when RSS is not available
+        Find a blog's feed, remember it, and fetch posts
+        
+        Looks for <link rel="alternate"> feed autodiscovery in the blog HTML
+        first, then probes the common feed paths. Blogs without a feed are
+        recorded as HTML-only and scraped from the page already downloaded.
         
         Args:
             blog_url: Blog URL
@@ -158,67 +691,385 @@ class DataFetcher:
         Returns:
             List of blog post data
         """
+        page = self._request(blog_url)
+        feed_url = self._autodiscover_feed(page.content, blog_url) if page is not None else None
+        
+        if not feed_url:
+            for candidate in [f"{blog_url}/feed", f"{blog_url}/rss", f"{blog_url}/feed.xml", f"{blog_url}/rss.xml"]:
+                response = self._request(candidate)
+                if response is not None and response.status_code == 200 and feedparser.parse(response.content).version:
+                    feed_url = candidate
+                    break
+        
+        self.feed_discovery.set(blog_url, {'feed_url': feed_url, 'checked_at': datetime.now()})
+        logger.info(f"Feed discovery for {blog_url}: {feed_url or 'html-only'}")
+        
+        if feed_url:
+            return self._fetch_feed(feed_url, company_name) or []
+        
+        if config.sitemap_enabled:
+            blogs = self._scrape_blog_sitemap(blog_url, company_name)
+            if blogs is not None:
+                return blogs
+        
+        if page is None or page.status_code != 200:
+            return []
+        
+        blogs = self._extract_blog_articles(page.content, blog_url, company_name)
+        self.http_cache.store(blog_url, page, blogs)
+        return blogs
+    
+    def _autodiscover_feed(self, content: bytes, blog_url: str) -> Optional[str]:
+        """
+        Find an advertised RSS/Atom feed in page HTML
+        
+        Args:
+            content: Raw HTML content
+            blog_url: Page URL, used to resolve relative links
+            
+        Returns:
+            Absolute feed URL or None
+        """
+        links = find_feed_links(content, FEED_CONTENT_TYPES)
+        return urljoin(blog_url, links[0]) if links else None
+    
+    def _fetch_cached(self, url: str, extract: Callable[[requests.Response], List[Dict[str, Any]]],
+                      revalidate: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Conditional GET a URL and extract items from it
+        
+        A 304 returns the items cached from the last full response without
+        downloading or parsing anything.
+        
+        Args:
+            url: URL to request
+            extract: Callable turning a 200 response into items
+            revalidate: Optional filter applied to cached items on a 304,
+                e.g. to drop entries a watermark has since passed
+            
+        Returns:
+            List of items, or None if the request failed
+        """
+        response = self._request(url, conditional=True)
+        if response is None:
+            return None
+        
+        if response.status_code == 304:
+            cached_items = self.http_cache.load_payload(url)
+            if cached_items is not None:
+                logger.debug(f"Not modified, reusing cached items for {url}")
+                return revalidate(cached_items) if revalidate else cached_items
+            
+            # Validators outlived their payload - fetch in full
+            response = self._request(url)
+            if response is None:
+                return None
+        
+        if response.status_code != 200:
+            return None
+        
+        items = extract(response)
+        self.http_cache.store(url, response, items)
+        return items
+    
+    def _fetch_feed(self, feed_url: str, company_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the posts of a feed that are newer than its watermark
+        
+        Args:
+            feed_url: RSS/Atom feed URL
+            company_name: Company name
+            
+        Returns:
+            List of new blog post data, or None if the request failed
+        """
+        key = f"feed:{feed_url}"
+        
+        def extract(response: requests.Response) -> List[Dict[str, Any]]:
+            if self.websub.enabled:
+                hub, topic = find_hub(response)
+                if hub:
+                    self.websub.track(feed_url, hub, topic, company_name)
+            return self._parse_feed(response.content, company_name, key)
+        
+        return self._fetch_cached(
+            feed_url,
+            extract,
+            revalidate=lambda blogs: self._take_unseen(
+                key, [(blog.get('published_at'), blog.get('url', ''), blog) for blog in blogs], first_run_limit=10
+            )
+        )
+    
+    def receive_feed_push(self, feed_url: str, company_name: str,
+                          content: bytes) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Turn a feed body pushed by a WebSub hub into blog post data
+        
+        Pushed entries go through the feed's watermark like polled ones, so
+        posts already fetched by a scheduled run are not delivered twice.
+        The push's new watermark is kept apart from the current run's, so
+        completing a run never commits it; pass it to commit_feed_push()
+        once the posts have been handled.
+        
+        Args:
+            feed_url: Polled feed URL of the subscription
+            company_name: Company name
+            content: Pushed feed body (the new entries, or the whole feed)
+            
+        Returns:
+            Tuple of (new blog post data, newest first; the feed's new
+            watermark, or None without new posts)
+        """
+        key = f"feed:{feed_url}"
+        held: Dict[str, Dict[str, Any]] = {}
+        blogs = self._parse_feed(content, company_name, key, held)
+        
+        if blogs and config.article_fetch_enabled:
+            self.article_fetcher.enrich(blogs)
+        
+        return blogs, held.get(key)
+    
+    def commit_feed_push(self, feed_url: str, watermark: Optional[Dict[str, Any]]) -> None:
+        """Advance a feed's watermark past the posts of a handled push"""
+        if watermark is not None:
+            self.watermarks.merge({f"feed:{feed_url}": watermark}, self._merge_watermark)
+    
+    def _parse_feed(self, content: bytes, company_name: str, watermark_key: str,
+                    held: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Parse RSS/Atom feed content into blog post data
+        
+        Only entries newer than the feed's watermark are turned into posts.
+        
+        Args:
+            content: Raw feed content
+            company_name: Company name
+            watermark_key: Watermark key of the feed
+            held: Collects the feed's new watermark instead of holding it
+                until complete_run()
+            
+        Returns:
+            List of new blog post data, newest first
+        """
         blogs = []
+        feed = feedparser.parse(content)
+        published = date_parser.parse_batch(
+            [entry.get('published', entry.get('updated', '')) for entry in feed.entries],
+            source=f"{company_name}:rss"
+        )
+        unseen = self._take_unseen(
+            watermark_key,
+            [(published_at, entry.get('link', entry.get('id', '')), (entry, published_at))
+             for entry, published_at in zip(feed.entries, published)],
+            first_run_limit=10,  # Last 10 posts
+            held=held
+        )
+        
+        for entry, published_at in unseen:
+            blog_data = {
+                'title': clean_text(entry.get('title', '')),
+                'url': entry.get('link', ''),
+                'content': clean_text(entry.get('summary', '')),
+                'company': company_name,
+                'published_at': published_at or datetime.now(),
+                'source': 'rss',
+                'content_hash': generate_content_hash(entry.get('title', '') + entry.get('summary', ''))
+            }
+            blogs.append(blog_data)
+        
+        return blogs
+    
+    def _scrape_blog_html(self, blog_url: str, company_name: str) -> List[Dict[str, Any]]:
+        """
+        Scrape blog posts from HTML when RSS is not available
+        
+        Sites with a sitemap only have their new or changed posts fetched;
+        otherwise the blog index page is scraped.
         
+        Args:
+            blog_url: Blog URL
+            company_name: Company name
+            
+        Returns:
+            List of blog post data
+        """
         try:
-            response = safe_request(blog_url)
-            if not response:
-                return blogs
+            if config.sitemap_enabled:
+                blogs = self._scrape_blog_sitemap(blog_url, company_name)
+                if blogs is not None:
+                    return blogs
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Common blog post selectors
-            selectors = [
-                'article',
-                '.post',
-                '.blog-post',
-                '.entry',
-                '[class*="post"]',
-                '[class*="blog"]'
-            ]
-            
-            for selector in selectors:
-                articles = soup.select(selector)
-                if articles:
-                    for article in articles[:10]:  # Last 10 posts
-                        try:
-                            title_elem = article.find(['h1', 'h2', 'h3', 'h4'])
-                            title = clean_text(title_elem.get_text()) if title_elem else ''
-                            
-                            link_elem = article.find('a')
-                            url = link_elem.get('href') if link_elem else ''
-                            if url and not url.startswith('http'):
-                                url = blog_url.rstrip('/') + '/' + url.lstrip('/')
-                            
-                            content_elem = article.find(['p', 'div'])
-                            content = clean_text(content_elem.get_text()) if content_elem else ''
-                            
-                            if title and url:
-                                blog_data = {
-                                    'title': title,
-                                    'url': url,
-                                    'content': content,
-                                    'company': company_name,
-                                    'published_at': datetime.now(),  # Fallback
-                                    'source': 'html',
-                                    'content_hash': generate_content_hash(title + content)
-                                }
-                                blogs.append(blog_data)
-                                
-                        except Exception as e:
-                            logger.debug(f"Error parsing article: {e}")
-                            continue
-                    
-                    break  # Use first working selector
-                    
+            return self._fetch_cached(
+                blog_url,
+                lambda response: self._extract_blog_articles(response.content, blog_url, company_name)
+            ) or []
         except Exception as e:
             logger.error(f"Error scraping HTML from {blog_url}: {e}")
+            return []
+    
+    def _scrape_blog_sitemap(self, blog_url: str, company_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the blog posts that are new or changed since the last sitemap snapshot
+        
+        On the first run the whole sitemap becomes the baseline and only the
+        10 most recently modified posts are fetched. Later runs fetch up to
+        SITEMAP_MAX_PAGES changed posts; the rest, and any that fail, stay
+        out of the snapshot so the next run picks them up. Sites found to
+        have no sitemap are not probed again until FEED_DISCOVERY_TTL_HOURS
+        have passed.
+        
+        Args:
+            blog_url: Blog URL; only sitemap pages under it count as posts
+            company_name: Company name
+            
+        Returns:
+            List of blog post data, or None if the site has no readable sitemap
+        """
+        record = self.sitemaps.get(blog_url) or {}
+        if record and not record.get('sitemap_url') and self._is_discovery_fresh(record):
+            return None
         
+        watcher = SitemapWatcher(self._stream_request)
+        prefix = blog_url.rstrip('/') + '/'
+        
+        if record.get('sitemap_url'):
+            candidates = [record['sitemap_url']]
+        else:
+            robots = self._request(urljoin(blog_url, '/robots.txt'))
+            candidates = sitemap_candidates(blog_url, robots.text if robots is not None else None)
+        
+        for sitemap_url in candidates:
+            result = watcher.changes(sitemap_url, prefix, record.get('snapshot', {}))
+            if result is not None:
+                break
+        else:
+            if record.get('sitemap_url'):
+                # The known sitemap failed: look for it afresh next run
+                self.sitemaps.delete(blog_url)
+            else:
+                self.sitemaps.set(blog_url, {'sitemap_url': None, 'checked_at': datetime.now()})
+            return None
+        
+        changed, snapshot = result
+        dated = sorted(
+            ((loc, date_parser.parse(lastmod, source=f"{company_name}:sitemap")) for loc, lastmod in changed),
+            key=lambda page: page[1] or datetime.min,
+            reverse=True
+        )
+        limit = config.sitemap_max_pages if 'snapshot' in record else 10
+        to_fetch, deferred = dated[:limit], dated[limit:] if 'snapshot' in record else []
+        
+        articles = self.article_fetcher.fetch([loc for loc, _ in to_fetch], refresh=True)
+        blogs = []
+        
+        for loc, lastmod in to_fetch:
+            article = articles.get(loc)
+            if not article or not article.get('title'):
+                deferred.append((loc, lastmod))
+                continue
+            
+            blogs.append({
+                'title': article['title'],
+                'url': loc,
+                'content': article.get('text', ''),
+                'company': company_name,
+                'published_at': lastmod or datetime.now(),
+                'source': 'sitemap',
+                'content_hash': generate_content_hash(article['title'] + article.get('text', ''))
+            })
+        
+        # Leave unfetched pages out of the snapshot so they count as changed next run,
+        # and forget their sitemap's lastmod so it is downloaded again even if unchanged
+        for loc, _ in deferred:
+            for entry in snapshot.values():
+                if loc in entry['pages']:
+                    del entry['pages'][loc]
+                    entry['lastmod'] = None
+        
+        self.sitemaps.set(blog_url, {'sitemap_url': sitemap_url, 'snapshot': snapshot, 'checked_at': datetime.now()})
+        logger.info(f"Sitemap {sitemap_url}: {len(changed)} new or changed posts, fetched {len(blogs)}")
         return blogs
     
+    def _request(self, url: str, conditional: bool = False) -> Optional[requests.Response]:
+        """safe_request through this fetcher's client and conditional-GET cache"""
+        return safe_request(url, conditional=conditional, client=self._client, cache=self._cache)
+    
+    def _stream_request(self, url: str) -> Optional[requests.Response]:
+        """GET a URL without reading the body up front, or None on failure"""
+        try:
+            return self.http_client.get(url, stream=True)
+        except requests.RequestException as e:
+            logger.debug(f"Request failed for {url}: {e}")
+            return None
+    
+    def _extract_blog_articles(self, content: bytes, blog_url: str, company_name: str) -> List[Dict[str, Any]]:
+        """
+        Extract blog posts from blog index HTML
+        
+        Args:
+            content: Raw HTML content
+            blog_url: Blog URL, used to resolve relative links
+            company_name: Company name
+            
+        Returns:
+            List of blog post data
+        """
+        blogs = []
+        articles, _ = self._extractor(BLOG_SELECTORS, BLOG_FIELDS).extract(content, limit=10)  # Last 10 posts
+        
+        for article in articles:
+            title = clean_text(article.get('title', ''))
+            content_text = clean_text(article.get('content', ''))
+            
+            url = article.get('link', '')
+            if url and not url.startswith('http'):
+                url = blog_url.rstrip('/') + '/' + url.lstrip('/')
+            
+            if title and url:
+                blog_data = {
+                    'title': title,
+                    'url': url,
+                    'content': content_text,
+                    'company': company_name,
+                    'published_at': datetime.now(),  # Fallback
+                    'source': 'html',
+                    'content_hash': generate_content_hash(title + content_text)
+                }
+                blogs.append(blog_data)
+        
+        return blogs
+    
+    def _extractor(self, selectors: List[str], fields: Dict[str, FieldRule]) -> SelectorSet:
+        """
+        Get the compiled selector set for an ordered selector list
+        
+        Compiled once and reused, so each competitor's learned selector order
+        is only translated to XPath on first use.
+        
+        Args:
+            selectors: CSS selectors, in the order to try them
+            fields: Fields to extract from each matched element
+            
+        Returns:
+            Compiled SelectorSet
+        """
+        key = (tuple(selectors), id(fields))
+        extractor = self._extractors.get(key)
+        
+        if extractor is None:
+            extractor = SelectorSet(selectors, fields)
+            self._extractors[key] = extractor
+        
+        return extractor
+    
     def fetch_tweets(self, competitor_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Fetch recent tweets from competitor Twitter handle
+        Fetch new tweets from competitor Twitter handle
+        
+        Uses the cached user ID and only asks for tweets newer than the
+        handle's since_id watermark from the previous completed run,
+        following next_token for up to TWITTER_MAX_PAGES pages. The new
+        since_id is held until complete_run().
         
         Args:
             competitor_config: Competitor configuration
@@ -232,44 +1083,117 @@ class DataFetcher:
         if not twitter_handle or not config.twitter_bearer_token:
             return tweets
         
+        handle_key = twitter_handle.lower()
+        
         try:
-            # Using Twitter API v2
-            from twitter.twitter_client import TwitterClient
-            
-            client = TwitterClient(config.twitter_bearer_token)
-            
-            # Get user ID first
-            user = client.get_user_by_username(twitter_handle)
-            if not user:
+            user_id = self.resolve_twitter_users([twitter_handle]).get(handle_key)
+            if not user_id:
                 return tweets
             
-            user_id = user['data']['id']
-            
-            # Get recent tweets
-            tweet_data = client.get_users_tweets(
-                user_id,
-                max_results=20,
-                tweet_fields=['created_at', 'public_metrics']
-            )
+            since_id = self.twitter_since_ids.get(handle_key)
+            params = {
+                # First poll takes the latest 20, later polls catch up on everything new
+                'max_results': 100 if since_id else 20,
+                'tweet.fields': 'created_at,public_metrics'
+            }
+            if since_id:
+                params['since_id'] = since_id
             
-            if tweet_data and 'data' in tweet_data:
-                for tweet in tweet_data['data']:
+            newest_id = None
+            pages = max(1, config.twitter_max_pages) if since_id else 1
+            for page in range(pages):
+                tweet_data = self._twitter_get(f"/users/{user_id}/tweets", params)
+                if tweet_data is None:
+                    # Deliver nothing and keep since_id, so the next run asks for the whole delta again
+                    return []
+                
+                for tweet in tweet_data.get('data', []):
                     tweet_info = {
                         'tweet_id': tweet['id'],
                         'text': clean_text(tweet['text']),
                         'company': competitor_config['name'],
-                        'created_at': self._parse_date(tweet['created_at']),
+                        'created_at': self._parse_date(tweet['created_at'], source='twitter'),
                         'metrics': tweet.get('public_metrics', {}),
                         'source': 'twitter_api',
                         'content_hash': generate_content_hash(tweet['text'])
                     }
                     tweets.append(tweet_info)
+                
+                meta = tweet_data.get('meta', {})
+                # Pages run newest first, so the first page has the newest ID
+                newest_id = newest_id or meta.get('newest_id')
+                if not meta.get('next_token'):
+                    break
+                if page == pages - 1:
+                    if since_id:
+                        logger.warning(f"Stopped at {pages} pages of new tweets for {twitter_handle}")
+                    break
+                params['pagination_token'] = meta['next_token']
+            
+            if newest_id:
+                self._hold_since_id(handle_key, newest_id)
                     
         except Exception as e:
             logger.error(f"Error fetching tweets for {twitter_handle}: {e}")
         
         return tweets
     
+    def resolve_twitter_users(self, handles: List[str]) -> Dict[str, str]:
+        """
+        Map Twitter handles to user IDs, looking up uncached ones in batches
+        
+        Args:
+            handles: Twitter handles (without @)
+            
+        Returns:
+            Dictionary of lowercased handle to user ID for every handle resolved
+        """
+        handle_keys = sorted({handle.lower() for handle in handles if handle})
+        user_ids = {key: self.twitter_users.get(key) for key in handle_keys if self.twitter_users.get(key)}
+        missing = [key for key in handle_keys if key not in user_ids]
+        
+        if not missing or not config.twitter_bearer_token:
+            return user_ids
+        
+        for start in range(0, len(missing), TWITTER_USERS_PER_LOOKUP):
+            batch = missing[start:start + TWITTER_USERS_PER_LOOKUP]
+            response = self._twitter_get("/users/by", {'usernames': ','.join(batch)})
+            
+            found = {user['username'].lower(): user['id'] for user in (response or {}).get('data', [])}
+            if found:
+                self.twitter_users.update(found)
+                user_ids.update(found)
+            
+            for handle in set(batch) - set(found):
+                logger.warning(f"Twitter handle not found: {handle}")
+        
+        return user_ids
+    
+    def _twitter_get(self, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Call a Twitter API v2 endpoint through the shared HTTP client
+        
+        Args:
+            path: Endpoint path under /2
+            params: Query parameters
+            
+        Returns:
+            Decoded JSON response or None if the request failed
+        """
+        try:
+            response = self.http_client.get(
+                f"{TWITTER_API_URL}{path}",
+                headers={'Authorization': f"Bearer {config.twitter_bearer_token}"},
+                params=params
+            )
+            if response.status_code != 200:
+                logger.warning(f"Twitter API {path} returned {response.status_code}")
+                return None
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Twitter API request failed for {path}: {e}")
+            return None
+    
     def fetch_linkedin_posts(self, competitor_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Fetch recent LinkedIn posts from competitor company page
@@ -304,188 +1228,409 @@ class DataFetcher:
         """
         Fetch job postings from competitor careers page
         
+        Reuses the job board adapter that worked on an earlier run and only
+        re-probes the candidates (Greenhouse, Lever, Ashby, HTML) when it
+        fails. Every open posting is returned, flagged against the board's
+        snapshot from the last completed run.
+        
         Args:
             competitor_config: Competitor configuration
             
         Returns:
-            List of job posting data
+            List of job posting data, each with 'is_new' and 'is_updated'
         """
-        jobs = []
         careers_url = competitor_config.get('careers_url')
         
         if not careers_url:
-            return jobs
+            return []
         
         try:
-            # Try different job board formats
-            job_sources = [
-                f"{careers_url}/jobs.json",  # Greenhouse format
-                f"{careers_url}/api/jobs",   # Lever format
-                careers_url  # HTML fallback
-            ]
-            
-            for job_source in job_sources:
-                try:
-                    if job_source.endswith('.json'):
-                        jobs.extend(self._fetch_json_jobs(job_source, competitor_config['name']))
-                    else:
-                        jobs.extend(self._scrape_jobs_html(job_source, competitor_config['name']))
-                    
-                    if jobs:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Job source failed {job_source}: {e}")
-                    continue
+            record = self.job_adapters.get(careers_url)
+            
+            if record:
+                learned = {}
+                jobs = self._run_job_adapter(record['adapter'], record['url'], competitor_config,
+                                             record.get('selector'), learned, record.get('page_size'))
+                if jobs is not None:
+                    if learned.get('page_size', record.get('page_size')) != record.get('page_size'):
+                        self.job_adapters.set(careers_url, {**record, 'page_size': learned['page_size']})
+                    return self._diff_job_snapshot(careers_url, jobs)
+                
+                logger.info(f"Job adapter {record['adapter']} failed for {careers_url}, re-probing")
+                self.job_adapters.delete(careers_url)
+            
+            for adapter, url in self._job_adapter_candidates(competitor_config):
+                learned = {}
+                jobs = self._run_job_adapter(adapter, url, competitor_config, learned=learned)
+                
+                if jobs is not None:
+                    self.job_adapters.set(careers_url, {
+                        'adapter': adapter,
+                        'url': url,
+                        'selector': learned.get('selector'),
+                        'page_size': learned.get('page_size'),
+                        'resolved_at': datetime.now()
+                    })
+                    logger.info(f"Resolved job adapter for {careers_url}: {adapter}")
+                    return self._diff_job_snapshot(careers_url, jobs)
                     
         except Exception as e:
             logger.error(f"Error fetching jobs from {careers_url}: {e}")
         
+        return []
+    
+    def _diff_job_snapshot(self, careers_url: str, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Flag each posting as new, updated or unchanged since the last run
+        
+        The board's snapshot maps posting IDs to content hashes. Before a
+        board has one, only postings from the last WATERMARK_INITIAL_DAYS
+        count as new. The new snapshot is held until complete_run().
+        
+        Args:
+            careers_url: Careers URL the snapshot is kept under
+            jobs: Every open posting on the board
+            
+        Returns:
+            The same postings, updated in place
+        """
+        snapshot = self.job_snapshots.get(careers_url)
+        known = snapshot['jobs'] if snapshot else {}
+        current = {}
+        
+        for job in jobs:
+            job_id = job.get('job_id') or job.get('url') or job['content_hash']
+            current[job_id] = job['content_hash']
+            
+            if snapshot is None:
+                job['is_new'] = is_recent_content(job.get('posted_at'), days=config.watermark_initial_days)
+            else:
+                job['is_new'] = job_id not in known
+            job['is_updated'] = job_id in known and known[job_id] != job['content_hash']
+        
+        closed = len(known.keys() - current.keys())
+        logger.info(f"{careers_url}: {len(current)} open jobs, "
+                    f"{sum(job['is_new'] for job in jobs)} new, {closed} closed since last run")
+        
+        self._hold_job_snapshot(careers_url, {'jobs': current, 'synced_at': datetime.now()})
+        
         return jobs
     
-    def _fetch_json_jobs(self, json_url: str, company_name: str) -> List[Dict[str, Any]]:
+    def _job_adapter_candidates(self, competitor_config: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        List job board adapters to probe, in order
+        
+        Board tokens in the competitor config (greenhouse_board, lever_company,
+        ashby_board) select the public board APIs; otherwise the careers URL
+        is probed for the same formats.
+        
+        Args:
+            competitor_config: Competitor configuration
+            
+        Returns:
+            List of (adapter name, URL) pairs
+        """
+        careers_url = competitor_config['careers_url'].rstrip('/')
+        candidates = []
+        
+        if competitor_config.get('greenhouse_board'):
+            candidates.append(('greenhouse', f"https://boards-api.greenhouse.io/v1/boards/{competitor_config['greenhouse_board']}/jobs"))
+        else:
+            candidates.append(('greenhouse', f"{careers_url}/jobs.json"))
+        
+        if competitor_config.get('lever_company'):
+            candidates.append(('lever', f"https://api.lever.co/v0/postings/{competitor_config['lever_company']}?mode=json"))
+        else:
+            candidates.append(('lever', f"{careers_url}/api/jobs"))
+        
+        if competitor_config.get('ashby_board'):
+            candidates.append(('ashby', f"https://api.ashbyhq.com/posting-api/job-board/{competitor_config['ashby_board']}"))
+        
+        candidates.append(('html', competitor_config['careers_url']))
+        return candidates
+    
+    def _run_job_adapter(self, adapter: str, url: str, competitor_config: Dict[str, Any],
+                         selector: Optional[str] = None, learned: Optional[Dict[str, Any]] = None,
+                         page_size: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch jobs with a single job board adapter
+        
+        Args:
+            adapter: Adapter name (greenhouse, lever, ashby or html)
+            url: Board URL for the adapter
+            competitor_config: Competitor configuration
+            selector: Learned CSS selector for the html adapter
+            learned: Optional dict receiving the selector the html adapter matched,
+                or the page size a paginated board turned out to cap pages at
+            page_size: Learned page size of the board
+            
+        Returns:
+            List of job data, or None if the adapter does not work for this board
+        """
+        company_name = competitor_config['name']
+        
+        try:
+            if adapter == 'html':
+                jobs = self._scrape_jobs_html(url, company_name, selector, learned)
+                return jobs or None
+            
+            # An explicit per-board page size wins over the learned one
+            page_size = competitor_config.get('job_page_size') or page_size
+            return self._fetch_json_jobs(url, company_name, adapter, page_size, learned)
+            
+        except Exception as e:
+            logger.debug(f"Job adapter {adapter} failed for {url}: {e}")
+            return None
+    
+    def _fetch_json_jobs(self, json_url: str, company_name: str, adapter: str = 'ashby',
+                         page_size: Optional[int] = None,
+                         learned: Optional[Dict[str, Any]] = None) -> Optional[List[Dict[str, Any]]]:
         """
-        Fetch jobs from JSON API (Greenhouse, Lever, etc.)
+        Fetch every posting from a JSON job board API (Greenhouse, Lever, Ashby)
+        
+        Paginated boards are read a window of JOB_PAGE_CONCURRENCY pages at a
+        time until a short page, a page of already-seen postings or the
+        reported total ends the listing. A board that returns fewer postings
+        than asked for caps its pages; that size is used for the remaining
+        pages and reported through learned.
         
         Args:
             json_url: JSON API URL
             company_name: Company name
+            adapter: Adapter name, selecting the pagination parameters
+            page_size: Postings to ask for per page, defaults to config.job_page_size
+            learned: Optional dict receiving the board's page size cap
             
         Returns:
-            List of job data
+            List of job data, or None if a page failed or the payload is not
+            a job board
         """
-        jobs = []
+        pagination = JOB_PAGINATION.get(adapter)
+        if pagination is None:
+            page = self._fetch_job_page(json_url, company_name)
+            return page['jobs'] if page is not None else None
+        
+        page_size = page_size or config.job_page_size
+        page = self._fetch_job_page(self._job_page_url(json_url, pagination, 0, page_size), company_name)
+        if page is None:
+            return None
+        
+        jobs = {job['job_id']: job for job in page['jobs']}
+        total = page['total']
+        
+        if 0 < len(page['jobs']) < page_size and (total is None or len(jobs) < total):
+            # Either the whole board or a server-side cap - follow up at the size actually served
+            page_size = len(page['jobs'])
+            capped = True
+        else:
+            capped = False
+        
+        done = not page['jobs'] or len(page['jobs']) < page_size or (total is not None and len(jobs) >= total)
+        last_page = config.job_max_pages if total is None else min(config.job_max_pages, -(-total // page_size))
+        index = 1
+        
+        with ThreadPoolExecutor(max_workers=max(1, config.job_page_concurrency)) as executor:
+            while not done and index < last_page:
+                # A short first page is confirmed as a cap with one request before fanning out
+                width = 1 if capped and index == 1 else max(1, config.job_page_concurrency)
+                window = range(index, min(index + width, last_page))
+                # Copy the caller's context so its time budget applies to the pages
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._fetch_job_page,
+                                    self._job_page_url(json_url, pagination, i, page_size), company_name)
+                    for i in window
+                ]
+                
+                for future in futures:
+                    page = future.result()
+                    if page is None:
+                        return None
+                    
+                    unseen = [job for job in page['jobs'] if job['job_id'] not in jobs]
+                    jobs.update((job['job_id'], job) for job in unseen)
+                    
+                    # Boards that ignore the paging parameters repeat the first page
+                    if not unseen or len(page['jobs']) < page_size or (total is not None and len(jobs) >= total):
+                        done = True
+                        break
+                    
+                    if capped and learned is not None:
+                        learned['page_size'] = page_size
+                
+                index = window.stop
+        
+        if not done and index >= config.job_max_pages:
+            logger.warning(f"Stopped paging {json_url} after {config.job_max_pages} pages")
+        
+        return list(jobs.values())
+    
+    @staticmethod
+    def _job_page_url(json_url: str, pagination: Tuple[str, str, bool], index: int, page_size: int) -> str:
+        """URL of the page at a 0-based index of a paginated job board"""
+        page_param, size_param, offset_based = pagination
+        parsed = urlparse(json_url)
+        query = parse_qsl(parsed.query, keep_blank_values=True) + [
+            (page_param, index * page_size if offset_based else index + 1),
+            (size_param, page_size)
+        ]
+        return urlunparse(parsed._replace(query=urlencode(query)))
+    
+    def _fetch_job_page(self, url: str, company_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of a JSON job board
         
+        Returns:
+            {'jobs': [...], 'total': reported posting count or None}, or None
+            if the request failed or the payload is not a job board
+        """
         try:
-            response = safe_request(json_url)
-            if not response:
-                return jobs
+            return self._fetch_cached(url, lambda response: self._extract_json_jobs(response.json(), company_name))
+        except Exception as e:
+            logger.debug(f"Error parsing JSON jobs from {url}: {e}")
+            return None
+    
+    def _extract_json_jobs(self, data: Any, company_name: str) -> Dict[str, Any]:
+        """
+        Extract job data from a job board JSON payload
+        
+        Args:
+            data: Decoded JSON payload
+            company_name: Company name
             
-            data = response.json()
+        Returns:
+            {'jobs': [...], 'total': posting count the board reports, or None}
             
-            # Handle different JSON formats
+        Raises:
+            ValueError: If the payload is not a recognised job board format
+        """
+        jobs = []
+        total = None
+        
+        # Handle different JSON formats - Lever returns a bare list of postings
+        if isinstance(data, list):
+            job_list = data
+        elif isinstance(data, dict) and any(key in data for key in ('jobs', 'positions', 'openings')):
             job_list = data.get('jobs', data.get('positions', data.get('openings', [])))
+            total = (data.get('meta') or {}).get('total', data.get('total'))
+        else:
+            raise ValueError("Unrecognised job board payload")
+        
+        for job in job_list:
+            location = job.get('location', '')
+            if isinstance(location, dict):
+                location = location.get('name', '')
+            if not location:
+                location = job.get('categories', {}).get('location', '')
             
-            for job in job_list[:20]:  # Last 20 jobs
-                job_data = {
-                    'role': clean_text(job.get('title', job.get('name', ''))),
-                    'company': company_name,
-                    'location': clean_text(job.get('location', {}).get('name', job.get('location', ''))),
-                    'posted_at': self._parse_date(job.get('updated_at', job.get('created_at', ''))),
-                    'url': job.get('absolute_url', job.get('url', '')),
-                    'source': 'json_api',
-                    'content_hash': generate_content_hash(job.get('title', '') + job.get('content', ''))
-                }
-                jobs.append(job_data)
-                
-        except Exception as e:
-            logger.error(f"Error parsing JSON jobs from {json_url}: {e}")
+            title = job.get('title', job.get('text', job.get('name', '')))
+            url = self._job_url(job)
+            
+            job_data = {
+                'job_id': str(job.get('id') or url or title),
+                'role': clean_text(title),
+                'company': company_name,
+                'location': clean_text(location),
+                'posted_at': self._job_timestamp(job, company_name) or datetime.now(),
+                'url': url,
+                'source': 'json_api',
+                'content_hash': generate_content_hash(title + location + job.get('content', job.get('descriptionPlain', '')))
+            }
+            jobs.append(job_data)
         
-        return jobs
+        return {'jobs': jobs, 'total': total if isinstance(total, int) else None}
     
-    def _scrape_jobs_html(self, careers_url: str, company_name: str) -> List[Dict[str, Any]]:
+    def _job_timestamp(self, job: Dict[str, Any], company_name: str) -> Optional[datetime]:
+        """When a job board posting was last updated, or None if it has no usable date"""
+        posted_at = job.get('updated_at', job.get('created_at', job.get('publishedAt', job.get('createdAt', ''))))
+        if isinstance(posted_at, (int, float)):
+            # Lever timestamps are epoch milliseconds
+            return datetime.fromtimestamp(posted_at / 1000)
+        return date_parser.parse(posted_at, source=f"{company_name}:jobs")
+    
+    @staticmethod
+    def _job_url(job: Dict[str, Any]) -> str:
+        """Public URL of a job board posting"""
+        return job.get('absolute_url', job.get('hostedUrl', job.get('jobUrl', job.get('url', ''))))
+    
+    def _scrape_jobs_html(self, careers_url: str, company_name: str, selector: Optional[str] = None,
+                          learned: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Scrape job postings from HTML careers page
         
         Args:
             careers_url: Careers page URL
             company_name: Company name
+            selector: Learned CSS selector to try before the common ones
+            learned: Optional dict receiving the selector that matched
             
         Returns:
             List of job data
         """
-        jobs = []
+        selectors = ([selector] if selector else []) + [s for s in JOB_SELECTORS if s != selector]
+        
+        def extract(response: requests.Response) -> List[Dict[str, Any]]:
+            jobs, matched = self._extract_html_jobs(response.content, careers_url, company_name, selectors)
+            if learned is not None:
+                learned['selector'] = matched
+            return jobs
         
         try:
-            response = safe_request(careers_url)
-            if not response:
-                return jobs
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Common job posting selectors
-            selectors = [
-                '.job',
-                '.position',
-                '.opening',
-                '[class*="job"]',
-                '[class*="position"]'
-            ]
-            
-            for selector in selectors:
-                job_elements = soup.select(selector)
-                if job_elements:
-                    for job_elem in job_elements[:20]:  # Last 20 jobs
-                        try:
-                            title_elem = job_elem.find(['h1', 'h2', 'h3', 'h4'])
-                            title = clean_text(title_elem.get_text()) if title_elem else ''
-                            
-                            location_elem = job_elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
-                            location = clean_text(location_elem.get_text()) if location_elem else ''
-                            
-                            link_elem = job_elem.find('a')
-                            url = link_elem.get('href') if link_elem else ''
-                            if url and not url.startswith('http'):
-                                url = careers_url.rstrip('/') + '/' + url.lstrip('/')
-                            
-                            if title:
-                                job_data = {
-                                    'role': title,
-                                    'company': company_name,
-                                    'location': location,
-                                    'posted_at': datetime.now(),  # Fallback
-                                    'url': url,
-                                    'source': 'html',
-                                    'content_hash': generate_content_hash(title + location)
-                                }
-                                jobs.append(job_data)
-                                
-                        except Exception as e:
-                            logger.debug(f"Error parsing job element: {e}")
-                            continue
-                    
-                    break  # Use first working selector
-                    
+            return self._fetch_cached(careers_url, extract) or []
         except Exception as e:
             logger.error(f"Error scraping HTML jobs from {careers_url}: {e}")
-        
-        return jobs
+            return []
     
-    def _parse_date(self, date_string: str) -> datetime:
+    def _extract_html_jobs(self, content: bytes, careers_url: str, company_name: str,
+                           selectors: List[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
-        Parse date string to datetime object
+        Extract job postings from careers page HTML
         
         Args:
-            date_string: Date string to parse
+            content: Raw HTML content
+            careers_url: Careers page URL, used to resolve relative links
+            company_name: Company name
+            selectors: CSS selectors to try, in order
             
         Returns:
-            Parsed datetime or current time as fallback
+            Tuple of (list of job data, selector that matched or None)
         """
-        if not date_string:
-            return datetime.now()
+        jobs = []
+        job_elements, matched = self._extractor(selectors, JOB_FIELDS).extract(content)
         
-        try:
-            # Try common date formats
-            formats = [
-                '%Y-%m-%dT%H:%M:%S.%fZ',
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d',
-                '%d/%m/%Y',
-                '%m/%d/%Y'
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_string, fmt)
-                except ValueError:
-                    continue
+        for job_elem in job_elements:
+            title = clean_text(job_elem.get('title', ''))
+            location = clean_text(job_elem.get('location', ''))
             
-            # Fallback to current time
-            return datetime.now()
+            url = job_elem.get('link', '')
+            if url and not url.startswith('http'):
+                url = careers_url.rstrip('/') + '/' + url.lstrip('/')
             
-        except Exception:
-            return datetime.now()
+            if title:
+                job_data = {
+                    'role': title,
+                    'company': company_name,
+                    'location': location,
+                    'posted_at': datetime.now(),  # Fallback
+                    'url': url,
+                    'source': 'html',
+                    'content_hash': generate_content_hash(title + location)
+                }
+                jobs.append(job_data)
+        
+        return jobs, matched
+    
+    def _parse_date(self, date_string: str, source: Optional[str] = None) -> datetime:
+        """
+        Parse date string to datetime object
+        
+        Args:
+            date_string: Date string to parse (ISO 8601, RFC 822, ...)
+            source: Source key whose date format is learned and tried first
+            
+        Returns:
+            Parsed datetime or current time as fallback
+        """
+        return date_parser.parse(date_string, source) or datetime.now()
 
 
 def main():
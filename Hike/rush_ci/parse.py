@@ -5,31 +5,214 @@ Processes raw fetched data and extracts key insights using NLP and keyword analy
 """
 
 import re
-import spacy
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Tuple
 from collections import defaultdict
 
 from .config import config
 from .utils.logger import get_logger
-from .utils.helpers import clean_text, extract_keywords, is_recent_content
+from .utils.helpers import clean_text, is_recent_content
+from .utils.keyword_matcher import KeywordMatcher
+from .utils.alert_rules import AlertRuleEngine
 
 logger = get_logger(__name__)
 
-# Load spaCy model for NLP processing
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-    nlp = None
+# spaCy model for NLP processing, loaded by get_nlp() on first use
+SPACY_MODEL = "en_core_web_sm"
+
+# Keywords only need POS tags (tok2vec/tagger/attribute_ruler) and entities the
+# ner pipe; the dependency parser and lemmatizer are never loaded
+SPACY_EXCLUDED_PIPES = ["parser", "senter", "lemmatizer"]
+
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+# Source type -> parse method for that source's items
+SOURCE_PARSERS = {
+    'blogs': 'parse_blogs',
+    'tweets': 'parse_tweets',
+    'linkedin': 'parse_linkedin_posts',
+    'jobs': 'parse_jobs'
+}
+
+# Keyword heuristics, matched as whole words; a trailing "*" also matches
+# longer words ("launch*" -> "launched", "launches")
+PRODUCT_KEYWORDS = [
+    'launch*', 'update*', 'feature*', 'release*', 'beta', 'new', 'improved',
+    'enhanced', 'upgraded', 'version*', 'app', 'apps', 'game*', 'platform*'
+]
+
+TEXT_KEYWORDS = {
+    'sentiment:positive': ['launch*', 'success*', 'growth', 'partnership*', 'innovation*', 'win', 'wins', 'winner*', 'winning'],
+    'sentiment:negative': ['down', 'loss', 'losses', 'failure*', 'problem*', 'issue*', 'challenge*'],
+    'mentions:product': PRODUCT_KEYWORDS,
+    'mentions:funding': ['funding', 'series', 'seed', 'investment*', 'raise*', 'backed'],
+    'mentions:partnership': ['partnership*', 'collaboration*', 'tie-up*', 'alliance*', 'joint'],
+    'movement:funding': ['funding', 'series', 'raise*'],
+    'movement:launch': ['launch*', 'new feature*', 'release*']
+}
+
+# Job role keywords; the first department / seniority level with a hit wins
+DEPARTMENT_KEYWORDS = {
+    'engineering': ['engineer*', 'developer*', 'programmer*', 'tech*'],
+    'marketing': ['marketing', 'growth', 'brand*', 'pr'],
+    'sales': ['sales', 'business development', 'bd'],
+    'product': ['product*', 'pm'],
+    'design': ['design*', 'ux', 'ui', 'creative'],
+    'operations': ['operations', 'ops', 'strategy'],
+    'finance': ['finance', 'accounting', 'cfo'],
+    'hr': ['hr', 'recruit*', 'talent', 'people']
+}
+
+SENIORITY_KEYWORDS = {
+    'intern': ['intern', 'interns', 'internship*'],
+    'junior': ['junior', 'entry', 'entry-level', 'associate'],
+    'senior': ['senior', 'lead', 'principal'],
+    'manager': ['manager', 'director', 'head'],
+    'executive': ['vp', 'vice president', 'chief', 'c-level']
+}
+
+JOB_ALERT_KEYWORDS = {
+    'high': ['vp', 'vice president', 'chief', 'c-level', 'head'],
+    'medium': ['director', 'manager', 'lead']
+}
+
+LOCATION_KEYWORDS = {
+    'remote': ['remote', 'work from home', 'wfh'],
+    'international': ['us', 'usa', 'united states', 'uk', 'europe', 'singapore', 'dubai']
+}
+
+# Every list above in one automaton, so a text is scanned once for all of them
+KEYWORD_MATCHER = KeywordMatcher({
+    **TEXT_KEYWORDS,
+    **{f"department:{name}": keywords for name, keywords in DEPARTMENT_KEYWORDS.items()},
+    **{f"seniority:{name}": keywords for name, keywords in SENIORITY_KEYWORDS.items()},
+    **{f"job_alert:{name}": keywords for name, keywords in JOB_ALERT_KEYWORDS.items()},
+    **{f"location:{name}": keywords for name, keywords in LOCATION_KEYWORDS.items()}
+})
+
+
+def get_nlp():
+    """
+    Get the process-wide spaCy pipeline, loading it on first use
+    
+    Entry points that never parse (alerts, config checks, web workers)
+    never import spaCy or load the model.
+    
+    Returns:
+        spacy.language.Language, or None if the model is not installed
+    """
+    global _nlp, _nlp_loaded
+    
+    if _nlp_loaded:
+        return _nlp
+    
+    with _nlp_lock:
+        if not _nlp_loaded:
+            import spacy
+            
+            try:
+                _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_PIPES)
+                logger.info(f"Loaded spaCy model {SPACY_MODEL} with pipes: {', '.join(_nlp.pipe_names)}")
+            except OSError:
+                logger.warning(f"spaCy model not found. Install with: python -m spacy download {SPACY_MODEL}")
+                _nlp = None
+            _nlp_loaded = True
+    
+    return _nlp
+
+
+class ItemAnalysis:
+    """
+    Text of one item and everything derived from it, computed at most once
+    
+    The parse methods build one per item and every extractor reads from
+    it; the alert stage and the summaries are handed the same objects, so
+    keywords and alert levels are not derived twice.
+    """
+    
+    def __init__(self, text: str, doc=None):
+        """
+        Args:
+            text: The item's analysed text (e.g. title and content of a blog post)
+            doc: spaCy Doc of the text, if it was already processed in a batch
+        """
+        self.text = text or ''
+        self.lower = self.text.lower()
+        self._doc = doc
+        self._words: Optional[List[str]] = None
+        self._keywords: Optional[List[str]] = None
+        self._entities: Optional[Dict[str, List[str]]] = None
+        self._keyword_hits: Optional[Dict[str, List[str]]] = None
+        
+        # Set by DataParser._determine_alert_level
+        self.alert_rules: Optional[List[str]] = None
+        self.alert_level: Optional[str] = None
+    
+    @property
+    def doc(self):
+        """spaCy Doc of the text, or None without text or a model"""
+        if self._doc is None and self.text:
+            nlp = get_nlp()
+            if nlp:
+                self._doc = nlp(self.text)
+        return self._doc
+    
+    @property
+    def words(self) -> List[str]:
+        """Lowercased words of the text, in order"""
+        if self._words is None:
+            self._words = re.findall(r'\b\w+\b', self.lower)
+        return self._words
+    
+    @property
+    def keyword_hits(self) -> Dict[str, List[str]]:
+        """KEYWORD_MATCHER category -> heuristic keywords found in the text"""
+        if self._keyword_hits is None:
+            self._keyword_hits = KEYWORD_MATCHER.matches(self.lower)
+        return self._keyword_hits
+    
+    @property
+    def keywords(self) -> List[str]:
+        """
+        Lowercased nouns, verbs and adjectives, first 10 distinct; plain words without a model
+        
+        Tags come from the same original-case Doc as the entities, rather than
+        from a second pass over lowercased text, so capitalised names tagged
+        PROPN (e.g. "Rummy Circle") are not keywords while "rummy" is.
+        """
+        if self._keywords is None:
+            doc = self.doc
+            if doc is not None:
+                keywords = [
+                    token.lower_ for token in doc
+                    if token.pos_ in ['NOUN', 'VERB', 'ADJ'] and not token.is_stop and len(token.text) > 3
+                ]
+                self._keywords = list(dict.fromkeys(keywords))[:10]  # Top 10 keywords
+            else:
+                # Fallback to simple keyword extraction
+                self._keywords = [word for word in self.words if len(word) > 3][:10]
+        return self._keywords
+    
+    @property
+    def entities(self) -> Dict[str, List[str]]:
+        """Named entities by label; empty without a model"""
+        if self._entities is None:
+            entities = defaultdict(list)
+            doc = self.doc
+            for ent in (doc.ents if doc is not None else []):
+                entities[ent.label_].append(ent.text)
+            self._entities = dict(entities)
+        return self._entities
 
 
 class DataParser:
     """Main data parsing class for competitor intelligence"""
     
     def __init__(self):
-        self.alert_keywords = self._extract_alert_keywords()
-        self.product_keywords = self._extract_product_keywords()
+        self.alert_rules = AlertRuleEngine()
         
     def parse_all_data(self, raw_data: Dict[str, List[Dict]]) -> Dict[str, Any]:
         """
@@ -38,6 +221,27 @@ class DataParser:
         Args:
             raw_data: Raw data from fetch module
             
+        Returns:
+            Parsed data with insights and alerts
+        """
+        return self.parse_stream(
+            (source_type, raw_data.get(source_type, [])) for source_type in SOURCE_PARSERS
+        )
+    
+    def parse_stream(self, batches: Iterable[Tuple[str, List[Dict]]],
+                     raw_data: Optional[Dict[str, List[Dict]]] = None) -> Dict[str, Any]:
+        """
+        Parse raw data batch by batch as it arrives
+        
+        Each (source_type, items) batch is parsed and merged into the
+        insights as soon as it is pulled from the iterator, so parsing
+        overlaps with fetches still in flight. Summaries and trends need
+        every source and are built once the iterator is exhausted.
+        
+        Args:
+            batches: (source_type, items) tuples, e.g. from DataFetcher.iter_sources()
+            raw_data: Optional dict that collects the raw items by source type
+            
         Returns:
             Parsed data with insights and alerts
         """
@@ -49,45 +253,53 @@ class DataParser:
             'summaries': {},
             'trends': {}
         }
+        # Item text -> its analysis, reused by the summaries and trends
+        item_analyses: Dict[str, ItemAnalysis] = {}
         
-        # Parse each data type
-        if raw_data.get('blogs'):
-            parsed_data['insights']['blogs'] = self.parse_blogs(raw_data['blogs'])
-        
-        if raw_data.get('tweets'):
-            parsed_data['insights']['tweets'] = self.parse_tweets(raw_data['tweets'])
-        
-        if raw_data.get('linkedin'):
-            parsed_data['insights']['linkedin'] = self.parse_linkedin_posts(raw_data['linkedin'])
-        
-        if raw_data.get('jobs'):
-            parsed_data['insights']['jobs'] = self.parse_jobs(raw_data['jobs'])
+        for source_type, items in batches:
+            if raw_data is not None:
+                raw_data.setdefault(source_type, []).extend(items)
+            
+            if not items or source_type not in SOURCE_PARSERS:
+                continue
+            
+            analyses = self.analyze_items(source_type, items)
+            item_analyses.update((analysis.text, analysis) for analysis in analyses)
+            parsed = getattr(self, SOURCE_PARSERS[source_type])(items, analyses)
+            source_insights = parsed_data['insights'].setdefault(source_type, {})
+            for company, company_items in parsed.items():
+                source_insights.setdefault(company, []).extend(company_items)
+            
+            parsed_data['alerts'].extend(self.generate_alerts({source_type: items}, {source_type: analyses}))
         
-        # Generate alerts
-        parsed_data['alerts'] = self.generate_alerts(raw_data)
+        # Batches arrive in completion order, so sort alerts once at the end
+        parsed_data['alerts'].sort(key=lambda x: self._get_alert_priority(x['level']), reverse=True)
         
         # Generate company summaries
-        parsed_data['summaries'] = self.generate_company_summaries(parsed_data['insights'])
+        parsed_data['summaries'] = self.generate_company_summaries(parsed_data['insights'], item_analyses)
         
         # Analyze trends
-        parsed_data['trends'] = self.analyze_trends(parsed_data['insights'])
+        parsed_data['trends'] = self.analyze_trends(parsed_data['insights'], item_analyses)
         
         logger.info("Data parsing completed")
         return parsed_data
     
-    def parse_blogs(self, blogs: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
+    def parse_blogs(self, blogs: List[Dict[str, Any]],
+                    analyses: Optional[List[ItemAnalysis]] = None) -> Dict[str, List[Dict]]:
         """
         Parse blog posts and extract insights
         
         Args:
             blogs: List of blog post data
+            analyses: Per-item analyses from analyze_items(), built here if not given
             
         Returns:
             Parsed blog insights by company
         """
         parsed_blogs = defaultdict(list)
+        analyses = analyses if analyses is not None else self.analyze_items('blogs', blogs)
         
-        for blog in blogs:
+        for blog, analysis in zip(blogs, analyses):
             company = blog.get('company', 'Unknown')
             
             # Extract key information
@@ -97,32 +309,35 @@ class DataParser:
                 'content': blog.get('content', ''),
                 'published_at': blog.get('published_at'),
                 'source': blog.get('source', ''),
-                'keywords': self._extract_keywords_from_text(blog.get('title', '') + ' ' + blog.get('content', '')),
-                'entities': self._extract_entities(blog.get('title', '') + ' ' + blog.get('content', '')),
-                'sentiment': self._analyze_sentiment(blog.get('title', '') + ' ' + blog.get('content', '')),
-                'alert_level': self._determine_alert_level(blog.get('title', '') + ' ' + blog.get('content', '')),
-                'product_mentions': self._extract_product_mentions(blog.get('title', '') + ' ' + blog.get('content', '')),
-                'funding_mentions': self._extract_funding_mentions(blog.get('title', '') + ' ' + blog.get('content', '')),
-                'partnership_mentions': self._extract_partnership_mentions(blog.get('title', '') + ' ' + blog.get('content', ''))
+                'keywords': analysis.keywords,
+                'entities': analysis.entities,
+                'sentiment': self._analyze_sentiment(analysis),
+                'alert_level': self._determine_alert_level(analysis, company),
+                'product_mentions': self._extract_product_mentions(analysis),
+                'funding_mentions': self._extract_funding_mentions(analysis),
+                'partnership_mentions': self._extract_partnership_mentions(analysis)
             }
             
             parsed_blogs[company].append(parsed_blog)
         
         return dict(parsed_blogs)
     
-    def parse_tweets(self, tweets: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
+    def parse_tweets(self, tweets: List[Dict[str, Any]],
+                     analyses: Optional[List[ItemAnalysis]] = None) -> Dict[str, List[Dict]]:
         """
         Parse tweets and extract insights
         
         Args:
             tweets: List of tweet data
+            analyses: Per-item analyses from analyze_items(), built here if not given
             
         Returns:
             Parsed tweet insights by company
         """
         parsed_tweets = defaultdict(list)
+        analyses = analyses if analyses is not None else self.analyze_items('tweets', tweets)
         
-        for tweet in tweets:
+        for tweet, analysis in zip(tweets, analyses):
             company = tweet.get('company', 'Unknown')
             
             # Extract key information
@@ -131,32 +346,35 @@ class DataParser:
                 'text': tweet.get('text', ''),
                 'created_at': tweet.get('created_at'),
                 'metrics': tweet.get('metrics', {}),
-                'keywords': self._extract_keywords_from_text(tweet.get('text', '')),
-                'entities': self._extract_entities(tweet.get('text', '')),
-                'sentiment': self._analyze_sentiment(tweet.get('text', '')),
-                'alert_level': self._determine_alert_level(tweet.get('text', '')),
+                'keywords': analysis.keywords,
+                'entities': analysis.entities,
+                'sentiment': self._analyze_sentiment(analysis),
+                'alert_level': self._determine_alert_level(analysis, company),
                 'engagement_score': self._calculate_engagement_score(tweet.get('metrics', {})),
-                'hashtags': self._extract_hashtags(tweet.get('text', '')),
-                'mentions': self._extract_mentions(tweet.get('text', ''))
+                'hashtags': self._extract_hashtags(analysis),
+                'mentions': self._extract_mentions(analysis)
             }
             
             parsed_tweets[company].append(parsed_tweet)
         
         return dict(parsed_tweets)
     
-    def parse_linkedin_posts(self, linkedin_posts: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
+    def parse_linkedin_posts(self, linkedin_posts: List[Dict[str, Any]],
+                             analyses: Optional[List[ItemAnalysis]] = None) -> Dict[str, List[Dict]]:
         """
         Parse LinkedIn posts and extract insights
         
         Args:
             linkedin_posts: List of LinkedIn post data
+            analyses: Per-item analyses from analyze_items(), built here if not given
             
         Returns:
             Parsed LinkedIn insights by company
         """
         parsed_linkedin = defaultdict(list)
+        analyses = analyses if analyses is not None else self.analyze_items('linkedin', linkedin_posts)
         
-        for post in linkedin_posts:
+        for post, analysis in zip(linkedin_posts, analyses):
             company = post.get('company', 'Unknown')
             
             # Extract key information
@@ -165,10 +383,10 @@ class DataParser:
                 'text': post.get('text', ''),
                 'created_at': post.get('created_at'),
                 'reactions': post.get('reactions', {}),
-                'keywords': self._extract_keywords_from_text(post.get('text', '')),
-                'entities': self._extract_entities(post.get('text', '')),
-                'sentiment': self._analyze_sentiment(post.get('text', '')),
-                'alert_level': self._determine_alert_level(post.get('text', '')),
+                'keywords': analysis.keywords,
+                'entities': analysis.entities,
+                'sentiment': self._analyze_sentiment(analysis),
+                'alert_level': self._determine_alert_level(analysis, company),
                 'engagement_score': self._calculate_linkedin_engagement(post.get('reactions', {}))
             }
             
@@ -176,20 +394,24 @@ class DataParser:
         
         return dict(parsed_linkedin)
     
-    def parse_jobs(self, jobs: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
+    def parse_jobs(self, jobs: List[Dict[str, Any]],
+                   analyses: Optional[List[ItemAnalysis]] = None) -> Dict[str, List[Dict]]:
         """
         Parse job postings and extract insights
         
         Args:
             jobs: List of job data
+            analyses: Per-item analyses from analyze_items(), built here if not given
             
         Returns:
             Parsed job insights by company
         """
         parsed_jobs = defaultdict(list)
+        analyses = analyses if analyses is not None else self.analyze_items('jobs', jobs)
         
-        for job in jobs:
+        for job, analysis in zip(jobs, analyses):
             company = job.get('company', 'Unknown')
+            location = ItemAnalysis(job.get('location', ''))
             
             # Extract key information
             parsed_job = {
@@ -197,24 +419,28 @@ class DataParser:
                 'location': job.get('location', ''),
                 'posted_at': job.get('posted_at'),
                 'url': job.get('url', ''),
-                'department': self._extract_department(job.get('role', '')),
-                'seniority': self._determine_seniority(job.get('role', '')),
-                'keywords': self._extract_keywords_from_text(job.get('role', '')),
-                'alert_level': self._determine_job_alert_level(job.get('role', '')),
-                'is_remote': self._check_remote_work(job.get('location', '')),
-                'is_international': self._check_international_expansion(job.get('location', ''))
+                'department': self._extract_department(analysis),
+                'seniority': self._determine_seniority(analysis),
+                'keywords': analysis.keywords,
+                'alert_level': self._determine_job_alert_level(analysis),
+                'is_remote': self._check_remote_work(location),
+                'is_international': self._check_international_expansion(location),
+                'is_new': job.get('is_new', True)
             }
             
             parsed_jobs[company].append(parsed_job)
         
         return dict(parsed_jobs)
     
-    def generate_alerts(self, raw_data: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
+    def generate_alerts(self, raw_data: Dict[str, List[Dict]],
+                        analyses: Optional[Dict[str, List[ItemAnalysis]]] = None) -> List[Dict[str, Any]]:
         """
         Generate alerts based on raw data
         
         Args:
             raw_data: Raw data from fetch module
+            analyses: Source type -> per-item analyses the items were parsed
+                with, reused instead of analysing the items again
             
         Returns:
             List of alerts
@@ -223,8 +449,12 @@ class DataParser:
         
         # Check all data sources for alert conditions
         for source_type, items in raw_data.items():
-            for item in items:
-                alert = self._check_alert_conditions(item, source_type)
+            source_analyses = (analyses or {}).get(source_type)
+            if source_analyses is None:
+                source_analyses = self.analyze_items(source_type, items)
+            
+            for item, analysis in zip(items, source_analyses):
+                alert = self._check_alert_conditions(item, source_type, analysis)
                 if alert:
                     alerts.append(alert)
         
@@ -233,12 +463,14 @@ class DataParser:
         
         return alerts
     
-    def generate_company_summaries(self, insights: Dict[str, Dict]) -> Dict[str, Dict]:
+    def generate_company_summaries(self, insights: Dict[str, Dict],
+                                   analyses: Optional[Dict[str, ItemAnalysis]] = None) -> Dict[str, Dict]:
         """
         Generate company-specific summaries
         
         Args:
             insights: Parsed insights by company
+            analyses: Item text -> analysis the item was parsed with, built here if missing
             
         Returns:
             Company summaries
@@ -250,7 +482,7 @@ class DataParser:
                 'company': company,
                 'total_mentions': sum(len(items) for items in company_insights.values()),
                 'key_themes': self._extract_key_themes(company_insights),
-                'product_updates': self._extract_product_updates(company_insights),
+                'product_updates': self._extract_product_updates(company_insights, analyses),
                 'hiring_trends': self._analyze_hiring_trends(company_insights.get('jobs', [])),
                 'engagement_metrics': self._calculate_overall_engagement(company_insights),
                 'alert_summary': self._summarize_alerts(company_insights)
@@ -259,89 +491,97 @@ class DataParser:
         
         return summaries
     
-    def analyze_trends(self, insights: Dict[str, Dict]) -> Dict[str, Any]:
+    def analyze_trends(self, insights: Dict[str, Dict],
+                       analyses: Optional[Dict[str, ItemAnalysis]] = None) -> Dict[str, Any]:
         """
         Analyze cross-company trends
         
         Args:
             insights: Parsed insights by company
+            analyses: Item text -> analysis the item was parsed with, built here if missing
             
         Returns:
             Trend analysis
         """
         trends = {
             'common_themes': self._find_common_themes(insights),
-            'market_movements': self._identify_market_movements(insights),
+            'market_movements': self._identify_market_movements(insights, analyses),
             'competitive_gaps': self._identify_competitive_gaps(insights),
-            'opportunity_areas': self._identify_opportunities(insights)
+            'opportunity_areas': self._identify_opportunities(insights, analyses)
         }
         
         return trends
     
-    def _extract_alert_keywords(self) -> Dict[str, List[str]]:
-        """Extract alert keywords from configuration"""
-        keywords = {}
-        for priority, rules in config.alert_rules.items():
-            keywords[priority] = []
-            for pattern in rules.get('keywords', []):
-                # Extract keywords from regex patterns
-                keyword = pattern.replace(r'(?i)', '').replace(r'\(', '').replace(r'\)', '').replace(r'\|', ' ').replace(r'\?', '')
-                keywords[priority].extend(keyword.split())
-        return keywords
-    
-    def _extract_product_keywords(self) -> List[str]:
-        """Extract product-related keywords"""
-        return [
-            'launch', 'update', 'feature', 'release', 'beta', 'new', 'improved',
-            'enhanced', 'upgraded', 'version', 'app', 'game', 'platform'
-        ]
-    
-    def _extract_keywords_from_text(self, text: str) -> List[str]:
-        """Extract relevant keywords from text"""
-        if not text:
-            return []
+    def analyze_items(self, source_type: str, items: List[Dict[str, Any]]) -> List[ItemAnalysis]:
+        """
+        Build the analysis of each item of a source
         
-        # Use spaCy for keyword extraction if available
-        if nlp:
-            doc = nlp(text.lower())
-            keywords = []
+        Args:
+            source_type: Source type of the items
+            items: Raw items
             
-            # Extract nouns, verbs, and adjectives
-            for token in doc:
-                if token.pos_ in ['NOUN', 'VERB', 'ADJ'] and not token.is_stop and len(token.text) > 3:
-                    keywords.append(token.text)
+        Returns:
+            One ItemAnalysis per item, in order
+        """
+        return self._analyze_texts([self._item_text(item, source_type) for item in items])
+    
+    def _item_text(self, item: Dict[str, Any], source_type: str) -> str:
+        """The text of an item that is analysed and alerted on"""
+        if source_type == 'blogs':
+            return item.get('title', '') + ' ' + item.get('content', '')
+        elif source_type in ('tweets', 'linkedin'):
+            return item.get('text', '')
+        elif source_type == 'jobs':
+            return item.get('role', '')
+        return ''
+    
+    def _analyze_texts(self, texts: List[str]) -> List[ItemAnalysis]:
+        """
+        Analyze a batch of texts
+        
+        All texts go through spaCy's nlp.pipe in one pass, batched by
+        NLP_BATCH_SIZE and spread over NLP_N_PROCESS worker processes when
+        the batch is large enough to pay for them. Keywords and entities
+        both come from the same Doc.
+        
+        Args:
+            texts: Texts to analyze
             
-            return list(set(keywords))[:10]  # Top 10 keywords
+        Returns:
+            ItemAnalysis for each text, in order
+        """
+        nlp = get_nlp()
+        pending = [text for text in texts if text]
+        if not nlp or not pending:
+            return [ItemAnalysis(text) for text in texts]
+        
+        batch_size = max(1, config.nlp_batch_size)
+        n_process = config.nlp_n_process if len(pending) > batch_size else 1
+        docs = iter(nlp.pipe(pending, batch_size=batch_size, n_process=n_process))
         
-        # Fallback to simple keyword extraction
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [word for word in words if len(word) > 3][:10]
+        return [ItemAnalysis(text, next(docs) if text else None) for text in texts]
+    
+    def _analysis_of(self, text: str, analyses: Optional[Dict[str, ItemAnalysis]]) -> ItemAnalysis:
+        """An item's analysis from parsing, or a new one for text that was not parsed"""
+        analysis = (analyses or {}).get(text)
+        return analysis if analysis is not None else ItemAnalysis(text)
+    
+    def _extract_keywords_from_text(self, text: str) -> List[str]:
+        """Extract relevant keywords from text"""
+        return ItemAnalysis(text).keywords
     
     def _extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract named entities from text"""
-        if not text or not nlp:
-            return {}
-        
-        doc = nlp(text)
-        entities = defaultdict(list)
-        
-        for ent in doc.ents:
-            entities[ent.label_].append(ent.text)
-        
-        return dict(entities)
+        return ItemAnalysis(text).entities
     
-    def _analyze_sentiment(self, text: str) -> str:
-        """Analyze sentiment of text"""
-        if not text:
+    def _analyze_sentiment(self, analysis: ItemAnalysis) -> str:
+        """Analyze sentiment of an item"""
+        if not analysis.text:
             return 'neutral'
         
         # Simple sentiment analysis based on keywords
-        positive_words = ['launch', 'success', 'growth', 'partnership', 'innovation', 'win']
-        negative_words = ['down', 'loss', 'failure', 'problem', 'issue', 'challenge']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        positive_count = len(analysis.keyword_hits.get('sentiment:positive', []))
+        negative_count = len(analysis.keyword_hits.get('sentiment:negative', []))
         
         if positive_count > negative_count:
             return 'positive'
@@ -350,38 +590,24 @@ class DataParser:
         else:
             return 'neutral'
     
-    def _determine_alert_level(self, text: str) -> str:
-        """Determine alert level based on text content"""
-        if not text:
-            return 'low'
-        
-        text_lower = text.lower()
-        
-        # High priority keywords
-        high_priority = ['funding', 'series', 'acquired', 'launch', 'token', 'nft', 'c-level', 'vp', 'chief']
-        if any(keyword in text_lower for keyword in high_priority):
-            return 'high'
-        
-        # Medium priority keywords
-        medium_priority = ['hiring', 'partnership', 'expansion', 'collaboration']
-        if any(keyword in text_lower for keyword in medium_priority):
-            return 'medium'
-        
-        return 'low'
+    def _determine_alert_level(self, analysis: ItemAnalysis, company: Optional[str] = None) -> str:
+        """Determine alert level from the alerts.json rules an item matches, once per item"""
+        if analysis.alert_level is None:
+            analysis.alert_rules = self.alert_rules.evaluate(analysis.text, company)
+            analysis.alert_level = AlertRuleEngine.level(analysis.alert_rules)
+        return analysis.alert_level
     
-    def _extract_product_mentions(self, text: str) -> List[str]:
-        """Extract product mentions from text"""
-        return extract_keywords(text, self.product_keywords)
+    def _extract_product_mentions(self, analysis: ItemAnalysis) -> List[str]:
+        """Extract product mentions from an item"""
+        return analysis.keyword_hits.get('mentions:product', [])
     
-    def _extract_funding_mentions(self, text: str) -> List[str]:
+    def _extract_funding_mentions(self, analysis: ItemAnalysis) -> List[str]:
         """Extract funding-related mentions"""
-        funding_keywords = ['funding', 'series', 'seed', 'investment', 'raise', 'backed']
-        return extract_keywords(text, funding_keywords)
+        return analysis.keyword_hits.get('mentions:funding', [])
     
-    def _extract_partnership_mentions(self, text: str) -> List[str]:
+    def _extract_partnership_mentions(self, analysis: ItemAnalysis) -> List[str]:
         """Extract partnership mentions"""
-        partnership_keywords = ['partnership', 'collaboration', 'tie-up', 'alliance', 'joint']
-        return extract_keywords(text, partnership_keywords)
+        return analysis.keyword_hits.get('mentions:partnership', [])
     
     def _calculate_engagement_score(self, metrics: Dict) -> float:
         """Calculate engagement score for tweets"""
@@ -391,93 +617,54 @@ class DataParser:
         
         return (likes + retweets * 2 + replies * 3) / 100  # Normalized score
     
-    def _extract_hashtags(self, text: str) -> List[str]:
-        """Extract hashtags from text"""
-        return re.findall(r'#\w+', text)
+    def _extract_hashtags(self, analysis: ItemAnalysis) -> List[str]:
+        """Extract hashtags from an item"""
+        return re.findall(r'#\w+', analysis.text)
     
-    def _extract_mentions(self, text: str) -> List[str]:
-        """Extract mentions from text"""
-        return re.findall(r'@\w+', text)
+    def _extract_mentions(self, analysis: ItemAnalysis) -> List[str]:
+        """Extract mentions from an item"""
+        return re.findall(r'@\w+', analysis.text)
     
     def _calculate_linkedin_engagement(self, reactions: Dict) -> float:
         """Calculate LinkedIn engagement score"""
         total_reactions = sum(reactions.values())
         return total_reactions / 100  # Normalized score
     
-    def _extract_department(self, role: str) -> str:
+    def _extract_department(self, role: ItemAnalysis) -> str:
         """Extract department from job role"""
-        role_lower = role.lower()
-        
-        departments = {
-            'engineering': ['engineer', 'developer', 'programmer', 'tech'],
-            'marketing': ['marketing', 'growth', 'brand', 'pr'],
-            'sales': ['sales', 'business development', 'bd'],
-            'product': ['product', 'pm', 'product manager'],
-            'design': ['design', 'ux', 'ui', 'creative'],
-            'operations': ['operations', 'ops', 'strategy'],
-            'finance': ['finance', 'accounting', 'cfo'],
-            'hr': ['hr', 'recruitment', 'talent', 'people']
-        }
-        
-        for dept, keywords in departments.items():
-            if any(keyword in role_lower for keyword in keywords):
-                return dept
-        
-        return 'other'
+        hits = role.keyword_hits
+        return next((dept for dept in DEPARTMENT_KEYWORDS if f"department:{dept}" in hits), 'other')
     
-    def _determine_seniority(self, role: str) -> str:
+    def _determine_seniority(self, role: ItemAnalysis) -> str:
         """Determine job seniority level"""
-        role_lower = role.lower()
-        
-        if any(word in role_lower for word in ['intern', 'internship']):
-            return 'intern'
-        elif any(word in role_lower for word in ['junior', 'entry', 'associate']):
-            return 'junior'
-        elif any(word in role_lower for word in ['senior', 'lead', 'principal']):
-            return 'senior'
-        elif any(word in role_lower for word in ['manager', 'director', 'head']):
-            return 'manager'
-        elif any(word in role_lower for word in ['vp', 'vice president', 'chief', 'c-level']):
-            return 'executive'
-        else:
-            return 'mid'
+        hits = role.keyword_hits
+        return next((level for level in SENIORITY_KEYWORDS if f"seniority:{level}" in hits), 'mid')
     
-    def _determine_job_alert_level(self, role: str) -> str:
+    def _determine_job_alert_level(self, role: ItemAnalysis) -> str:
         """Determine alert level for job postings"""
-        role_lower = role.lower()
-        
-        if any(word in role_lower for word in ['vp', 'vice president', 'chief', 'c-level', 'head']):
-            return 'high'
-        elif any(word in role_lower for word in ['director', 'manager', 'lead']):
-            return 'medium'
-        else:
-            return 'low'
+        hits = role.keyword_hits
+        return next((level for level in JOB_ALERT_KEYWORDS if f"job_alert:{level}" in hits), 'low')
     
-    def _check_remote_work(self, location: str) -> bool:
+    def _check_remote_work(self, location: ItemAnalysis) -> bool:
         """Check if job is remote"""
-        location_lower = location.lower()
-        return any(word in location_lower for word in ['remote', 'work from home', 'wfh'])
+        return 'location:remote' in location.keyword_hits
     
-    def _check_international_expansion(self, location: str) -> bool:
+    def _check_international_expansion(self, location: ItemAnalysis) -> bool:
         """Check if job indicates international expansion"""
-        international_keywords = ['us', 'usa', 'united states', 'uk', 'europe', 'singapore', 'dubai']
-        location_lower = location.lower()
-        return any(keyword in location_lower for keyword in international_keywords)
+        return 'location:international' in location.keyword_hits
     
-    def _check_alert_conditions(self, item: Dict, source_type: str) -> Optional[Dict]:
-        """Check if item meets alert conditions"""
-        text = ''
+    def _check_alert_conditions(self, item: Dict, source_type: str,
+                                analysis: Optional[ItemAnalysis] = None) -> Optional[Dict]:
+        """Check if item meets alert conditions, reusing its analysis from parsing if given"""
+        # Job boards are synced in full; only postings opened since the last run alert
+        if source_type == 'jobs' and not item.get('is_new', True):
+            return None
         
-        if source_type == 'blogs':
-            text = item.get('title', '') + ' ' + item.get('content', '')
-        elif source_type == 'tweets':
-            text = item.get('text', '')
-        elif source_type == 'linkedin':
-            text = item.get('text', '')
-        elif source_type == 'jobs':
-            text = item.get('role', '')
+        if analysis is None:
+            analysis = ItemAnalysis(self._item_text(item, source_type))
         
-        alert_level = self._determine_alert_level(text)
+        alert_level = self._determine_alert_level(analysis, item.get('company'))
+        text = analysis.text
         
         if alert_level != 'low':
             return {
@@ -487,7 +674,8 @@ class DataParser:
                 'text': text[:200] + '...' if len(text) > 200 else text,
                 'timestamp': datetime.now(),
                 'url': item.get('url', ''),
-                'keywords': self._extract_keywords_from_text(text)
+                'keywords': analysis.keywords,
+                'rules': analysis.alert_rules
             }
         
         return None
@@ -512,7 +700,8 @@ class DataParser:
         
         return self._extract_keywords_from_text(all_text)[:5]
     
-    def _extract_product_updates(self, company_insights: Dict) -> List[Dict]:
+    def _extract_product_updates(self, company_insights: Dict,
+                                 analyses: Optional[Dict[str, ItemAnalysis]] = None) -> List[Dict]:
         """Extract product updates from company insights"""
         updates = []
         
@@ -527,7 +716,7 @@ class DataParser:
                 else:
                     continue
                 
-                if any(keyword in text.lower() for keyword in self.product_keywords):
+                if self._extract_product_mentions(self._analysis_of(text, analyses)):
                     updates.append({
                         'title': item.get('title', ''),
                         'text': text[:100] + '...' if len(text) > 100 else text,
@@ -559,6 +748,7 @@ class DataParser:
         
         return {
             'total_jobs': len(jobs),
+            'new_jobs': sum(1 for job in jobs if job.get('is_new', True)),
             'departments': dict(departments),
             'seniority_levels': dict(seniority_levels),
             'remote_percentage': (remote_count / len(jobs)) * 100 if jobs else 0,
@@ -612,7 +802,8 @@ class DataParser:
         
         return self._extract_keywords_from_text(all_text)[:10]
     
-    def _identify_market_movements(self, insights: Dict) -> List[str]:
+    def _identify_market_movements(self, insights: Dict,
+                                   analyses: Optional[Dict[str, ItemAnalysis]] = None) -> List[str]:
         """Identify market movements from insights"""
         movements = []
         
@@ -628,7 +819,7 @@ class DataParser:
                     else:
                         continue
                     
-                    if any(keyword in text.lower() for keyword in ['funding', 'series', 'raise']):
+                    if 'movement:funding' in self._analysis_of(text, analyses).keyword_hits:
                         funding_companies.append(company)
         
         if funding_companies:
@@ -646,7 +837,7 @@ class DataParser:
                     else:
                         continue
                     
-                    if any(keyword in text.lower() for keyword in ['launch', 'new feature', 'release']):
+                    if 'movement:launch' in self._analysis_of(text, analyses).keyword_hits:
                         launch_companies.append(company)
         
         if launch_companies:
@@ -678,7 +869,8 @@ class DataParser:
         
         return gaps
     
-    def _identify_opportunities(self, insights: Dict) -> List[str]:
+    def _identify_opportunities(self, insights: Dict,
+                                analyses: Optional[Dict[str, ItemAnalysis]] = None) -> List[str]:
         """Identify opportunity areas for Rush"""
         opportunities = []
         
@@ -694,7 +886,7 @@ class DataParser:
                     else:
                         continue
                     
-                    products = self._extract_product_mentions(text)
+                    products = self._extract_product_mentions(self._analysis_of(text, analyses))
                     all_products.update(products)
         
         # Identify underserved areas
@@ -13,9 +13,17 @@ from pathlib import Path
 from .config import config
 from .utils.logger import get_logger
 from .utils.helpers import get_current_iso_week, format_currency
+from .utils.keyword_matcher import KeywordMatcher
 
 logger = get_logger(__name__)
 
+# Keywords of the fallback summaries and themes, matched as whole words
+SUMMARY_KEYWORDS = KeywordMatcher({
+    'shipped': ['launch*', 'update*', 'new', 'feature*'],
+    'signal': ['partnership*', 'collaboration*', 'expansion*'],
+    'product_update': ['launch*', 'update*', 'new']
+})
+
 
 class AISummarizer:
     """AI-powered summarization for competitive intelligence"""
@@ -203,7 +211,7 @@ class AISummarizer:
         # Extract product updates from blogs
         blogs = company_data.get('blogs', [])
         for blog in blogs:
-            if any(keyword in blog.get('title', '').lower() for keyword in ['launch', 'update', 'new', 'feature']):
+            if 'shipped' in SUMMARY_KEYWORDS.matches(blog.get('title', '').lower()):
                 summary['what_they_shipped'].append(blog.get('title', ''))
         
         # Extract hiring info from jobs
@@ -225,8 +233,7 @@ class AISummarizer:
         tweets = company_data.get('tweets', [])
         themes = []
         for tweet in tweets:
-            text = tweet.get('text', '').lower()
-            if any(theme in text for theme in ['partnership', 'collaboration', 'expansion']):
+            if 'signal' in SUMMARY_KEYWORDS.matches(tweet.get('text', '').lower()):
                 themes.append(tweet.get('text', ''))
         
         summary['signals_narrative'] = themes[:3]  # Top 3 themes
@@ -329,7 +336,7 @@ class AISummarizer:
         for company, company_data in brief_data['companies'].items():
             blogs = company_data.get('blogs', [])
             for blog in blogs:
-                if any(keyword in blog.get('title', '').lower() for keyword in ['launch', 'update', 'new']):
+                if 'product_update' in SUMMARY_KEYWORDS.matches(blog.get('title', '').lower()):
                     product_updates += 1
         
         if product_updates > 5:
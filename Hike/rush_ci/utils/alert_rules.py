@@ -0,0 +1,174 @@
+"""
+Alert rule engine for Rush Gaming CI System
+
+Compiles the keyword regexes of config/alerts.json, the global priorities
+plus each competitor's company_specific rules, into one combined pattern
+per company. Rules match whole words only, like the keyword heuristics,
+though inflected forms count ("launch" matches "launched"). An item is evaluated in a single regex scan, whatever the number of rules,
+and reports the IDs of the rules it matched.
+"""
+
+import re
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+from ..config import config
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# alerts.json priority sections -> alert level, most urgent first
+PRIORITY_LEVELS = {
+    'high_priority': 'high',
+    'medium_priority': 'medium',
+    'low_priority': 'low'
+}
+
+# Leading global inline flags, e.g. "(?i)", which must become scoped flags
+# once the pattern is embedded in the combined regex
+GLOBAL_FLAGS = re.compile(r'^\(\?([aiLmsux]+)\)')
+
+# Word endings a rule still matches through: "launches", "raised", "hiring"
+INFLECTIONS = r'(?:s|es|d|ed|ing)?'
+
+
+def _scoped(pattern: str) -> str:
+    """
+    Rewrite a pattern's leading global flags as a scoped group, bounded to
+    whole (possibly inflected) words
+    """
+    match = GLOBAL_FLAGS.match(pattern)
+    if match:
+        return fr"\b(?{match.group(1)}:(?:{pattern[match.end():]}){INFLECTIONS})\b"
+    return fr"\b(?:{pattern}){INFLECTIONS}\b"
+
+
+class AlertRuleEngine:
+    """Evaluates items against the alert rules of their company in one pass"""
+
+    def __init__(self, rules: Optional[Dict[str, Any]] = None,
+                 competitors: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            rules: alerts.json contents, defaults to config.alert_rules
+            competitors: competitors.json contents, used to resolve company
+                names to their company_specific keys; defaults to config.competitors
+        """
+        rules = rules if rules is not None else config.alert_rules
+        competitors = competitors if competitors is not None else config.competitors
+
+        # (rule ID, pattern) of the rules every item is checked against
+        self._global_rules = self._collect(
+            '', ((priority, rules.get(priority, {}).get('keywords', [])) for priority in PRIORITY_LEVELS)
+        )
+        # Company key -> (rule ID, pattern) of its own rules
+        self._company_rules = {
+            key.lower(): self._collect(
+                f"company_specific.{key.lower()}.",
+                ((priority, patterns) for priority, patterns in company_rules.items() if priority in PRIORITY_LEVELS)
+            )
+            for key, company_rules in rules.get('company_specific', {}).items()
+        }
+
+        # Lowercased company name or key -> company_specific key
+        self._company_keys = {key: key for key in self._company_rules}
+        for key, competitor in competitors.items():
+            if key.lower() in self._company_rules and competitor.get('name'):
+                self._company_keys[competitor['name'].lower()] = key.lower()
+
+        self._compiled: Dict[Optional[str], Tuple[Optional[re.Pattern], List[str], List[Optional[re.Pattern]]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _collect(prefix: str, sections: Iterable[Tuple[str, List[str]]]) -> List[Tuple[str, str]]:
+        """(rule ID, pattern) pairs of priority sections, IDs like <prefix>high_priority.2"""
+        return [
+            (f"{prefix}{priority}.{index}", pattern)
+            for priority, patterns in sections
+            for index, pattern in enumerate(patterns)
+        ]
+
+    def _company_key(self, company: Optional[str]) -> Optional[str]:
+        """company_specific key of a company name or key, or None if it has no own rules"""
+        return self._company_keys.get(company.lower()) if company else None
+
+    def _compile(self, company_key: Optional[str]) -> Tuple[Optional[re.Pattern], List[str], List[Optional[re.Pattern]]]:
+        """
+        Combined pattern for a company, built on first use
+
+        Returns:
+            Tuple of (combined pattern or None without rules, rule IDs by
+            group index, and by group index the alternation of the rules
+            after it, or None for the last rule)
+        """
+        with self._lock:
+            if company_key in self._compiled:
+                return self._compiled[company_key]
+
+            rules = self._global_rules + self._company_rules.get(company_key, [])
+            rule_ids: List[str] = []
+            branches: List[str] = []
+
+            for rule_id, pattern in rules:
+                try:
+                    re.compile(_scoped(pattern))
+                except re.error as e:
+                    logger.warning(f"Skipping alert rule {rule_id} {pattern!r}: {e}")
+                    continue
+                branches.append(f"(?P<r{len(rule_ids)}>{_scoped(pattern)})")
+                rule_ids.append(rule_id)
+
+            combined = re.compile('|'.join(branches)) if branches else None
+            rest = [
+                re.compile('|'.join(branches[index + 1:])) if index + 1 < len(branches) else None
+                for index in range(len(branches))
+            ]
+            self._compiled[company_key] = (combined, rule_ids, rest)
+            return self._compiled[company_key]
+
+    def evaluate(self, text: str, company: Optional[str] = None) -> List[str]:
+        """
+        Find the rules a text matches
+
+        The combined pattern is scanned once and each match names its rule
+        through its group. An alternation only reports the first branch
+        matching at a position, so the rules after that branch are tried
+        at the same position in turn.
+
+        Args:
+            text: Item text
+            company: Company name or competitors.json key, selecting its company_specific rules
+
+        Returns:
+            IDs of the matched rules, e.g. ["high_priority.0", "company_specific.mpl.high_priority.1"],
+            in rule order
+        """
+        combined, rule_ids, rest = self._compile(self._company_key(company))
+        if combined is None or not text:
+            return []
+
+        matched = set()
+        position = 0
+
+        while len(matched) < len(rule_ids):
+            match = combined.search(text, position)
+            if match is None:
+                break
+
+            position = match.start()
+            while match is not None:
+                index = int(match.lastgroup[1:])
+                matched.add(index)
+                match = rest[index].match(text, position) if rest[index] is not None else None
+
+            position += 1
+
+        return [rule_ids[index] for index in sorted(matched)]
+
+    @staticmethod
+    def level(rule_ids: List[str]) -> str:
+        """Alert level of the most urgent matched rule; 'low' when nothing matched"""
+        for priority, level in PRIORITY_LEVELS.items():
+            if any(rule_id.split('.')[-2] == priority for rule_id in rule_ids):
+                return level
+        return 'low'
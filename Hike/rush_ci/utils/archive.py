@@ -0,0 +1,160 @@
+"""
+Raw response archive for Rush Gaming CI System
+
+Keeps the bytes of every fetched response, gzip-compressed and stored once
+per distinct body (content-addressed by SHA-256), with a daily JSONL index
+of URL, status, headers and fetch time. Replaying from the archive lets
+scrapers and parsers be re-run over past fetches without the network.
+"""
+
+import io
+import json
+import gzip
+import hashlib
+import threading
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..config import config
+from .logger import get_logger
+from .state import json_default, json_object_hook
+
+logger = get_logger(__name__)
+
+# Headers describing the wire encoding; archived bodies are stored decoded
+WIRE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+class ResponseArchive:
+    """Content-addressed store of raw HTTP responses with a per-day index"""
+
+    def __init__(self, archive_dir: Optional[Path] = None):
+        """
+        Args:
+            archive_dir: Archive root, defaults to config.archive_dir
+        """
+        self.archive_dir = Path(archive_dir) if archive_dir is not None else config.archive_dir
+        self._lock = threading.Lock()
+        # URL -> fetch times and index entries, oldest first; loaded on first lookup
+        self._index: Optional[Dict[str, List]] = None
+
+    def _blob_path(self, digest: str) -> Path:
+        """Path of the compressed body with a given SHA-256"""
+        return self.archive_dir / 'blobs' / digest[:2] / f"{digest}.gz"
+
+    def record(self, url: str, response: requests.Response, body: Optional[bytes] = None) -> Optional[str]:
+        """
+        Archive a fetched response
+
+        The body is written only if no earlier response had the same bytes;
+        every fetch still gets an index entry.
+
+        Args:
+            url: Request URL, including any query parameters
+            response: Fully read response
+            body: Decoded body of a streamed response, read from its raw
+                stream; defaults to response.content
+
+        Returns:
+            SHA-256 of the body, or None if it could not be archived
+        """
+        try:
+            body = (response.content if body is None else body) or b''
+            digest = hashlib.sha256(body).hexdigest()
+            blob_path = self._blob_path(digest)
+
+            if not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = blob_path.with_name(f"{blob_path.name}.{threading.get_ident()}.tmp")
+                temp_path.write_bytes(gzip.compress(body))
+                temp_path.replace(blob_path)
+
+            fetched_at = datetime.now()
+            entry = {
+                'url': url,
+                'final_url': response.url or url,
+                'status': response.status_code,
+                'headers': {key: value for key, value in response.headers.items() if key.lower() not in WIRE_HEADERS},
+                'fetched_at': fetched_at,
+                'sha256': digest,
+                'size': len(body)
+            }
+            line = json.dumps(entry, default=json_default)
+
+            with self._lock:
+                index_path = self.archive_dir / 'index' / f"{fetched_at:%Y-%m-%d}.jsonl"
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(index_path, 'a') as f:
+                    f.write(line + '\n')
+                if self._index is not None:
+                    self._index.setdefault(url, [[], []])
+                    self._index[url][0].append(fetched_at)
+                    self._index[url][1].append(entry)
+
+            return digest
+
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not archive response for {url}: {e}")
+            return None
+
+    def lookup(self, url: str, as_of: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the latest archived fetch of a URL
+
+        Args:
+            url: Request URL, including any query parameters
+            as_of: Only consider fetches made at or before this time
+
+        Returns:
+            Index entry, or None if the URL was never archived by then
+        """
+        with self._lock:
+            if self._index is None:
+                self._index = self._load_index()
+            times, entries = self._index.get(url, ([], []))
+            position = bisect_right(times, as_of) if as_of is not None else len(times)
+
+        return entries[position - 1] if position else None
+
+    def load(self, entry: Dict[str, Any]) -> requests.Response:
+        """
+        Rebuild a response from an index entry
+
+        The body is available both as .content and as a stream on .raw.
+
+        Raises:
+            OSError: If the body is missing from the archive
+        """
+        body = gzip.decompress(self._blob_path(entry['sha256']).read_bytes())
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['final_url']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        return response
+
+    def _load_index(self) -> Dict[str, List]:
+        """Read every daily index file into URL -> ([fetch times], [entries])"""
+        index: Dict[str, List] = {}
+
+        for index_path in sorted((self.archive_dir / 'index').glob('*.jsonl')):
+            with open(index_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line, object_hook=json_object_hook)
+                    except ValueError:
+                        # A torn last line from an interrupted write
+                        continue
+                    times, entries = index.setdefault(entry['url'], [[], []])
+                    times.append(entry['fetched_at'])
+                    entries.append(entry)
+
+        return index
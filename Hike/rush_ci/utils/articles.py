@@ -0,0 +1,305 @@
+"""
+Full-article fetching for Rush Gaming CI System
+
+Downloads the article behind each blog item, strips navigation and other
+boilerplate, and caches the text by canonical URL so each article is
+fetched and extracted once in its lifetime.
+"""
+
+import re
+import json
+import hashlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, urljoin
+
+import lxml.html
+from lxml import etree
+
+from ..config import config
+from .logger import get_logger
+from .helpers import safe_request, clean_text
+from .http_client import HttpClient
+from .state import json_object_hook, write_json_atomic
+
+logger = get_logger(__name__)
+
+# Query parameters that only track the click and never change the article
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|source)$', re.IGNORECASE)
+
+# Elements that never hold article text
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'iframe', 'svg', 'button']
+
+# Whole class/id tokens marking navigation, sharing widgets, comments, ...,
+# either alone ("sidebar") or with a widget suffix ("share-buttons"), so
+# "has-sidebar" or "header-adjacent" are kept
+BOILERPLATE_HINTS = re.compile(
+    r'(nav|menu|footer|header|sidebar|comment|share|social|related|newsletter|subscribe|cookie|banner|breadcrumb|promo|ad)s?'
+    r'([_-](bar|box|button|link|list|area|wrap|wrapper|container|section|widget)s?)?',
+    re.IGNORECASE
+)
+
+# Article containers tried before falling back to the densest block
+ARTICLE_CONTAINERS = ['//*[@itemprop="articleBody"]', '//article', '//main']
+
+# Block-level elements whose text makes up the article body
+TEXT_BLOCKS = {'p', 'h2', 'h3', 'h4', 'li', 'blockquote', 'pre'}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalise a URL so tracking and cosmetic variants share one cache key
+
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the remaining query.
+    """
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or 'https').lower()
+    host = (parsed.hostname or '').lower()
+
+    if parsed.port and not (scheme == 'http' and parsed.port == 80) and not (scheme == 'https' and parsed.port == 443):
+        host = f"{host}:{parsed.port}"
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(key)
+    ))
+
+    return urlunparse((scheme, host, parsed.path.rstrip('/') or '/', '', query, ''))
+
+
+def extract_article(content: bytes, base_url: str = '') -> Dict[str, Any]:
+    """
+    Extract the title and readable body of an article page
+
+    Args:
+        content: Raw HTML content
+        base_url: Page URL, used to resolve a relative canonical link
+
+    Returns:
+        Dict with 'title', 'text' (paragraphs separated by blank lines) and
+        'canonical' (the page's rel=canonical URL or None)
+    """
+    article = {'title': '', 'text': '', 'canonical': None}
+
+    try:
+        root = lxml.html.document_fromstring(content)
+    except (etree.ParserError, ValueError):
+        return article
+
+    for link in root.iter('link'):
+        if 'canonical' in (link.get('rel') or '').lower().split() and link.get('href'):
+            article['canonical'] = urljoin(base_url, link.get('href'))
+            break
+
+    article['title'] = _extract_title(root)
+
+    etree.strip_elements(root, *BOILERPLATE_TAGS, with_tail=False)
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str) or element.getparent() is None:
+            continue
+        tokens = f"{element.get('class', '')} {element.get('id', '')}".split()
+        if any(BOILERPLATE_HINTS.fullmatch(token) for token in tokens) and element.tag not in ('body', 'html', 'article', 'main'):
+            element.drop_tree()
+
+    container = None
+    for xpath in ARTICLE_CONTAINERS:
+        matches = root.xpath(xpath)
+        if matches:
+            container = max(matches, key=lambda element: len(element.text_content()))
+            break
+
+    if container is None:
+        container = _densest_block(root)
+
+    if container is None:
+        return article
+
+    paragraphs = [
+        clean_text(element.text_content())
+        for element in container.iter(*TEXT_BLOCKS)
+        if not any(ancestor.tag in TEXT_BLOCKS for ancestor in element.iterancestors())
+    ]
+    text = '\n\n'.join(paragraph for paragraph in paragraphs if paragraph)
+
+    if not text:
+        text = clean_text(container.text_content())
+
+    article['text'] = text
+    return article
+
+
+def _extract_title(root: etree._Element) -> str:
+    """og:title, else the first <h1>, else <title>"""
+    for meta in root.iter('meta'):
+        if meta.get('property') == 'og:title' and meta.get('content'):
+            return clean_text(meta.get('content'))
+
+    for tag in ('h1', 'title'):
+        element = root.find(f'.//{tag}')
+        if element is not None and element.text_content().strip():
+            return clean_text(element.text_content())
+
+    return ''
+
+
+def _densest_block(root: etree._Element) -> Optional[etree._Element]:
+    """The element whose direct <p> children hold the most text"""
+    scores: Dict[etree._Element, int] = {}
+
+    for paragraph in root.iter('p'):
+        parent = paragraph.getparent()
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0) + len(paragraph.text_content().strip())
+
+    if not scores:
+        return root.find('body')
+    return max(scores, key=scores.get)
+
+
+class ArticleCache:
+    """On-disk article text cache, one JSON file per canonical URL"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else config.article_cache_dir
+
+    def _path(self, url: str) -> Path:
+        """Cache file path for a URL"""
+        return self.cache_dir / f"{hashlib.sha1(canonical_url(url).encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the cached article for a URL
+
+        Args:
+            url: Article URL, in any tracking/cosmetic variant
+
+        Returns:
+            Entry with url, text and fetched_at, or None
+        """
+        path = self._path(url)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                return json.load(f, object_hook=json_object_hook)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, title: str, text: str, aliases: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Save an article under its canonical URL and any aliases
+
+        Args:
+            url: Article URL
+            title: Article title
+            text: Extracted article text
+            aliases: Other URLs for the same article, e.g. the page's rel=canonical
+
+        Returns:
+            The stored entry
+        """
+        entry = {'url': canonical_url(url), 'title': title, 'text': text, 'fetched_at': datetime.now()}
+
+        for key in {url, *(aliases or [])}:
+            write_json_atomic(self._path(key), entry)
+
+        return entry
+
+
+class ArticleFetcher:
+    """Fills blog items with full article text, fetching only uncached URLs"""
+
+    def __init__(self, cache: Optional[ArticleCache] = None, max_workers: Optional[int] = None,
+                 max_chars: Optional[int] = None, client: Optional[HttpClient] = None):
+        """
+        Args:
+            cache: Article cache, defaults to one in config.article_cache_dir
+            max_workers: Parallel downloads, defaults to config.article_fetch_workers
+            max_chars: Longest text kept per article, defaults to config.article_max_chars
+            client: HTTP client to download through, defaults to the shared one
+        """
+        self.cache = cache if cache is not None else ArticleCache()
+        self.client = client
+        self.max_workers = max(1, max_workers or config.article_fetch_workers)
+        self.max_chars = max_chars or config.article_max_chars
+
+    def enrich(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Replace each item's content with its full article text
+
+        The original feed or listing text is kept under 'summary'. Items
+        whose article cannot be fetched keep their content unchanged.
+
+        Args:
+            items: Blog items with 'url' and 'content'
+
+        Returns:
+            The same items, updated in place
+        """
+        articles = self.fetch([item.get('url') for item in items if item.get('url')])
+
+        for item in items:
+            text = articles.get(item.get('url'), {}).get('text')
+            if text:
+                item.setdefault('summary', item.get('content', ''))
+                item['content'] = text
+
+        return items
+
+    def fetch(self, urls: List[str], refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get articles from the cache, downloading the missing ones in parallel
+
+        Args:
+            urls: Article URLs
+            refresh: Download every URL even if cached, e.g. when it is known to have changed
+
+        Returns:
+            URL -> cache entry with 'title' and 'text', for the articles that could be fetched
+        """
+        articles: Dict[str, Dict[str, Any]] = {}
+        missing = []
+
+        for url in dict.fromkeys(urls):
+            entry = None if refresh else self.cache.get(url)
+            if entry is not None:
+                articles[url] = entry
+            else:
+                missing.append(url)
+
+        if missing:
+            logger.info(f"Fetching {len(missing)} articles")
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                # Copy the caller's context so its time budget applies to the downloads
+                futures = {
+                    url: executor.submit(contextvars.copy_context().run, self._fetch_article, url)
+                    for url in missing
+                }
+                for url, future in futures.items():
+                    entry = future.result()
+                    if entry is not None:
+                        articles[url] = entry
+
+        return articles
+
+    def _fetch_article(self, url: str) -> Optional[Dict[str, Any]]:
+        """Download, extract and cache one article; None if it could not be fetched"""
+        try:
+            response = safe_request(url, client=self.client)
+            if not response or response.status_code != 200:
+                return None
+
+            article = extract_article(response.content, response.url or url)
+            return self.cache.store(
+                url, article['title'], article['text'][:self.max_chars],
+                aliases=[article['canonical']] if article['canonical'] else None
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching article {url}: {e}")
+            return None
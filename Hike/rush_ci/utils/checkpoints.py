@@ -0,0 +1,144 @@
+"""
+Fetch run checkpoints for Rush Gaming CI System
+
+Each (competitor, source) unit of a fetch run is written to disk as soon as
+it completes, so a run interrupted by a crash or restart resumes from the
+first incomplete unit instead of repeating every request.
+"""
+
+import json
+import re
+import shutil
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ..config import config
+from .logger import get_logger
+from .state import json_object_hook, write_json_atomic
+
+logger = get_logger(__name__)
+
+RUN_ID_FORMAT = '%Y%m%d_%H%M%S'
+
+
+def _unit_file_name(competitor_key: str, source_type: str) -> str:
+    """File name for one unit's checkpoint"""
+    return re.sub(r'[^\w.-]', '_', f"{competitor_key}--{source_type}") + '.json'
+
+
+class FetchCheckpoint:
+    """Per-unit checkpoints for the current fetch run"""
+
+    def __init__(self, checkpoint_dir: Optional[Path] = None, max_age_hours: Optional[float] = None):
+        """
+        Args:
+            checkpoint_dir: Directory holding one subdirectory per run, defaults to config.checkpoint_dir
+            max_age_hours: Completed units older than this are fetched again, defaults to config.checkpoint_max_age_hours
+        """
+        self.checkpoint_dir = Path(checkpoint_dir if checkpoint_dir is not None else config.checkpoint_dir)
+        self.max_age = timedelta(hours=max_age_hours if max_age_hours is not None else config.checkpoint_max_age_hours)
+        self.run_dir: Optional[Path] = None
+        self._lock = threading.Lock()
+
+    @property
+    def run_id(self) -> Optional[str]:
+        """ID of the open run, or None"""
+        return self.run_dir.name if self.run_dir else None
+
+    def start_run(self) -> str:
+        """
+        Open a run, resuming the latest unfinished one if there is one
+
+        Returns:
+            Run ID
+        """
+        with self._lock:
+            if self.run_dir and self.run_dir.exists():
+                return self.run_dir.name
+
+            runs = sorted(path for path in self.checkpoint_dir.glob('*') if path.is_dir())
+            if runs:
+                self.run_dir = runs[-1]
+                for stale_run in runs[:-1]:
+                    shutil.rmtree(stale_run, ignore_errors=True)
+                logger.info(f"Resuming fetch run {self.run_dir.name}")
+            else:
+                self.run_dir = self.checkpoint_dir / datetime.now().strftime(RUN_ID_FORMAT)
+                self.run_dir.mkdir(parents=True, exist_ok=True)
+                logger.info(f"Starting fetch run {self.run_dir.name}")
+
+            return self.run_dir.name
+
+    def load(self, competitor_key: str, source_type: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a unit's items if it completed within the freshness window
+
+        Args:
+            competitor_key: Competitor key from competitors.json
+            source_type: Source type
+
+        Returns:
+            Checkpointed items, or None if the unit must be fetched
+        """
+        checkpoint = self.load_unit(competitor_key, source_type)
+        return checkpoint['items'] if checkpoint is not None else None
+
+    def load_unit(self, competitor_key: str, source_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a unit's checkpoint if it completed within the freshness window
+
+        Args:
+            competitor_key: Competitor key from competitors.json
+            source_type: Source type
+
+        Returns:
+            Dictionary with the unit's 'items', 'held' state and 'fetched_at'
+            time, or None if the unit must be fetched
+        """
+        if not self.run_dir:
+            return None
+
+        try:
+            with open(self.run_dir / _unit_file_name(competitor_key, source_type), 'r') as f:
+                checkpoint = json.load(f, object_hook=json_object_hook)
+        except (OSError, ValueError):
+            return None
+
+        fetched_at = checkpoint.get('fetched_at')
+        if not isinstance(fetched_at, datetime) or datetime.now() - fetched_at > self.max_age:
+            return None
+
+        return {'items': checkpoint.get('items', []), 'held': checkpoint.get('held', {}), 'fetched_at': fetched_at}
+
+    def record(self, competitor_key: str, source_type: str, items: List[Dict[str, Any]],
+               held: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Mark a unit complete with its items
+
+        Args:
+            competitor_key: Competitor key from competitors.json
+            source_type: Source type
+            items: Items the unit fetched
+            held: State the unit holds until the run completes, e.g. its
+                uncommitted watermarks, restored when the unit is reused
+        """
+        if not self.run_dir:
+            return
+
+        try:
+            write_json_atomic(
+                self.run_dir / _unit_file_name(competitor_key, source_type),
+                {'fetched_at': datetime.now(), 'items': items, 'held': held or {}}
+            )
+        except OSError as e:
+            logger.warning(f"Could not checkpoint {competitor_key}/{source_type}: {e}")
+
+    def complete_run(self) -> None:
+        """Close the run once its results are safely processed, so the next run starts fresh"""
+        with self._lock:
+            if self.run_dir:
+                shutil.rmtree(self.run_dir, ignore_errors=True)
+                logger.info(f"Completed fetch run {self.run_dir.name}")
+                self.run_dir = None
@@ -0,0 +1,125 @@
+"""
+Per-host circuit breakers for Rush Gaming CI System
+
+After repeated connection failures or 5xx responses from a host, further
+requests to it fail immediately until a cool-down has passed, instead of
+each one waiting out its own timeout.
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from ..config import config
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Thread-safe breaker for one host: closed -> open -> half-open -> closed"""
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open before a trial request
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'"""
+        with self._lock:
+            if self.opened_at is None:
+                return 'closed'
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return 'open'
+            return 'half-open'
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent
+
+        Once the cool-down has passed a single trial request is let through;
+        its outcome closes the circuit or opens it for another cool-down.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed trial"""
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class HostCircuitBreakers:
+    """One CircuitBreaker per host"""
+
+    def __init__(self, failure_threshold: Optional[int] = None, cooldown: Optional[float] = None):
+        """
+        Args:
+            failure_threshold: Defaults to config.circuit_failure_threshold
+            cooldown: Seconds, defaults to config.circuit_cooldown_seconds
+        """
+        self.failure_threshold = failure_threshold if failure_threshold is not None else config.circuit_failure_threshold
+        self.cooldown = cooldown if cooldown is not None else config.circuit_cooldown_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, url_or_host: str) -> CircuitBreaker:
+        """Get or create the breaker for a URL's host"""
+        host = urlparse(url_or_host).netloc or url_or_host
+
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.cooldown)
+                self._breakers[host] = breaker
+            return breaker
+
+    def check(self, url: str) -> None:
+        """
+        Raise if the URL's host is not currently accepting requests
+
+        Raises:
+            CircuitOpenError: When the host's circuit is open
+        """
+        if not self.breaker_for(url).allow():
+            raise CircuitOpenError(f"Circuit open for {urlparse(url).netloc or url}, skipping request")
+
+    def record_success(self, url: str) -> None:
+        """Record a successful request to the URL's host"""
+        self.breaker_for(url).record_success()
+
+    def record_failure(self, url: str) -> None:
+        """Record a failed request to the URL's host"""
+        self.breaker_for(url).record_failure()
+
+
+# Shared breakers used by the HTTP client
+circuit_breakers = HostCircuitBreakers()
@@ -0,0 +1,121 @@
+"""
+Date parsing for Rush Gaming CI System
+
+Handles ISO 8601, RFC 822 (RSS pubDate) and common numeric formats, and
+remembers which format each source uses so later items parse first try.
+"""
+
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Iterable, Tuple
+
+
+def _parse_iso8601(value: str) -> datetime:
+    """ISO 8601, including 'Z' and numeric offsets"""
+    return datetime.fromisoformat(value)
+
+
+def _parse_rfc822(value: str) -> datetime:
+    """RFC 822 / RFC 2822, e.g. 'Mon, 01 Jan 2024 12:00:00 GMT'"""
+    parsed = parsedate_to_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Not an RFC 822 date: {value}")
+    return parsed
+
+
+def _strptime_parser(fmt: str) -> Callable[[str], datetime]:
+    """Build a parser for one strptime format"""
+    def parse(value: str) -> datetime:
+        return datetime.strptime(value, fmt)
+    return parse
+
+
+# Name -> parser, in the order tried for a source with no learned format
+DATE_PARSERS: List[Tuple[str, Callable[[str], datetime]]] = [
+    ('iso8601', _parse_iso8601),
+    ('rfc822', _parse_rfc822),
+    ('%d/%m/%Y', _strptime_parser('%d/%m/%Y')),
+    ('%m/%d/%Y', _strptime_parser('%m/%d/%Y')),
+    ('%d %B %Y', _strptime_parser('%d %B %Y')),
+    ('%B %d, %Y', _strptime_parser('%B %d, %Y')),
+]
+
+
+def to_local_naive(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive local time, like datetime.now()"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+class DateParser:
+    """Multi-format date parser that learns the winning format per source"""
+
+    def __init__(self):
+        self._parsers = dict(DATE_PARSERS)
+        self._learned: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def parse(self, value: str, source: Optional[str] = None,
+              default: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Parse a date string
+
+        Args:
+            value: Date string
+            source: Source key (feed, job board, ...) whose format is learned
+            default: Returned when the string cannot be parsed
+
+        Returns:
+            Naive local datetime, or default
+        """
+        if not value or not isinstance(value, str):
+            return default
+
+        value = value.strip()
+        learned = self._learned.get(source) if source else None
+
+        if learned:
+            try:
+                return to_local_naive(self._parsers[learned](value))
+            except (ValueError, TypeError, OverflowError):
+                pass
+
+        for name, parser in self._parsers.items():
+            if name == learned:
+                continue
+            try:
+                parsed = parser(value)
+            except (ValueError, TypeError, OverflowError):
+                continue
+
+            if source:
+                with self._lock:
+                    self._learned[source] = name
+            return to_local_naive(parsed)
+
+        return default
+
+    def parse_batch(self, values: Iterable[str], source: Optional[str] = None,
+                    default: Optional[datetime] = None) -> List[Optional[datetime]]:
+        """
+        Parse many date strings from the same source
+
+        Args:
+            values: Date strings
+            source: Source key shared by all values
+            default: Returned for strings that cannot be parsed
+
+        Returns:
+            List of parsed datetimes, aligned with the input
+        """
+        return [self.parse(value, source, default) for value in values]
+
+    def learned_format(self, source: str) -> Optional[str]:
+        """Get the format name learned for a source"""
+        return self._learned.get(source)
+
+
+# Shared parser, so learned formats carry across fetchers in a process
+date_parser = DateParser()
@@ -0,0 +1,72 @@
+"""
+Time budgets for Rush Gaming CI System
+
+A deadline set with time_budget() applies to every request made in the
+same thread (or asyncio task) until the block exits. The HTTP client clips
+its timeouts to the time remaining and refuses to start requests once the
+deadline has passed.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+
+import requests
+
+# Absolute time.monotonic() deadline of the innermost active budget
+_deadline: ContextVar[Optional[float]] = ContextVar('rush_ci_deadline', default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised instead of sending a request once the time budget is spent"""
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Limit the time spent on requests inside the block
+
+    Budgets nest: the effective deadline is the earliest of the new
+    budget and any enclosing one. None or a non-positive value adds no limit.
+
+    Args:
+        seconds: Budget in seconds
+    """
+    current = _deadline.get()
+    deadline = current
+
+    if seconds is not None and seconds > 0:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if current is None else min(current, candidate)
+
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the active budget, or None when there is no budget"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def clip_timeout(timeout: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Shorten a (connect, read) timeout to fit the active budget
+
+    Raises:
+        DeadlineExceeded: When the budget is already spent
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Time budget exhausted, not sending request")
+
+    connect_timeout, read_timeout = timeout
+    return (min(connect_timeout, left), min(read_timeout, left))
@@ -0,0 +1,123 @@
+"""
+HTML extraction engine for Rush Gaming CI System
+
+Compiles CSS selector sets to XPath once, parses each page once with lxml
+and pulls every field of a listing item in a single walk of its subtree.
+"""
+
+from typing import Dict, List, Optional, Tuple, Iterable
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+
+class FieldRule:
+    """Matches the first descendant of a listing item that supplies one field"""
+
+    def __init__(self, tags: Iterable[str], attribute: Optional[str] = None, class_contains: Optional[str] = None):
+        """
+        Args:
+            tags: Element tags that can supply the field
+            attribute: Attribute to read instead of the element text
+            class_contains: Only match elements whose class contains this (case-insensitive)
+        """
+        self.tags = frozenset(tags)
+        self.attribute = attribute
+        self.class_contains = class_contains.lower() if class_contains else None
+
+    def matches(self, element: etree._Element) -> bool:
+        """Check whether an element supplies this field"""
+        if element.tag not in self.tags:
+            return False
+        if self.class_contains and self.class_contains not in (element.get('class') or '').lower():
+            return False
+        return True
+
+    def value(self, element: etree._Element) -> str:
+        """Read the field value from a matching element"""
+        if self.attribute:
+            return element.get(self.attribute) or ''
+        return element.text_content()
+
+
+class SelectorSet:
+    """Ordered listing selectors plus the fields to pull from each matched item"""
+
+    def __init__(self, selectors: List[str], fields: Dict[str, FieldRule]):
+        """
+        Args:
+            selectors: CSS selectors for listing items, tried in order
+            fields: Field name -> rule for the descendant supplying it
+        """
+        self.selectors = [(selector, CSSSelector(selector, translator='html')) for selector in selectors]
+        self.fields = fields
+
+    def extract(self, content: bytes, limit: Optional[int] = None) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Parse a page once and extract fields from the first selector that matches
+
+        Args:
+            content: Raw HTML content
+            limit: Maximum number of items to return
+
+        Returns:
+            Tuple of (list of field dicts, selector that matched or None)
+        """
+        try:
+            root = lxml.html.document_fromstring(content)
+        except (etree.ParserError, ValueError):
+            return [], None
+
+        for selector, compiled in self.selectors:
+            elements = compiled(root)
+            if elements:
+                return [self._extract_fields(element) for element in elements[:limit]], selector
+
+        return [], None
+
+    def _extract_fields(self, item: etree._Element) -> Dict[str, str]:
+        """Fill every field from one walk over the item's descendants"""
+        values = {}
+        pending = dict(self.fields)
+
+        for element in item.iterdescendants():
+            if not isinstance(element.tag, str):
+                continue  # comments and processing instructions
+
+            for name, rule in list(pending.items()):
+                if rule.matches(element):
+                    values[name] = rule.value(element)
+                    del pending[name]
+
+            if not pending:
+                break
+
+        return values
+
+
+def find_feed_links(content: bytes, feed_types: Iterable[str]) -> List[str]:
+    """
+    Find <link rel="alternate"> feed hrefs in page HTML
+
+    Args:
+        content: Raw HTML content
+        feed_types: Accepted link type values
+
+    Returns:
+        List of (possibly relative) feed hrefs in document order
+    """
+    try:
+        root = lxml.html.document_fromstring(content)
+    except (etree.ParserError, ValueError):
+        return []
+
+    accepted = {feed_type.lower() for feed_type in feed_types}
+    links = []
+
+    for link in root.iter('link'):
+        rel = (link.get('rel') or '').lower().split()
+        if 'alternate' in rel and (link.get('type') or '').lower() in accepted and link.get('href'):
+            links.append(link.get('href'))
+
+    return links
@@ -6,17 +6,28 @@ import time
 import hashlib
 import re
 import random
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Union, Tuple
 from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from .http_client import HttpClient, http_client
+from .http_cache import HttpCache, http_cache
+from .keyword_matcher import KeywordMatcher
+from .logger import get_logger
+
+logger = get_logger(__name__)
 
 
 def rate_limit_delay(min_seconds: float = 2.0, max_seconds: float = 6.0) -> None:
     """
     Random delay to respect rate limits
     
+    Superseded by the per-host limiter applied by the shared HTTP client; kept for
+    callers that need a fixed pause.
+    
     Args:
         min_seconds: Minimum delay in seconds
         max_seconds: Maximum delay in seconds
@@ -109,26 +120,83 @@ def validate_url(url: str) -> bool:
         return False
 
 
-def extract_meta_tags(html_content: str) -> Dict[str, str]:
+def parse_html_head(chunks: Union[str, bytes, Iterable[Union[str, bytes]]],
+                    max_bytes: Optional[int] = None) -> Dict[str, Any]:
     """
-    Extract meta tags from HTML content
+    Parse the <head> of an HTML document incrementally, stopping at </head>
+    
+    Chunks are fed to an lxml pull parser as they arrive, so a streamed
+    response only needs to be read up to the end of its head (or the first
+    body content, for documents without an explicit head).
     
     Args:
-        html_content: Raw HTML content
+        chunks: Raw HTML content, or an iterable of chunks of it
+        max_bytes: Stop after this much input even if the head has not ended
         
     Returns:
-        Dictionary of meta tag name-value pairs
+        Dict with 'title', 'meta' (name/property -> content), 'links'
+        (rel -> href) and 'bytes_read'; the first of repeated tags wins
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    meta_tags = {}
+    if isinstance(chunks, (str, bytes)):
+        chunks = [chunks]
+    
+    head = {'title': '', 'meta': {}, 'links': {}, 'bytes_read': 0}
+    parser = etree.HTMLPullParser(events=('start', 'end'))
+    
+    def read_events() -> bool:
+        """Collect head tags from the parsed events; True once the head has ended"""
+        for event, element in parser.read_events():
+            tag = element.tag if isinstance(element.tag, str) else ''
+            
+            if event == 'start':
+                if tag == 'body':
+                    return True
+                continue
+            
+            if tag == 'head':
+                return True
+            elif tag == 'title' and not head['title']:
+                head['title'] = clean_text(element.text or '')
+            elif tag == 'meta':
+                name = element.get('name') or element.get('property')
+                content = element.get('content')
+                if name and content:
+                    head['meta'].setdefault(name, content)
+            elif tag == 'link' and element.get('href'):
+                for rel in (element.get('rel') or '').lower().split():
+                    head['links'].setdefault(rel, element.get('href'))
+        return False
     
-    for meta in soup.find_all('meta'):
-        name = meta.get('name') or meta.get('property')
-        content = meta.get('content')
-        if name and content:
-            meta_tags[name] = content
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            head['bytes_read'] += len(chunk)
+            if read_events() or (max_bytes is not None and head['bytes_read'] >= max_bytes):
+                return head
+        
+        parser.close()
+        read_events()
+    except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+        pass
     
-    return meta_tags
+    return head
+
+
+def extract_meta_tags(html_content: Union[str, bytes, Iterable[Union[str, bytes]]]) -> Dict[str, str]:
+    """
+    Extract meta tags from HTML content
+    
+    Only the document head is parsed; see parse_html_head.
+    
+    Args:
+        html_content: Raw HTML content, or an iterable of chunks of it
+        
+    Returns:
+        Dictionary of meta tag name-value pairs
+    """
+    return parse_html_head(html_content)['meta']
 
 
 def is_recent_content(date: datetime, days: int = 7) -> bool:
@@ -150,49 +218,65 @@ def extract_keywords(text: str, keywords: List[str]) -> List[str]:
     """
     Extract matching keywords from text
     
+    Keywords match whole words, case-insensitively; a trailing "*" also
+    matches longer words. The text is scanned once for all keywords.
+    
     Args:
         text: Text to search
         keywords: List of keywords to find
         
     Returns:
-        List of found keywords
+        List of found keywords, in the order given
     """
-    found_keywords = []
-    text_lower = text.lower()
-    
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            found_keywords.append(keyword)
+    if not text:
+        return []
     
-    return found_keywords
+    found = {keyword for hits in _keyword_matcher(tuple(keywords)).matches(text.lower()).values() for keyword in hits}
+    return [keyword for keyword in keywords if keyword.lower().rstrip('*') in found]
+
 
+@lru_cache(maxsize=64)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Compiled matcher for a keyword list, reused across calls"""
+    return KeywordMatcher({'keywords': keywords})
 
-def safe_request(url: str, headers: Optional[Dict] = None, timeout: int = 30) -> Optional[requests.Response]:
+
+def safe_request(url: str, headers: Optional[Dict] = None, timeout: int = 30,
+                 conditional: bool = False, client: Optional[HttpClient] = None,
+                 cache: Optional[HttpCache] = None) -> Optional[requests.Response]:
     """
     Make safe HTTP request with error handling
     
+    Goes through the shared pooled client, which applies the per-host rate
+    limiter and retries 429/5xx responses with backoff.
+    
     Args:
         url: URL to request
         headers: Optional request headers
         timeout: Request timeout in seconds
+        conditional: Send cached ETag / Last-Modified validators; the
+            response may then be a 304 with no body
+        client: HTTP client to send through, defaults to the shared one
+        cache: Conditional-GET cache holding the validators, defaults to the shared one
         
     Returns:
         Response object or None if failed
     """
     try:
-        default_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        request_headers = {}
+        
+        if conditional:
+            request_headers.update((cache or http_cache).validator_headers(url))
         
         if headers:
-            default_headers.update(headers)
+            request_headers.update(headers)
         
-        response = requests.get(url, headers=default_headers, timeout=timeout)
+        response = (client or http_client).get(url, headers=request_headers, timeout=timeout)
         response.raise_for_status()
         return response
         
     except requests.RequestException as e:
-        print(f"Request failed for {url}: {e}")
+        logger.warning(f"Request failed for {url}: {e}")
         return None
 
 
@@ -0,0 +1,98 @@
+"""
+Conditional-GET cache for Rush Gaming CI System
+
+Stores ETag / Last-Modified validators per URL together with the items
+extracted from the last full response, so a 304 can skip both the
+download and the parse.
+"""
+
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import requests
+
+from ..config import config
+from .state import json_object_hook, write_json_atomic
+
+
+class HttpCache:
+    """On-disk validator + payload cache, one JSON file per URL"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else config.http_cache_dir
+
+    def _path(self, url: str) -> Path:
+        """Cache file path for a URL"""
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the cache entry for a URL
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Entry with etag, last_modified and payload, or None
+        """
+        path = self._path(url)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                return json.load(f, object_hook=json_object_hook)
+        except (OSError, ValueError):
+            return None
+
+    def validator_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a URL"""
+        entry = self.get(url)
+        headers = {}
+
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        return headers
+
+    def load_payload(self, url: str) -> Optional[Any]:
+        """Get the items extracted from the last full response for a URL"""
+        entry = self.get(url)
+        return entry.get('payload') if entry else None
+
+    def store(self, url: str, response: requests.Response, payload: Any) -> None:
+        """
+        Save validators from a full response together with its extracted payload
+
+        Responses without ETag or Last-Modified are not cached.
+
+        Args:
+            url: Request URL
+            response: 200 response
+            payload: Items extracted from the response
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': datetime.now(),
+            'payload': payload
+        }
+
+        write_json_atomic(self._path(url), entry)
+
+
+# Shared cache used by safe_request and DataFetcher
+http_cache = HttpCache()
@@ -0,0 +1,387 @@
+"""
+Shared HTTP client for Rush Gaming CI System
+
+One pooled keep-alive session with retries and compression, used by
+safe_request and every DataFetcher path. Requests respect per-host circuit
+breakers and the caller's time budget, and can optionally be hedged.
+Responses can be recorded to, and replayed from, the raw response archive.
+"""
+
+import io
+import threading
+from contextvars import copy_context
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, Optional, Union, Tuple, Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from ..config import config
+from .rate_limiter import rate_limiter
+from .circuit_breaker import HostCircuitBreakers, circuit_breakers
+from .deadline import clip_timeout, remaining
+from .archive import ResponseArchive
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Statuses worth retrying with backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class BudgetRetry(Retry):
+    """
+    Retry policy that never waits past the caller's time budget
+
+    Retry-After and backoff sleeps are clipped to the time left, and no
+    retry is attempted once the budget is spent.
+    """
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        left = remaining()
+        if retry_after is None or left is None:
+            return retry_after
+        return max(0.0, min(retry_after, left))
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        left = remaining()
+        if left is None:
+            return backoff
+        return max(0.0, min(backoff, left))
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        left = remaining()
+        if left is not None and left <= 0:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class HttpClient:
+    """Pooled HTTP client with per-host connection pools, retries and timeouts"""
+
+    def __init__(self,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 retries: Optional[int] = None,
+                 backoff_factor: Optional[float] = None,
+                 connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None,
+                 hedge_after: Optional[float] = None,
+                 breakers: Optional[HostCircuitBreakers] = None,
+                 archive: Optional[ResponseArchive] = None):
+        """
+        Args:
+            pool_connections: Number of per-host pools kept alive
+            pool_maxsize: Connections kept per host
+            retries: Retry attempts for connection errors and 429/5xx responses
+            backoff_factor: Exponential backoff factor between retries
+            connect_timeout: Default connect timeout in seconds
+            read_timeout: Default read timeout in seconds
+            hedge_after: Send a duplicate request if the first has not answered
+                within this many seconds; 0 disables hedging
+            breakers: Per-host circuit breakers, defaults to the shared ones
+            archive: Archive every full response here, defaults to one in
+                config.archive_dir when ARCHIVE_ENABLED is set
+        """
+        self.connect_timeout = connect_timeout if connect_timeout is not None else config.http_connect_timeout
+        self.read_timeout = read_timeout if read_timeout is not None else config.http_read_timeout
+        self.hedge_after = hedge_after if hedge_after is not None else config.http_hedge_after_seconds
+        self.breakers = breakers if breakers is not None else circuit_breakers
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_pool_lock = threading.Lock()
+        
+        if archive is None and config.archive_enabled:
+            archive = ResponseArchive()
+        self.archive = archive
+        
+        # Set by replay(): serve requests from the archive instead of the network
+        self._replaying = False
+        self._replay_as_of: Optional[datetime] = None
+
+        retry = BudgetRetry(
+            total=retries if retries is not None else config.http_retries,
+            backoff_factor=backoff_factor if backoff_factor is not None else config.http_backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or config.http_pool_connections,
+            pool_maxsize=pool_maxsize or config.http_pool_maxsize,
+            max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': DEFAULT_USER_AGENT,
+            'Connection': 'keep-alive',
+            # Only encodings requests can decode without optional packages such as brotli
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[Union[float, Tuple[float, float]]] = None, **kwargs) -> requests.Response:
+        """
+        Send a GET request through the shared pool
+
+        Fails fast when the host's circuit is open or the caller's time
+        budget is spent, clips the timeout to the budget left and waits on
+        the per-host rate limiter before sending. Connection errors and 5xx
+        responses count as failures towards the host's circuit breaker.
+        200 responses are archived when an archive is set, streamed ones
+        once their .raw body has been read to the end (bodies cut short,
+        like link previews, are not); in replay mode the archived response
+        is returned instead.
+
+        Args:
+            url: URL to request
+            headers: Extra request headers
+            timeout: Read timeout in seconds, or a (connect, read) tuple
+            **kwargs: Passed through to requests.Session.get
+
+        Returns:
+            Response object
+
+        Raises:
+            requests.RequestException: On connection errors once retries are exhausted
+            CircuitOpenError: When the host's circuit is open
+            DeadlineExceeded: When the time budget is already spent
+        """
+        if self._replaying:
+            return self._replay(url, kwargs.get('params'))
+        
+        timeout = self._request_timeout(url, timeout)
+
+        try:
+            if self.hedge_after > 0:
+                response = self._hedged_get(url, headers, timeout, kwargs)
+            else:
+                response = self._send(url, headers, timeout, kwargs)
+        except requests.RequestException:
+            self.breakers.record_failure(url)
+            raise
+
+        self._record_status(url, response)
+        
+        if self.archive is not None and response.status_code == 200:
+            full_url = _full_url(url, kwargs.get('params'))
+            if kwargs.get('stream'):
+                self._archive_when_read(full_url, response)
+            else:
+                self.archive.record(full_url, response)
+        
+        return response
+    
+    def post(self, url: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[Union[float, Tuple[float, float]]] = None, **kwargs) -> requests.Response:
+        """
+        Send a POST request through the shared pool
+        
+        Goes through the same circuit breaker, time budget and rate limiter
+        as get(), but is never retried, hedged, archived or replayed.
+        
+        Args:
+            url: URL to post to
+            data: Form fields
+            headers: Extra request headers
+            timeout: Read timeout in seconds, or a (connect, read) tuple
+            **kwargs: Passed through to requests.Session.post
+        
+        Returns:
+            Response object
+        
+        Raises:
+            requests.RequestException: On connection errors, and in replay mode
+            CircuitOpenError: When the host's circuit is open
+            DeadlineExceeded: When the time budget is already spent
+        """
+        if self._replaying:
+            raise requests.ConnectionError(f"POST {url} is not sent while replaying the archive")
+        
+        timeout = self._request_timeout(url, timeout)
+        
+        try:
+            rate_limiter.acquire(url)
+            response = self.session.post(url, data=data, headers=headers, timeout=timeout, **kwargs)
+        except requests.RequestException:
+            self.breakers.record_failure(url)
+            raise
+        
+        self._record_status(url, response)
+        return response
+    
+    def replay(self, archive: ResponseArchive, as_of: Optional[datetime] = None) -> None:
+        """
+        Serve every later request from the archive, without touching the network
+        
+        Meant for a client of its own, as the switch is not undone; the
+        shared client keeps serving live requests.
+        
+        Args:
+            archive: Archive to replay
+            as_of: Replay the fetches made at or before this time, defaults to the latest
+        """
+        self.archive = archive
+        self._replay_as_of = as_of
+        self._replaying = True
+    
+    def close(self) -> None:
+        """Close the pooled connections and the hedged request workers"""
+        self.session.close()
+        with self._hedge_pool_lock:
+            if self._hedge_pool is not None:
+                self._hedge_pool.shutdown(wait=False)
+                self._hedge_pool = None
+    
+    def _request_timeout(self, url: str, timeout: Optional[Union[float, Tuple[float, float]]]) -> Tuple[float, float]:
+        """(connect, read) timeout for a request, clipped to the time budget, once the host's circuit allows it"""
+        if timeout is None:
+            timeout = (self.connect_timeout, self.read_timeout)
+        elif not isinstance(timeout, tuple):
+            timeout = (min(self.connect_timeout, timeout), timeout)
+
+        # Clip first: a spent budget must not take the breaker's half-open trial
+        timeout = clip_timeout(timeout)
+        self.breakers.check(url)
+        return timeout
+    
+    def _record_status(self, url: str, response: requests.Response) -> None:
+        """Count a 5xx response as a failure towards the host's circuit breaker"""
+        if response.status_code >= 500:
+            self.breakers.record_failure(url)
+        else:
+            self.breakers.record_success(url)
+    
+    def _archive_when_read(self, full_url: str, response: requests.Response) -> None:
+        """Archive a streamed response once the caller has read its raw body to the end"""
+        raw = response.raw
+        archive = self.archive
+        
+        def record(body: bytes) -> None:
+            # Bytes read without decoding still carry the wire encoding the archive strips
+            if getattr(raw, 'decode_content', True) or 'Content-Encoding' not in response.headers:
+                archive.record(full_url, response, body)
+        
+        response.raw = _ArchivingStream(raw, record)
+    
+    def _replay(self, url: str, params: Optional[Dict[str, Any]]) -> requests.Response:
+        """Latest archived response for a URL, as of the replay time"""
+        full_url = _full_url(url, params)
+        entry = self.archive.lookup(full_url, self._replay_as_of)
+        if entry is None:
+            raise requests.ConnectionError(f"{full_url} is not in the response archive")
+        
+        try:
+            return self.archive.load(entry)
+        except OSError as e:
+            raise requests.ConnectionError(f"Archived body for {full_url} is unreadable: {e}")
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]],
+              timeout: Tuple[float, float], kwargs: Dict[str, Any]) -> requests.Response:
+        """Send one rate-limited GET"""
+        rate_limiter.acquire(url)
+        return self.session.get(url, headers=headers, timeout=timeout, **kwargs)
+
+    def _hedged_get(self, url: str, headers: Optional[Dict[str, str]],
+                    timeout: Tuple[float, float], kwargs: Dict[str, Any]) -> requests.Response:
+        """
+        Send a GET, and a duplicate if the first is slow; return whichever answers first
+
+        Only the first request's failure is ignored while the duplicate is
+        still in flight. The losing response is closed in the background.
+        """
+        pool = self._get_hedge_pool()
+        # Each send runs in the caller's context so retries see its time budget
+        primary = pool.submit(copy_context().run, self._send, url, headers, timeout, kwargs)
+
+        done, _ = wait([primary], timeout=self.hedge_after)
+        if done:
+            return primary.result()
+
+        hedge = pool.submit(copy_context().run, self._send, url, headers, timeout, kwargs)
+        pending = {primary, hedge}
+        failed = primary
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winners = [future for future in done if future.exception() is None]
+            if winners:
+                for loser in pending | set(winners[1:]):
+                    loser.add_done_callback(_close_response)
+                return winners[0].result()
+            failed = next(iter(done))
+
+        # Both requests failed
+        return failed.result()
+
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        """Create the worker pool for hedged requests on first use"""
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=max(2, config.fetch_max_concurrency * 2),
+                    thread_name_prefix='rush-ci-hedge'
+                )
+            return self._hedge_pool
+
+
+class _ArchivingStream(io.RawIOBase):
+    """Raw response stream that hands every byte read to a callback once it reaches the end"""
+
+    def __init__(self, raw, on_complete: Callable[[bytes], None]):
+        self._raw = raw
+        self._on_complete = on_complete
+        self._body: Optional[io.BytesIO] = io.BytesIO()
+
+    @property
+    def decode_content(self) -> bool:
+        return self._raw.decode_content
+
+    @decode_content.setter
+    def decode_content(self, value: bool) -> None:
+        self._raw.decode_content = value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._raw.read(len(buffer))
+        buffer[:len(data)] = data
+
+        if self._body is not None:
+            if data:
+                self._body.write(data)
+            else:
+                body, self._body = self._body.getvalue(), None
+                self._on_complete(body)
+        return len(data)
+
+    def close(self) -> None:
+        self._raw.close()
+        super().close()
+
+
+def _full_url(url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Request URL with its query parameters, as the archive keys it"""
+    if not params:
+        return url
+    return requests.Request('GET', url, params=params).prepare().url
+
+
+def _close_response(future: Future) -> None:
+    """Release the connection held by a hedged request that lost the race"""
+    if future.exception() is None:
+        future.result().close()
+
+
+# Shared client used by safe_request and DataFetcher
+http_client = HttpClient()
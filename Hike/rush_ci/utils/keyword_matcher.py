@@ -0,0 +1,136 @@
+"""
+Multi-keyword matcher for Rush Gaming CI System
+
+Compiles categorised keyword lists into one Aho-Corasick automaton, so a
+text is checked against every keyword in a single linear scan instead of
+one substring search per keyword. Keywords match whole words only, so
+"pr" does not match "product"; a trailing "*" lets a keyword match as a
+word prefix ("launch*" matches "launched" and "launches").
+"""
+
+from collections import deque
+from typing import Dict, List, Iterable, Iterator, NamedTuple, Tuple
+
+
+class KeywordMatch(NamedTuple):
+    """One keyword occurrence in a text"""
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over keyword lists, matching on word boundaries"""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Args:
+            categories: Category -> keywords; keywords are matched case-sensitively
+                against lowercased text, so they are lowercased here
+        """
+        # Per keyword entry: (keyword without "*", category, is_prefix), in registration order
+        self._entries: List[Tuple[str, str, bool]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                self._add(keyword.lower(), category)
+
+        self._build_failure_links()
+
+    def _add(self, keyword: str, category: str) -> None:
+        """Add one keyword to the trie"""
+        is_prefix = keyword.endswith('*')
+        keyword = keyword.rstrip('*')
+        if not keyword:
+            return
+
+        state = 0
+        for char in keyword:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+
+        self._output[state].append(len(self._entries))
+        self._entries.append((keyword, category, is_prefix))
+
+    def _build_failure_links(self) -> None:
+        """Point every state at its longest proper suffix state, breadth first"""
+        # States one character deep fail back to the root, which they were initialised to
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _scan(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (keyword entry, end offset) for every whole-word occurrence, in one pass"""
+        goto, fail, output, entries = self._goto, self._fail, self._output, self._entries
+        length = len(text)
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for entry_id in output[state]:
+                keyword, _, is_prefix = entries[entry_id]
+                start = index - len(keyword) + 1
+                end = index + 1
+
+                if start > 0 and _is_word_char(keyword[0]) and _is_word_char(text[start - 1]):
+                    continue
+                if not is_prefix and end < length and _is_word_char(keyword[-1]) and _is_word_char(text[end]):
+                    continue
+
+                yield entry_id, end
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every keyword occurrence in a text
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Matches in order of where they end in the text
+        """
+        matches = []
+        for entry_id, end in self._scan(text):
+            keyword, category, _ = self._entries[entry_id]
+            matches.append(KeywordMatch(keyword, category, end - len(keyword), end))
+        return matches
+
+    def matches(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find which keywords of each category occur in a text
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Category -> distinct keywords found (without "*"), in the order
+            they were registered; categories without a hit are left out
+        """
+        hits: Dict[str, List[str]] = {}
+        for entry_id in sorted({entry_id for entry_id, _ in self._scan(text)}):
+            keyword, category, _ = self._entries[entry_id]
+            hits.setdefault(category, []).append(keyword)
+        return hits
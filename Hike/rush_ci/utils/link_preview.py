@@ -0,0 +1,188 @@
+"""
+Link previews for Rush Gaming CI System
+
+Reads the OpenGraph / Twitter card metadata of item URLs by streaming each
+page only up to its </head>, and caches the preview by canonical URL, so
+hundreds of links cost a few kilobytes each and are fetched once.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse, urljoin
+
+import requests
+
+from ..config import config
+from .logger import get_logger
+from .helpers import parse_html_head
+from .http_client import HttpClient, http_client
+from .dates import date_parser
+from .state import JsonStateStore
+from .articles import canonical_url
+
+logger = get_logger(__name__)
+
+# Bytes read from the response per parser feed
+HEAD_CHUNK_SIZE = 8192
+
+# Meta names tried in order for each preview field
+PREVIEW_FIELDS = {
+    'title': ['og:title', 'twitter:title'],
+    'description': ['og:description', 'twitter:description', 'description'],
+    'image': ['og:image', 'og:image:url', 'og:image:secure_url', 'twitter:image', 'twitter:image:src'],
+    'site_name': ['og:site_name', 'application-name'],
+    'type': ['og:type']
+}
+
+# Meta names carrying the publish date
+PUBLISHED_META = ['article:published_time', 'og:article:published_time', 'datePublished', 'date', 'pubdate',
+                  'publish-date', 'dc.date', 'DC.date.issued']
+
+
+def build_preview(head: Dict[str, Any], url: str) -> Dict[str, Any]:
+    """
+    Turn a parsed document head into a link preview
+
+    Args:
+        head: Output of parse_html_head
+        url: Final page URL, used to resolve relative links
+
+    Returns:
+        Dict with title, description, image, site_name, type, canonical
+        and published_at (each None when the page does not declare it)
+    """
+    meta = head['meta']
+
+    def first(names: List[str]) -> Optional[str]:
+        return next((meta[name].strip() for name in names if meta.get(name, '').strip()), None)
+
+    preview = {field: first(names) for field, names in PREVIEW_FIELDS.items()}
+    preview['title'] = preview['title'] or head['title'] or None
+
+    if preview['image']:
+        preview['image'] = urljoin(url, preview['image'])
+
+    canonical = head['links'].get('canonical') or meta.get('og:url')
+    preview['canonical'] = urljoin(url, canonical) if canonical else None
+
+    published = first(PUBLISHED_META)
+    preview['published_at'] = date_parser.parse(published, source=f"{urlparse(url).netloc}:meta") if published else None
+
+    return preview
+
+
+class LinkPreviewFetcher:
+    """Adds cached head-only link previews to items, fetching only unknown URLs"""
+
+    def __init__(self, store: Optional[JsonStateStore] = None, max_workers: Optional[int] = None,
+                 max_bytes: Optional[int] = None, ttl_days: Optional[float] = None,
+                 client: Optional[HttpClient] = None):
+        """
+        Args:
+            store: Preview cache, keyed by canonical URL
+            max_workers: Parallel downloads, defaults to config.link_preview_workers
+            max_bytes: Most bytes read from a page, defaults to config.link_preview_max_bytes
+            ttl_days: Age after which a preview is fetched again, defaults to config.link_preview_ttl_days
+            client: HTTP client to read pages through, defaults to the shared one
+        """
+        self.store = store if store is not None else JsonStateStore('link_previews')
+        self.max_workers = max(1, max_workers or config.link_preview_workers)
+        self.max_bytes = max_bytes or config.link_preview_max_bytes
+        self.ttl = timedelta(days=ttl_days if ttl_days is not None else config.link_preview_ttl_days)
+        self.client = client
+
+    def enrich(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Attach a 'preview' to each item whose URL could be read
+
+        Args:
+            items: Items with 'url'
+
+        Returns:
+            The same items, updated in place
+        """
+        previews = self.fetch([item.get('url') for item in items if item.get('url')])
+
+        for item in items:
+            preview = previews.get(item.get('url'))
+            if preview is not None:
+                item['preview'] = preview
+
+        return items
+
+    def fetch(self, urls: List[str], refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get previews from the cache, reading the missing pages' heads in parallel
+
+        Args:
+            urls: Page URLs
+            refresh: Fetch every URL even if a fresh preview is cached
+
+        Returns:
+            URL -> preview, for the pages that could be read
+        """
+        previews: Dict[str, Dict[str, Any]] = {}
+        # Canonical URL -> the requested variants of it, fetched once
+        missing: Dict[str, List[str]] = {}
+        now = datetime.now()
+
+        for url in dict.fromkeys(urls):
+            key = canonical_url(url)
+            entry = None if refresh else self.store.get(key)
+            if entry is not None and now - entry['fetched_at'] < self.ttl:
+                previews[url] = entry
+            else:
+                missing.setdefault(key, []).append(url)
+
+        if not missing:
+            return previews
+
+        logger.info(f"Fetching link previews for {len(missing)} URLs")
+        fetched: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+            # Copy the caller's context so its time budget applies to the downloads
+            futures = {
+                key: executor.submit(contextvars.copy_context().run, self._fetch_preview, variants[0])
+                for key, variants in missing.items()
+            }
+            for key, future in futures.items():
+                preview = future.result()
+                if preview is not None:
+                    fetched[key] = preview
+                    previews.update(dict.fromkeys(missing[key], preview))
+
+        if fetched:
+            expired = [key for key, entry in self.store.all().items() if now - entry['fetched_at'] >= self.ttl]
+            self.store.update(fetched, remove=expired)
+
+        return previews
+
+    def _fetch_preview(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stream one page up to its </head> and build its preview; None if it could not be read"""
+        response = None
+        try:
+            response = (self.client or http_client).get(url, stream=True)
+            if response.status_code != 200:
+                return None
+
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type.lower():
+                return None
+
+            head = parse_html_head(response.iter_content(HEAD_CHUNK_SIZE), self.max_bytes)
+            logger.debug(f"Read {head['bytes_read']} bytes of {url} for its preview")
+
+            preview = build_preview(head, response.url or url)
+            preview['fetched_at'] = datetime.now()
+            return preview
+
+        except requests.RequestException as e:
+            logger.debug(f"Could not fetch link preview for {url}: {e}")
+            return None
+
+        finally:
+            if response is not None:
+                # Drops the connection instead of draining the rest of the body
+                response.close()
@@ -37,6 +37,8 @@ def setup_logger(
     logger.setLevel(getattr(logging, level.upper()))
     
     # Clear existing handlers
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
     # Create formatters
@@ -53,8 +55,8 @@ def setup_logger(
     console_handler.setFormatter(simple_formatter)
     logger.addHandler(console_handler)
     
-    # File handler
-    file_handler = logging.FileHandler(log_file)
+    # File handler, opened on the first record so importing the package creates no file
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
     logger.addHandler(file_handler)
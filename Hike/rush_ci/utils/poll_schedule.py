@@ -0,0 +1,104 @@
+"""
+Adaptive polling cadence for Rush Gaming CI System
+
+Each (competitor, source) unit keeps a smoothed estimate of how many new
+items it publishes per hour and is polled about once per expected new
+item, within per-source minimum and maximum intervals. High-priority
+competitors are polled more often, and sources that stay quiet back off.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from ..config import config
+from .logger import get_logger
+from .state import JsonStateStore
+
+logger = get_logger(__name__)
+
+
+class PollScheduler:
+    """Per-unit next-poll times derived from observed publish rates"""
+
+    def __init__(self, store: Optional[JsonStateStore] = None):
+        """
+        Args:
+            store: Schedule store, keyed by "<competitor>:<source>"
+        """
+        self.store = store if store is not None else JsonStateStore('poll_schedule')
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(competitor_key: str, source_type: str) -> str:
+        return f"{competitor_key}:{source_type}"
+
+    def is_due(self, competitor_key: str, source_type: str, now: Optional[datetime] = None) -> bool:
+        """Whether a unit's next poll time has come; units never polled are always due"""
+        entry = self.store.get(self._key(competitor_key, source_type))
+        return entry is None or entry['next_poll'] <= (now or datetime.now())
+
+    def observe(self, competitor_key: str, competitor_config: Dict[str, Any], source_type: str,
+                new_items: int, now: Optional[datetime] = None) -> datetime:
+        """
+        Record a successful poll and work out when to poll the unit next
+
+        The observed rate (new items per hour since the last poll) is folded
+        into an exponentially weighted average. A unit's first poll sees the
+        initial WATERMARK_INITIAL_DAYS window, which seeds the estimate. The
+        update is held until commit().
+
+        Args:
+            competitor_key: Competitor key from competitors.json
+            competitor_config: Competitor configuration, for its "priority"
+            source_type: Source type
+            new_items: Items the poll delivered that had not been seen before
+            now: Poll time, defaults to now
+
+        Returns:
+            Next poll time
+        """
+        now = now or datetime.now()
+        key = self._key(competitor_key, source_type)
+        min_minutes, max_minutes = config.poll_intervals[source_type]
+        previous = self.store.get(key)
+
+        if previous is None:
+            hours = config.watermark_initial_days * 24
+            rate = new_items / hours
+            interval = min_minutes
+        else:
+            hours = max((now - previous['last_polled']).total_seconds() / 3600, 1 / 60)
+            alpha = config.poll_rate_smoothing
+            rate = alpha * (new_items / hours) + (1 - alpha) * previous['rate']
+            interval = previous['interval_minutes']
+
+        if rate > 0:
+            # Aim for about one new item per poll
+            interval = 60 / rate
+        else:
+            interval = interval * 2
+
+        interval *= config.poll_priority_factors.get(competitor_config.get('priority'), 1.0)
+        interval = min(max(interval, min_minutes), max_minutes)
+
+        entry = {
+            'rate': rate,
+            'interval_minutes': interval,
+            'last_polled': now,
+            'next_poll': now + timedelta(minutes=interval)
+        }
+        with self._lock:
+            self._pending[key] = entry
+
+        logger.debug(f"Next {source_type} poll for {competitor_key} in {interval:.0f} minutes ({rate:.3f} items/hour)")
+        return entry['next_poll']
+
+    def commit(self) -> None:
+        """Persist the schedule updates of the current run"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if pending:
+            self.store.update(pending)
@@ -0,0 +1,91 @@
+"""
+Per-host rate limiting for Rush Gaming CI System
+
+Token buckets keyed by host, so requests only wait when the same host
+is hit again too soon.
+"""
+
+import time
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+from ..config import config
+
+
+def host_key(url_or_host: str) -> str:
+    """Get the key requests to a URL or bare host name are limited under"""
+    host = urlparse(url_or_host).netloc if '://' in url_or_host else url_or_host
+    return host.lower()
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second up to `burst`"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, allowing the balance to go negative
+
+        Returns:
+            Seconds the caller must wait before the token is usable
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+
+            if self.tokens >= 0 or self.rate <= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """Token bucket rate limiter with one bucket per host"""
+
+    def __init__(self, limits: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            limits: {"default": {"rate", "burst"}, "hosts": {host: {"rate", "burst"}}},
+                defaults to config.rate_limits
+        """
+        self.limits = limits if limits is not None else config.rate_limits
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        """Get or create the bucket for a host"""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                host_limits = self.limits.get('hosts', {}).get(host) or self.limits.get('default', {})
+                bucket = TokenBucket(float(host_limits.get('rate', 0.5)), float(host_limits.get('burst', 2)))
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url_or_host: str) -> float:
+        """
+        Block until a request to the host is allowed
+
+        Args:
+            url_or_host: Full URL or bare host name
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self._bucket_for(host_key(url_or_host)).reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+# Shared limiter used by safe_request and DataFetcher
+rate_limiter = HostRateLimiter()
@@ -0,0 +1,190 @@
+"""
+Sitemap change detection for Rush Gaming CI System
+
+Streams sitemap.xml / sitemap index files (plain or gzipped) and compares
+each URL's <lastmod> with the snapshot from the previous run, so only new
+or changed pages need to be fetched.
+"""
+
+import io
+import gzip
+from typing import Dict, Iterator, List, Any, Optional, Tuple, BinaryIO, Callable
+from urllib.parse import urlparse
+
+import requests
+from lxml import etree
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Nested sitemap indexes followed at most this deep
+MAX_INDEX_DEPTH = 3
+
+
+def open_sitemap_stream(response: requests.Response) -> BinaryIO:
+    """
+    Wrap a streamed sitemap response as a readable, decompressed byte stream
+
+    Transfer encodings are decoded by urllib3; .xml.gz files served as
+    plain bytes are detected by their gzip magic number.
+    """
+    raw = response.raw
+    if hasattr(raw, 'decode_content'):
+        raw.decode_content = True
+
+    stream = io.BufferedReader(raw)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def iter_sitemap(stream: BinaryIO) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Stream the entries of a sitemap or sitemap index
+
+    Elements are discarded as soon as they are read, so memory stays flat
+    however large the file is.
+
+    Args:
+        stream: Decompressed sitemap bytes
+
+    Yields:
+        (kind, loc, lastmod) where kind is 'sitemap' for index entries and
+        'url' for pages; lastmod is the raw string or None
+    """
+    context = etree.iterparse(stream, events=('end',), recover=True, resolve_entities=False, no_network=True)
+
+    for _, element in context:
+        tag = etree.QName(element).localname if isinstance(element.tag, str) else ''
+        if tag not in ('url', 'sitemap'):
+            continue
+
+        loc = lastmod = None
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+            name = etree.QName(child).localname
+            if name == 'loc':
+                loc = (child.text or '').strip()
+            elif name == 'lastmod':
+                lastmod = (child.text or '').strip() or None
+
+        if loc:
+            yield tag, loc, lastmod
+
+        # Free the finished entry and any already-processed siblings
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+class SitemapWatcher:
+    """Diffs a site's sitemap against the lastmod snapshot from the last run"""
+
+    def __init__(self, fetch: Callable[[str], Optional[requests.Response]]):
+        """
+        Args:
+            fetch: Callable returning a streamed response for a URL, or None on failure
+        """
+        self.fetch = fetch
+
+    def changes(self, sitemap_url: str, url_prefix: str,
+                snapshot: Dict[str, Dict[str, Any]]) -> Optional[Tuple[List[Tuple[str, Optional[str]]], Dict[str, Dict[str, Any]]]]:
+        """
+        Find pages under a prefix that are new or whose lastmod changed
+
+        Child sitemaps of an index are only downloaded when their own
+        lastmod changed, so an unchanged index costs a single request.
+
+        Args:
+            sitemap_url: Sitemap or sitemap index URL
+            url_prefix: Only pages starting with this are reported (e.g. the blog URL)
+            snapshot: Sitemap file URL -> {'lastmod', 'pages': {loc: lastmod}} from the last run
+
+        Returns:
+            Tuple of ([(loc, lastmod) new or changed], updated snapshot),
+            or None if the sitemap could not be read
+        """
+        seen_pages = {
+            loc: lastmod
+            for entry in snapshot.values()
+            for loc, lastmod in entry.get('pages', {}).items()
+        }
+        changed: List[Tuple[str, Optional[str]]] = []
+        current: Dict[str, Dict[str, Any]] = {}
+
+        if not self._walk(sitemap_url, None, url_prefix, snapshot, seen_pages, current, changed, depth=0):
+            return None
+
+        return changed, current
+
+    def _walk(self, sitemap_url: str, lastmod: Optional[str], url_prefix: str,
+              snapshot: Dict[str, Dict[str, Any]], seen_pages: Dict[str, Optional[str]],
+              current: Dict[str, Dict[str, Any]], changed: List[Tuple[str, Optional[str]]], depth: int) -> bool:
+        """Read one sitemap file, recursing into changed children; False if it could not be read"""
+        response = self.fetch(sitemap_url)
+        if response is None or response.status_code != 200:
+            return False
+
+        children = []
+        pages: Dict[str, Optional[str]] = {}
+        try:
+            for kind, loc, loc_lastmod in iter_sitemap(open_sitemap_stream(response)):
+                if kind == 'sitemap':
+                    children.append((loc, loc_lastmod))
+                elif loc.startswith(url_prefix):
+                    pages[loc] = loc_lastmod
+                    if loc not in seen_pages or (loc_lastmod and seen_pages[loc] != loc_lastmod):
+                        changed.append((loc, loc_lastmod))
+        except (etree.XMLSyntaxError, OSError, EOFError) as e:
+            logger.warning(f"Could not read sitemap {sitemap_url}: {e}")
+            return False
+        finally:
+            response.close()
+
+        current[sitemap_url] = {'lastmod': lastmod, 'pages': pages}
+
+        for child_url, child_lastmod in children:
+            if depth >= MAX_INDEX_DEPTH:
+                break
+
+            previous = snapshot.get(child_url)
+            if previous and child_lastmod and previous.get('lastmod') == child_lastmod:
+                # Unchanged child sitemap: carry its pages over without downloading it
+                current[child_url] = previous
+                continue
+
+            if not self._walk(child_url, child_lastmod, url_prefix, snapshot, seen_pages, current, changed, depth + 1) and previous:
+                # Keep the old snapshot so its pages are not reported as new next time
+                current[child_url] = previous
+
+        return True
+
+
+def sitemap_candidates(site_url: str, robots_txt: Optional[str]) -> List[str]:
+    """
+    Sitemap URLs to try for a site
+
+    Args:
+        site_url: Any URL on the site
+        robots_txt: Contents of /robots.txt, if it could be fetched
+
+    Returns:
+        Sitemaps declared in robots.txt, then the conventional locations
+    """
+    parsed = urlparse(site_url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    candidates = []
+
+    for line in (robots_txt or '').splitlines():
+        if line.lower().startswith('sitemap:'):
+            candidates.append(line.split(':', 1)[1].strip())
+
+    for path in ('/sitemap.xml', '/sitemap_index.xml'):
+        if origin + path not in candidates:
+            candidates.append(origin + path)
+
+    return candidates
@@ -0,0 +1,154 @@
+"""
+Persistent fetch state for Rush Gaming CI System
+
+Small JSON-backed key/value stores for what the fetcher learns between
+runs (feed locations, job board adapters, watermarks, ...). The scheduler
+and the web app share these files, so every write re-reads the file under
+an exclusive lock and only changes its own keys.
+"""
+
+import os
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Iterable, Iterator, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are still merged, but not locked across processes
+    fcntl = None
+
+from ..config import config
+
+
+def json_default(obj: Any) -> Any:
+    """JSON encoder hook preserving datetimes"""
+    if isinstance(obj, datetime):
+        return {'$datetime': obj.isoformat()}
+    return str(obj)
+
+
+def json_object_hook(obj: Dict[str, Any]) -> Any:
+    """JSON object hook reviving datetimes written by json_default"""
+    if len(obj) == 1 and '$datetime' in obj:
+        return datetime.fromisoformat(obj['$datetime'])
+    return obj
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temp file and rename it over the target"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, default=json_default, indent=2)
+    os.replace(tmp_path, path)
+
+
+class JsonStateStore:
+    """Thread- and process-safe key/value store persisted as a single JSON file"""
+
+    def __init__(self, name: str, state_dir: Optional[Path] = None):
+        """
+        Args:
+            name: Store name, used as the file name
+            state_dir: Directory for state files, defaults to config.state_dir
+        """
+        self.path = Path(state_dir if state_dir is not None else config.state_dir) / f"{name}.json"
+        self._lock = threading.RLock()
+        self._data: Optional[Dict[str, Any]] = None
+        # (inode, mtime, size) of the file the in-memory copy was read from or written to
+        self._stamp: Optional[Tuple[int, int, int]] = None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """(inode, mtime, size) of the store file, or None if it does not exist"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the store from disk, again whenever another process has rewritten it"""
+        stamp = self._file_stamp()
+        if self._data is None or stamp != self._stamp:
+            try:
+                with open(self.path, 'r') as f:
+                    self._data = json.load(f, object_hook=json_object_hook)
+            except (OSError, ValueError):
+                self._data = {}
+            self._stamp = stamp
+        return self._data
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict[str, Any]]:
+        """Hold the store's file lock and yield its current contents for changing in place"""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_suffix('.lock'), 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield self._load()
+                    self.save()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by key"""
+        with self._lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Set a value and persist the store"""
+        with self._locked() as data:
+            data[key] = value
+
+    def update(self, values: Dict[str, Any], remove: Iterable[str] = ()) -> None:
+        """
+        Set several values and persist the store once
+
+        Args:
+            values: Key -> value to set
+            remove: Keys to drop in the same write
+        """
+        with self._locked() as data:
+            for key in remove:
+                data.pop(key, None)
+            data.update(values)
+
+    def merge(self, values: Dict[str, Any], combine: Callable[[Any, Any], Any]) -> None:
+        """
+        Combine several values with the stored ones and persist the store once
+
+        Args:
+            values: Key -> new value
+            combine: Called with (stored value or None, new value), returns the value to store
+        """
+        with self._locked() as data:
+            for key, value in values.items():
+                data[key] = combine(data.get(key), value)
+
+    def delete(self, key: str) -> None:
+        """Remove a key and persist the store"""
+        with self._locked() as data:
+            data.pop(key, None)
+
+    def all(self) -> Dict[str, Any]:
+        """Get a shallow copy of every entry"""
+        with self._lock:
+            return dict(self._load())
+
+    def reload(self) -> None:
+        """Drop the in-memory copy so the next access re-reads the file"""
+        with self._lock:
+            self._data = None
+
+    def save(self) -> None:
+        """Write the in-memory copy to disk"""
+        with self._lock:
+            write_json_atomic(self.path, self._data if self._data is not None else {})
+            self._stamp = self._file_stamp()
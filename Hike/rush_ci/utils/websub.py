@@ -0,0 +1,282 @@
+"""
+WebSub (PubSubHubbub) subscriber for Rush Gaming CI System
+
+Feeds that advertise a hub are subscribed to with a callback on the web
+app, so the hub pushes new posts within seconds instead of them waiting
+for the next scheduled fetch. Each subscription gets a random callback
+token, verifications are only confirmed for a request we have pending,
+and pushed bodies are authenticated with the subscription's secret
+before they are trusted.
+"""
+
+import io
+import hmac
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple, Mapping
+
+import requests
+from lxml import etree
+
+from ..config import config
+from .logger import get_logger
+from .state import JsonStateStore
+from .http_client import http_client
+
+logger = get_logger(__name__)
+
+# X-Hub-Signature algorithms a hub may sign with
+SIGNATURE_ALGORITHMS = {
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha384': hashlib.sha384,
+    'sha512': hashlib.sha512
+}
+
+# Leases are renewed once they have less than this left
+RENEW_BEFORE = timedelta(days=1)
+
+
+def find_hub(response: requests.Response) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the hub a feed advertises and the topic URL to subscribe to
+
+    HTTP Link headers take precedence; otherwise the feed's own
+    <link rel="hub"> / <link rel="self"> (RSS atom:link or Atom link) are
+    read, stopping at the first item.
+
+    Args:
+        response: Feed response
+
+    Returns:
+        Tuple of (hub URL or None, self URL or None)
+    """
+    links = response.links if isinstance(getattr(response, 'links', None), dict) else {}
+    hub = links.get('hub', {}).get('url')
+    topic = links.get('self', {}).get('url')
+
+    if hub:
+        return hub, topic
+
+    try:
+        for _, element in etree.iterparse(io.BytesIO(response.content), events=('start',), recover=True,
+                                          resolve_entities=False, no_network=True):
+            if not isinstance(element.tag, str):
+                continue
+            tag = etree.QName(element).localname
+            if tag in ('item', 'entry'):
+                break
+            if tag == 'link' and element.get('href'):
+                rel = element.get('rel')
+                if rel == 'hub' and not hub:
+                    hub = element.get('href')
+                elif rel == 'self' and not topic:
+                    topic = element.get('href')
+    except etree.XMLSyntaxError:
+        pass
+
+    return hub, topic
+
+
+class WebSubSubscriber:
+    """Manages hub subscriptions and authenticates their callbacks"""
+
+    def __init__(self, callback_url: Optional[str] = None, store: Optional[JsonStateStore] = None,
+                 lease_seconds: Optional[int] = None):
+        """
+        Args:
+            callback_url: Public base URL of the web app's WebSub route, defaults
+                to config.websub_callback_url; subscribing is off without one
+            store: Subscription store, keyed by random callback token
+            lease_seconds: Lease asked of the hub, defaults to config.websub_lease_seconds
+        """
+        self.callback_url = (callback_url if callback_url is not None else config.websub_callback_url).rstrip('/')
+        self.store = store if store is not None else JsonStateStore('websub_subscriptions')
+        self.lease_seconds = lease_seconds or config.websub_lease_seconds
+
+    @property
+    def enabled(self) -> bool:
+        """Whether hubs can reach us, i.e. a callback URL is configured"""
+        return bool(self.callback_url)
+
+    def token_for(self, topic: str) -> Optional[str]:
+        """Callback path token of a topic's subscription, or None if it has none"""
+        for token, record in self.store.all().items():
+            if record.get('topic') == topic:
+                return token
+        return None
+
+    def track(self, feed_url: str, hub: str, topic: Optional[str], company_name: str) -> None:
+        """
+        Make sure a feed advertising a hub is subscribed to
+
+        Subscribes when the feed has no subscription, moved hub, or its
+        lease is running out; otherwise does nothing.
+
+        Args:
+            feed_url: Feed URL the fetcher polls, whose watermark pushes advance
+            hub: Hub URL advertised by the feed
+            topic: Feed's self URL, defaults to feed_url
+            company_name: Company the feed belongs to
+        """
+        if not self.enabled:
+            return
+
+        topic = topic or feed_url
+        token = self.token_for(topic)
+        record = self.store.get(token) if token else None
+        if record and record['hub'] == hub and not self._renewal_due(record):
+            return
+
+        self.subscribe(feed_url, hub, topic, company_name)
+
+    def subscribe(self, feed_url: str, hub: str, topic: str, company_name: str) -> bool:
+        """
+        Ask a hub to push a topic to our callback
+
+        The request is stored as pending first, since hubs may verify it
+        before answering. A renewal keeps the subscription's token and secret.
+
+        Returns:
+            True if the hub accepted the request
+        """
+        token = self.token_for(topic) or secrets.token_urlsafe(32)
+        previous = self.store.get(token) or {}
+        secret = previous.get('secret') or secrets.token_hex(20)
+        self.store.set(token, {
+            'feed_url': feed_url,
+            'topic': topic,
+            'hub': hub,
+            'company': company_name,
+            'secret': secret,
+            'state': previous.get('state', 'pending'),
+            'expires_at': previous.get('expires_at'),
+            'pending_mode': 'subscribe',
+            'requested_at': datetime.now()
+        })
+
+        try:
+            response = http_client.post(hub, data={
+                'hub.mode': 'subscribe',
+                'hub.topic': topic,
+                'hub.callback': f"{self.callback_url}/{token}",
+                'hub.secret': secret,
+                'hub.lease_seconds': self.lease_seconds
+            })
+        except requests.RequestException as e:
+            logger.warning(f"WebSub subscribe to {hub} for {topic} failed: {e}")
+            return False
+
+        if response.status_code not in (202, 204):
+            logger.warning(f"WebSub hub {hub} refused {topic}: HTTP {response.status_code}")
+            return False
+
+        logger.info(f"Requested WebSub subscription to {topic} via {hub}")
+        return True
+
+    def renew_expiring(self) -> int:
+        """
+        Re-subscribe every subscription that is unverified or about to lapse
+
+        Returns:
+            Number of subscription requests sent
+        """
+        if not self.enabled:
+            return 0
+
+        renewed = 0
+        for record in self.store.all().values():
+            if self._renewal_due(record):
+                self.subscribe(record['feed_url'], record['hub'], record['topic'], record['company'])
+                renewed += 1
+        return renewed
+
+    def verify(self, token: str, params: Mapping[str, str]) -> Optional[str]:
+        """
+        Answer a hub's verification of intent
+
+        Subscribe and unsubscribe are only confirmed when they match the
+        request we have pending, and a denial only while a subscribe is
+        pending, so a forged GET cannot activate or drop a subscription.
+
+        Args:
+            token: Callback path token
+            params: Query parameters of the hub's GET
+
+        Returns:
+            The challenge to echo back, '' to acknowledge a denial, or None
+            if the request is not for a subscription we asked for
+        """
+        record = self._lookup(token)
+        mode = params.get('hub.mode')
+
+        if record is None or params.get('hub.topic') != record['topic']:
+            logger.warning(f"WebSub verification for unknown topic {params.get('hub.topic')}")
+            return None
+
+        # A denial answers a pending subscribe; other modes must be the one we requested
+        requested = 'subscribe' if mode == 'denied' else mode
+        if not requested or record.get('pending_mode') != requested:
+            logger.warning(f"WebSub {mode} verification for {record['topic']} does not match a pending request")
+            return None
+
+        if mode == 'denied':
+            logger.warning(f"WebSub hub {record['hub']} denied {record['topic']}: {params.get('hub.reason', '')}")
+            self.store.delete(token)
+            return ''
+
+        if mode == 'unsubscribe':
+            self.store.delete(token)
+        else:
+            try:
+                lease = int(params.get('hub.lease_seconds') or self.lease_seconds)
+            except ValueError:
+                lease = self.lease_seconds
+            self.store.set(token, {**record, 'state': 'active', 'pending_mode': None,
+                                   'expires_at': datetime.now() + timedelta(seconds=lease)})
+            logger.info(f"WebSub subscription to {record['topic']} active for {lease}s")
+
+        return params.get('hub.challenge', '')
+
+    def authenticate(self, token: str, body: bytes, signature: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Check that a pushed body was signed with the subscription's secret
+
+        Args:
+            token: Callback path token
+            body: Raw request body
+            signature: X-Hub-Signature header, e.g. "sha256=<hex>"
+
+        Returns:
+            The subscription record, or None if the push must be ignored
+        """
+        record = self._lookup(token)
+        if record is None or not signature:
+            return None
+
+        algorithm, _, digest = signature.partition('=')
+        hash_function = SIGNATURE_ALGORITHMS.get(algorithm.lower())
+        if hash_function is None:
+            return None
+
+        expected = hmac.new(record['secret'].encode('utf-8'), body, hash_function).hexdigest()
+        if not hmac.compare_digest(expected, digest.lower()):
+            logger.warning(f"Ignoring WebSub push for {record['topic']} with a bad signature")
+            return None
+
+        return record
+
+    def _lookup(self, token: str) -> Optional[Dict[str, Any]]:
+        """Subscription record for a token, re-reading the store if another process added it"""
+        record = self.store.get(token)
+        if record is None:
+            self.store.reload()
+            record = self.store.get(token)
+        return record
+
+    @staticmethod
+    def _renewal_due(record: Dict[str, Any]) -> bool:
+        """Whether a subscription is unverified or its lease is about to lapse"""
+        expires_at = record.get('expires_at')
+        return record.get('state') != 'active' or expires_at is None or expires_at - datetime.now() < RENEW_BEFORE
@@ -37,7 +37,6 @@ setup(
         "feedparser>=6.0.10",
         "pandas>=2.1.4",
         "python-dotenv>=1.0.0",
-        "python-twitter-v2>=0.7.8",
         "linkedin-api>=2.0.0",
         "selenium>=4.15.2",
         "openai>=1.3.7",
@@ -52,6 +51,7 @@ setup(
         "python-dateutil>=2.8.2",
         "pytz>=2023.3",
         "lxml>=4.9.3",
+        "cssselect>=1.2.0",
         "html5lib>=1.1",
     ],
     extras_require={
@@ -0,0 +1,90 @@
+"""
+Shared fixtures for the Rush Gaming CI test suite
+"""
+
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from rush_ci.config import config
+from rush_ci.fetch import DataFetcher
+from rush_ci.utils.http_cache import http_cache
+from rush_ci.utils.logger import setup_logger
+
+
+@pytest.fixture(autouse=True, scope='session')
+def log_file(tmp_path_factory):
+    """Log to a temporary file instead of the real logs/ directory"""
+    path = tmp_path_factory.mktemp('logs') / 'rush_ci.log'
+    setup_logger(log_file=str(path))
+    return path
+
+
+@pytest.fixture
+def make_response():
+    """
+    Factory for mocked HTTP responses
+
+    The body may be bytes, or a dict/list sent as JSON. It can be read as
+    content, json(), raw or iter_content().
+    """
+    def make(content=b'', status_code=200, headers=None, url=None):
+        if not isinstance(content, bytes):
+            content = json.dumps(content).encode()
+
+        response = Mock()
+        response.status_code = status_code
+        response.content = content
+        response.headers = headers if headers is not None else {}
+        response.links = {}
+        response.url = url
+        response.raw = io.BytesIO(content)
+        response.iter_content = lambda chunk_size=1: (
+            content[start:start + chunk_size] for start in range(0, len(content), chunk_size)
+        )
+        response.json.side_effect = lambda: json.loads(content)
+        return response
+
+    return make
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Keep state files, checkpoints and caches created by the test in tmp_path"""
+    monkeypatch.setattr(config, 'state_dir', tmp_path / 'state')
+    monkeypatch.setattr(config, 'checkpoint_dir', tmp_path / 'checkpoints')
+    monkeypatch.setattr(config, 'article_cache_dir', tmp_path / 'articles')
+    monkeypatch.setattr(http_cache, 'cache_dir', tmp_path / 'http')
+    return tmp_path / 'state'
+
+
+@pytest.fixture
+def fetch_config():
+    """
+    Mocked rush_ci.fetch.config for fetch runs: sequential, no deadline or budgets
+
+    Tests set the competitors and override only the settings they exercise.
+    """
+    with patch('rush_ci.fetch.config') as mock_config:
+        mock_config.competitors = {}
+        mock_config.fetch_mode = 'sequential'
+        mock_config.fetch_deadline_seconds = 0
+        mock_config.fetch_source_budgets = {}
+        mock_config.fetch_max_concurrency = 4
+        mock_config.fetch_per_host_concurrency = 2
+        mock_config.stream_queue_size = 8
+        mock_config.watermark_initial_days = 7
+        mock_config.job_page_size = 100
+        mock_config.job_page_concurrency = 4
+        mock_config.job_max_pages = 50
+        mock_config.twitter_bearer_token = 'token'
+        mock_config.twitter_max_pages = 10
+        yield mock_config
+
+
+@pytest.fixture
+def fetcher(state_dir):
+    """DataFetcher whose state, checkpoints and caches all live in tmp_path"""
+    return DataFetcher()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the compiled alert rule engine
+"""
+
+import pytest
+
+from rush_ci.parse import DataParser
+from rush_ci.utils.alert_rules import AlertRuleEngine
+
+RULES = {
+    'high_priority': {'keywords': ['(?i)(funding|series)', '(?i)(launch|token)']},
+    'medium_priority': {'keywords': ['(?i)(hiring|job)', '(?i)(product|feature)', '(?i)product launch']},
+    'low_priority': {'keywords': ['(?i)(blog|news)']},
+    'company_specific': {
+        'mpl': {'high_priority': ['(?i)(esports|tournament)'], 'medium_priority': ['(?i)cricket']},
+        'winzo': {'high_priority': ['(?i)(indie|bharat)']}
+    }
+}
+
+COMPETITORS = {
+    'mpl': {'name': 'Mobile Premier League'},
+    'winzo': {'name': 'WinZO'},
+    'zupee': {'name': 'Zupee'}
+}
+
+
+class TestAlertRuleEngine:
+    """Test cases for AlertRuleEngine"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.engine = AlertRuleEngine(RULES, COMPETITORS)
+
+    def test_global_rules(self):
+        """Every matched rule is reported once, in rule order"""
+        assert self.engine.evaluate('News: Series B funding, and we are hiring') == [
+            'high_priority.0', 'medium_priority.0', 'low_priority.0'
+        ]
+        assert self.engine.evaluate('Nothing to see') == []
+        assert self.engine.evaluate('') == []
+
+    def test_rules_matching_at_the_same_position(self):
+        """Rules overlapping the same text are all reported, not only the first alternative"""
+        assert self.engine.evaluate('Product launch day') == [
+            'high_priority.1', 'medium_priority.1', 'medium_priority.2'
+        ]
+
+    def test_rules_match_whole_words(self):
+        """Patterns match whole, possibly inflected, words, not text inside longer ones"""
+        engine = AlertRuleEngine({'high_priority': {'keywords': ['(?i)(tax|raise)', '(?i)(user|tech)']}}, {})
+
+        assert engine.evaluate('Syntax highlighting is praised in fintech usernames') == []
+        assert engine.evaluate('New taxes; plans to raise funds') == ['high_priority.0']
+        assert engine.evaluate('Tech for all users') == ['high_priority.1']
+
+    def test_company_specific_rules(self):
+        """Company rules apply by competitors.json key or name, and only to that company"""
+        text = 'Cricket tournament for indie devs'
+
+        assert self.engine.evaluate(text) == []
+        assert self.engine.evaluate(text, 'Mobile Premier League') == [
+            'company_specific.mpl.high_priority.0', 'company_specific.mpl.medium_priority.0'
+        ]
+        assert self.engine.evaluate(text, 'WINZO') == ['company_specific.winzo.high_priority.0']
+        assert self.engine.evaluate(text, 'Zupee') == []
+
+    def test_invalid_rules_are_skipped(self):
+        """A broken pattern is left out without disabling the rest"""
+        engine = AlertRuleEngine({'high_priority': {'keywords': ['(?i)(funding', '(?i)token']}}, {})
+
+        assert engine.evaluate('Token sale after funding') == ['high_priority.1']
+
+    def test_level(self):
+        """The most urgent matched priority decides the level"""
+        assert AlertRuleEngine.level(['low_priority.0', 'company_specific.mpl.high_priority.0']) == 'high'
+        assert AlertRuleEngine.level(['medium_priority.1']) == 'medium'
+        assert AlertRuleEngine.level([]) == 'low'
+
+    def test_parser_alerts_report_rules(self):
+        """Parser alerts carry the rule IDs that raised them"""
+        parser = DataParser()
+        parser.alert_rules = self.engine
+        item = {'company': 'mpl', 'title': 'Esports league', 'content': '', 'url': 'https://mpl.live/esports'}
+
+        alert = parser._check_alert_conditions(item, 'blogs')
+
+        assert alert['level'] == 'high'
+        assert alert['rules'] == ['company_specific.mpl.high_priority.0']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,148 @@
+"""
+Unit tests for the raw response archive and replay
+"""
+
+import gzip
+import io
+import pytest
+import requests
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+from rush_ci.fetch import DataFetcher
+from rush_ci.utils.archive import ResponseArchive
+from rush_ci.utils.http_client import HttpClient, http_client
+from rush_ci.utils.sitemap import iter_sitemap, open_sitemap_stream
+
+FEED_URL = 'https://test.com/blog/feed'
+
+
+def _response(content, url=FEED_URL, headers=None):
+    """A real Response rather than the shared make_response mock, since the archive stores its headers and body"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers.update(headers or {'Content-Type': 'application/rss+xml', 'Content-Encoding': 'gzip'})
+    response._content = content
+    return response
+
+
+class TestResponseArchive:
+    """Test cases for ResponseArchive"""
+
+    def test_identical_bodies_are_stored_once(self, tmp_path):
+        """Each fetch is indexed, but a body is only written the first time it is seen"""
+        archive = ResponseArchive(tmp_path)
+
+        first = archive.record(FEED_URL, _response(b'<rss>same</rss>'))
+        second = archive.record(f'{FEED_URL}?page=2', _response(b'<rss>same</rss>'))
+
+        blobs = list((tmp_path / 'blobs').rglob('*.gz'))
+        assert first == second
+        assert len(blobs) == 1
+        assert gzip.decompress(blobs[0].read_bytes()) == b'<rss>same</rss>'
+        assert ResponseArchive(tmp_path).lookup(f'{FEED_URL}?page=2')['sha256'] == first
+
+    def test_lookup_as_of(self, tmp_path):
+        """Replaying as of a time returns the fetch current at that time"""
+        archive = ResponseArchive(tmp_path)
+        archive.record(FEED_URL, _response(b'v1'))
+        between = datetime.now()
+        archive.record(FEED_URL, _response(b'v2'))
+
+        reloaded = ResponseArchive(tmp_path)
+        assert reloaded.load(reloaded.lookup(FEED_URL, as_of=between)).content == b'v1'
+        assert reloaded.load(reloaded.lookup(FEED_URL)).content == b'v2'
+        assert reloaded.lookup(FEED_URL, as_of=between - timedelta(days=1)) is None
+
+    def test_rebuilt_response(self, tmp_path):
+        """Archived responses come back with headers, final URL and a readable stream, minus wire encoding"""
+        archive = ResponseArchive(tmp_path)
+        archive.record(FEED_URL, _response(b'<rss/>', url='https://www.test.com/blog/feed'))
+
+        response = archive.load(archive.lookup(FEED_URL))
+
+        assert response.status_code == 200
+        assert response.url == 'https://www.test.com/blog/feed'
+        assert response.headers['content-type'] == 'application/rss+xml'
+        assert 'Content-Encoding' not in response.headers
+        assert response.raw.read() == b'<rss/>'
+
+
+class TestReplay:
+    """Test cases for recording and replaying through HttpClient"""
+
+    def test_client_records_then_replays_offline(self, tmp_path):
+        """Full responses are archived with their query; replay never touches the network"""
+        client = HttpClient(archive=ResponseArchive(tmp_path))
+
+        with patch.object(client.session, 'get', return_value=_response(b'{"data": []}')), \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            client.get('https://api.test.com/tweets', params={'since_id': '5'})
+
+        client.replay(ResponseArchive(tmp_path))
+        with patch.object(client.session, 'get') as mock_get:
+            assert client.get('https://api.test.com/tweets', params={'since_id': '5'}).json() == {'data': []}
+            with pytest.raises(requests.ConnectionError):
+                client.get('https://api.test.com/tweets', params={'since_id': '6'})
+
+        mock_get.assert_not_called()
+
+    def test_streamed_responses_are_archived_once_read_to_the_end(self, tmp_path):
+        """A sitemap read to the end replays from the archive; a page cut short is not archived"""
+        sitemap_url = 'https://test.com/sitemap.xml'
+        page_url = 'https://test.com/blog/launch'
+        sitemap = (b'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                   b'<url><loc>https://test.com/blog/launch</loc></url></urlset>')
+        client = HttpClient(archive=ResponseArchive(tmp_path))
+
+        def streamed(url, **kwargs):
+            response = _response(None, url=url, headers={'Content-Type': 'application/xml'})
+            response.raw = io.BytesIO(sitemap if url == sitemap_url else b'<html><head></head><body>' + b'x' * 4096)
+            return response
+
+        with patch.object(client.session, 'get', side_effect=streamed), \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            entries = list(iter_sitemap(open_sitemap_stream(client.get(sitemap_url, stream=True))))
+            client.get(page_url, stream=True).raw.read(16)
+
+        client.replay(ResponseArchive(tmp_path))
+        with patch.object(client.session, 'get') as mock_get:
+            replayed = client.get(sitemap_url, stream=True)
+            with pytest.raises(requests.ConnectionError):
+                client.get(page_url, stream=True)
+
+        mock_get.assert_not_called()
+        assert entries == [('url', page_url, None)]
+        assert replayed.content == sitemap
+
+    def test_fetcher_replays_old_feeds_with_scratch_state(self, tmp_path):
+        """A replaying fetcher re-extracts archived posts, however old, with a client, caches and state of its own"""
+        old = datetime.now() - timedelta(days=90)
+        rss = (f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title><item><title>Launch</title>'
+               f'<link>https://test.com/blog/launch</link><pubDate>{format_datetime(old.astimezone())}</pubDate>'
+               f'</item></channel></rss>').encode()
+        archive = ResponseArchive(tmp_path / 'archive')
+        archive.record(FEED_URL, _response(rss))
+
+        with patch('rush_ci.fetch.ResponseArchive', return_value=archive), \
+             patch('requests.Session.get') as mock_get:
+            with DataFetcher(replay=True) as fetcher:
+                blogs = fetcher._fetch_feed(FEED_URL, 'Test Company')
+                scratch_dir = fetcher.watermarks.path.parent
+
+                assert fetcher.http_client is not http_client
+                assert fetcher.checkpoints.checkpoint_dir.parent == scratch_dir
+                assert fetcher.http_cache.cache_dir.parent == scratch_dir
+                assert fetcher.article_fetcher.cache.cache_dir.parent == scratch_dir
+
+        mock_get.assert_not_called()
+        assert [blog['title'] for blog in blogs] == ['Launch']
+        assert scratch_dir.name.startswith('rush-ci-replay-')
+        assert not scratch_dir.exists()
+        assert not http_client._replaying
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,96 @@
+"""
+Unit tests for full-article fetching
+"""
+
+import pytest
+from unittest.mock import patch
+
+from rush_ci.utils.articles import ArticleFetcher, ArticleCache, canonical_url, extract_article
+
+ARTICLE_HTML = b'''
+<html><head><link rel="canonical" href="/blog/big-launch"></head>
+<body>
+  <nav class="site-nav"><a href="/">Home</a><a href="/blog">Blog</a></nav>
+  <article>
+    <h1>Big launch</h1>
+    <div class="share-buttons">Share on Twitter</div>
+    <p>We are launching a new fantasy cricket format today.</p>
+    <p>It ships to all players in India next week.</p>
+  </article>
+  <footer>Copyright Test Co</footer>
+  <script>track()</script>
+</body></html>
+'''
+
+
+class TestArticleExtraction:
+    """Test cases for canonical URLs and boilerplate stripping"""
+
+    def test_canonical_url(self):
+        """Tracking parameters, fragments and cosmetic differences are dropped"""
+        assert canonical_url('HTTPS://Test.com:443/blog/post/?utm_source=rss&b=2&a=1#comments') == \
+            'https://test.com/blog/post?a=1&b=2'
+        assert canonical_url('https://test.com/blog/post') == canonical_url('https://test.com/blog/post/?fbclid=x')
+
+    def test_boilerplate_is_stripped(self):
+        """Only the article paragraphs survive; the canonical link is resolved"""
+        article = extract_article(ARTICLE_HTML, 'https://test.com/blog/big-launch?utm_medium=rss')
+
+        assert article['title'] == 'Big launch'
+        assert article['text'] == ('We are launching a new fantasy cricket format today.\n\n'
+                                   'It ships to all players in India next week.')
+        assert article['canonical'] == 'https://test.com/blog/big-launch'
+
+    def test_densest_block_without_article_tag(self):
+        """Pages without article/main fall back to the block with the most paragraph text"""
+        html = b'''<html><body>
+            <div class="links"><p>Home</p></div>
+            <div class="content"><p>First long paragraph of the post.</p><p>Second paragraph.</p></div>
+        </body></html>'''
+
+        assert extract_article(html)['text'] == 'First long paragraph of the post.\n\nSecond paragraph.'
+
+    def test_hints_match_whole_class_tokens(self):
+        """Classes merely containing a hint word are kept; hints alone or with a widget suffix are not"""
+        html = b'''<html><body><article>
+            <div class="post has-sidebar"><p>Body paragraph.</p></div>
+            <div class="header-adjacent"><p>Lead paragraph.</p></div>
+            <div class="related-links"><p>Read next</p></div>
+            <div class="widget ad"><p>Buy now</p></div>
+        </article></body></html>'''
+
+        assert extract_article(html)['text'] == 'Body paragraph.\n\nLead paragraph.'
+
+
+class TestArticleFetcher:
+    """Test cases for ArticleFetcher"""
+
+    def test_articles_are_fetched_once(self, tmp_path, make_response):
+        """New URLs are downloaded; URL variants and later runs hit the cache"""
+        fetcher = ArticleFetcher(ArticleCache(tmp_path), max_workers=2)
+        items = [{'url': 'https://test.com/blog/big-launch?utm_source=rss', 'content': 'Short summary'}]
+
+        with patch('rush_ci.utils.articles.safe_request', side_effect=lambda url, **kwargs: make_response(ARTICLE_HTML, url=url)) as mock_request:
+            fetcher.enrich(items)
+            later_run = fetcher.enrich([{'url': 'https://test.com/blog/big-launch/', 'content': 'Short summary'}])
+
+        mock_request.assert_called_once()
+        assert items[0]['summary'] == 'Short summary'
+        assert items[0]['content'].startswith('We are launching')
+        assert later_run[0]['content'] == items[0]['content']
+
+    def test_failed_downloads_keep_content(self, tmp_path):
+        """Items whose article cannot be fetched are left as they were, and retried next time"""
+        fetcher = ArticleFetcher(ArticleCache(tmp_path), max_workers=2)
+        items = [{'url': 'https://test.com/blog/gone', 'content': 'Short summary'}]
+
+        with patch('rush_ci.utils.articles.safe_request', return_value=None) as mock_request:
+            fetcher.enrich(items)
+            fetcher.enrich(items)
+
+        assert items == [{'url': 'https://test.com/blog/gone', 'content': 'Short summary'}]
+        assert mock_request.call_count == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,150 @@
+"""
+Unit tests for checkpointed, resumable fetch runs
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from rush_ci.fetch import DataFetcher
+from rush_ci.utils.checkpoints import FetchCheckpoint
+
+
+class _Crash(BaseException):
+    """Stands in for the process dying mid-run"""
+
+
+class TestFetchCheckpoint:
+    """Test cases for FetchCheckpoint"""
+
+    def test_resumes_latest_unfinished_run(self, tmp_path):
+        """A new checkpoint object picks up the unfinished run and its units"""
+        first = FetchCheckpoint(tmp_path, max_age_hours=6)
+        run_id = first.start_run()
+        first.record('mpl', 'blogs', [{'title': 'Post', 'published_at': datetime(2024, 1, 1)}])
+
+        resumed = FetchCheckpoint(tmp_path, max_age_hours=6)
+        assert resumed.start_run() == run_id
+        assert resumed.load('mpl', 'blogs') == [{'title': 'Post', 'published_at': datetime(2024, 1, 1)}]
+        assert resumed.load('mpl', 'jobs') is None
+
+    def test_stale_units_are_not_reused(self, tmp_path):
+        """Units older than the freshness window must be fetched again"""
+        checkpoint = FetchCheckpoint(tmp_path, max_age_hours=6)
+        checkpoint.start_run()
+
+        with patch('rush_ci.utils.checkpoints.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() - timedelta(hours=7)
+            checkpoint.record('mpl', 'blogs', [])
+
+        assert checkpoint.load('mpl', 'blogs') is None
+
+    def test_complete_run_starts_fresh(self, tmp_path):
+        """After completion the next run has no checkpoints"""
+        checkpoint = FetchCheckpoint(tmp_path, max_age_hours=6)
+        checkpoint.start_run()
+        checkpoint.record('mpl', 'blogs', [])
+        checkpoint.complete_run()
+
+        assert list(tmp_path.iterdir()) == []
+        checkpoint.start_run()
+        assert checkpoint.load('mpl', 'blogs') is None
+
+
+@pytest.mark.usefixtures('state_dir')
+class TestResumableFetch:
+    """Test cases for resuming DataFetcher.fetch_all_sources"""
+
+    def test_restart_resumes_from_first_incomplete_unit(self, tmp_path, fetch_config):
+        """Units completed before a crash are not fetched again; failed units are retried"""
+        competitors = {
+            'a': {'name': 'Company A', 'blog_url': 'https://a.example.com/blog'},
+            'b': {'name': 'Company B', 'blog_url': 'https://b.example.com/blog'}
+        }
+
+        def crashing_jobs(competitor_config):
+            if competitor_config['name'] == 'Company B':
+                raise _Crash()
+            return [{'role': 'Engineer', 'company': competitor_config['name']}]
+
+        fetch_config.competitors = competitors
+
+        crashed = DataFetcher()
+        with patch.object(crashed, 'fetch_blogs', return_value=[{'title': 'Post'}]), \
+             patch.object(crashed, 'fetch_tweets', side_effect=RuntimeError('rate limited')), \
+             patch.object(crashed, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(crashed, 'fetch_jobs', side_effect=crashing_jobs):
+            with pytest.raises(_Crash):
+                crashed.fetch_all_sources()
+
+        restarted = DataFetcher()
+        with patch.object(restarted, 'fetch_blogs', return_value=[{'title': 'Post'}]) as blogs, \
+             patch.object(restarted, 'fetch_tweets', return_value=[]) as tweets, \
+             patch.object(restarted, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(restarted, 'fetch_jobs', return_value=[{'role': 'Designer'}]) as jobs:
+            result = restarted.fetch_all_sources()
+
+        # Company A's blogs/jobs and Company B's blogs completed before the crash
+        assert blogs.call_count == 0
+        assert [call.args[0]['name'] for call in jobs.call_args_list] == ['Company B']
+        assert tweets.call_count == 2
+        assert result['jobs'] == [{'role': 'Engineer', 'company': 'Company A'}, {'role': 'Designer'}]
+
+        restarted.complete_run()
+        assert list((tmp_path / 'checkpoints').iterdir()) == []
+
+    def test_reused_units_advance_their_watermarks(self, fetch_config):
+        """A unit reused after a crash still advances its watermarks when the resumed run completes"""
+        published_at = datetime.now().replace(microsecond=0)
+
+        def fetch_blogs(fetcher):
+            return lambda competitor_config: fetcher._take_unseen(
+                'feed:https://a.example.com/feed', [(published_at, 'a', {'title': 'a'})], first_run_limit=10
+            )
+
+        def run(crash=False):
+            fetcher = DataFetcher()
+            with patch.object(fetcher, 'fetch_blogs', side_effect=fetch_blogs(fetcher)), \
+                 patch.object(fetcher, 'fetch_tweets', return_value=[]), \
+                 patch.object(fetcher, 'fetch_linkedin_posts', return_value=[]), \
+                 patch.object(fetcher, 'fetch_jobs', side_effect=_Crash() if crash else None, return_value=[]):
+                if crash:
+                    with pytest.raises(_Crash):
+                        fetcher.fetch_all_sources()
+                    return None
+                result = fetcher.fetch_all_sources()
+            fetcher.complete_run()
+            return [blog['title'] for blog in result['blogs']]
+
+        fetch_config.competitors = {'a': {'name': 'Company A', 'blog_url': 'https://a.example.com/blog'}}
+
+        run(crash=True)
+        assert run() == ['a']
+        assert run() == []
+
+    def test_reused_units_update_their_poll_schedule(self, fetch_config):
+        """A unit reused after a crash still feeds its adaptive poll interval"""
+        fetch_config.competitors = {'a': {'name': 'Company A', 'blog_url': 'https://a.example.com/blog'}}
+
+        crashed = DataFetcher()
+        with patch.object(crashed, 'fetch_blogs', return_value=[{'title': 'Post'}]), \
+             patch.object(crashed, 'fetch_tweets', return_value=[]), \
+             patch.object(crashed, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(crashed, 'fetch_jobs', side_effect=_Crash()):
+            with pytest.raises(_Crash):
+                crashed.fetch_all_sources()
+
+        restarted = DataFetcher()
+        with patch.object(restarted, 'fetch_blogs') as blogs, \
+             patch.object(restarted, 'fetch_tweets', return_value=[]), \
+             patch.object(restarted, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(restarted, 'fetch_jobs', return_value=[]):
+            restarted.fetch_all_sources()
+        restarted.complete_run()
+
+        blogs.assert_not_called()
+        assert restarted.poll_schedule.store.get('a:blogs') is not None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,222 @@
+"""
+Unit tests for circuit breakers, time budgets and hedged requests
+"""
+
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from rush_ci.utils.circuit_breaker import CircuitBreaker, HostCircuitBreakers, CircuitOpenError
+from rush_ci.utils.deadline import time_budget, remaining, clip_timeout, DeadlineExceeded
+from rush_ci.utils.http_client import HttpClient, BudgetRetry
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+
+    def test_opens_after_threshold_and_allows_one_trial(self):
+        """Consecutive failures open the circuit; after the cool-down one trial goes through"""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == 'open'
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        assert not breaker.allow()  # only one trial at a time
+
+        breaker.record_success()
+        assert breaker.state == 'closed'
+
+    def test_failed_trial_reopens(self):
+        """A failed trial opens the circuit for another cool-down"""
+        breaker = CircuitBreaker(failure_threshold=5, cooldown=0.05)
+        for _ in range(5):
+            breaker.record_failure()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == 'open'
+
+
+class TestClientBreakers:
+    """Test cases for HttpClient with circuit breakers"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.breakers = HostCircuitBreakers(failure_threshold=2, cooldown=60)
+        self.client = HttpClient(hedge_after=0, breakers=self.breakers)
+
+    def test_dead_host_is_skipped(self, make_response):
+        """Once a host's circuit opens no more requests are sent to it; other hosts are unaffected"""
+        with patch.object(self.client.session, 'get', side_effect=requests.ConnectionError('refused')) as mock_get, \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            for _ in range(2):
+                with pytest.raises(requests.ConnectionError):
+                    self.client.get('https://dead.example.com/feed')
+
+            with pytest.raises(CircuitOpenError):
+                self.client.get('https://dead.example.com/rss')
+
+            assert mock_get.call_count == 2
+
+            mock_get.side_effect = None
+            mock_get.return_value = make_response(status_code=200)
+            assert self.client.get('https://alive.example.com/feed').status_code == 200
+
+    def test_server_errors_count_as_failures(self, make_response):
+        """5xx responses trip the breaker, 4xx responses do not"""
+        with patch.object(self.client.session, 'get', return_value=make_response(status_code=404)), \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            for _ in range(3):
+                self.client.get('https://example.com/missing')
+        assert self.breakers.breaker_for('https://example.com').state == 'closed'
+
+        with patch.object(self.client.session, 'get', return_value=make_response(status_code=503)), \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            for _ in range(2):
+                self.client.get('https://example.com/feed')
+        assert self.breakers.breaker_for('https://example.com').state == 'open'
+
+
+class TestTimeBudget:
+    """Test cases for time budgets"""
+
+    def test_budgets_nest_to_the_earliest_deadline(self):
+        """An inner budget cannot extend an outer one"""
+        assert remaining() is None
+
+        with time_budget(0.5):
+            with time_budget(10):
+                assert remaining() <= 0.5
+            with time_budget(None):
+                assert remaining() <= 0.5
+
+        assert remaining() is None
+
+    def test_timeouts_are_clipped(self):
+        """Request timeouts shrink to the budget left, and spent budgets refuse requests"""
+        with time_budget(2):
+            connect_timeout, read_timeout = clip_timeout((5, 30))
+            assert connect_timeout <= 2 and read_timeout <= 2
+
+        with time_budget(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceeded):
+                clip_timeout((5, 30))
+
+    def test_spent_budget_does_not_trip_breaker(self):
+        """Requests refused for lack of time are not host failures"""
+        breakers = HostCircuitBreakers(failure_threshold=1, cooldown=60)
+        client = HttpClient(hedge_after=0, breakers=breakers)
+
+        with time_budget(0.01):
+            time.sleep(0.02)
+            with pytest.raises(requests.Timeout):
+                client.get('https://example.com/feed')
+
+        assert breakers.breaker_for('https://example.com').state == 'closed'
+
+    def test_spent_budget_does_not_take_half_open_trial(self, make_response):
+        """A request refused for lack of time leaves the trial to the next caller"""
+        breakers = HostCircuitBreakers(failure_threshold=1, cooldown=0.05)
+        client = HttpClient(hedge_after=0, breakers=breakers)
+        breakers.record_failure('https://example.com/feed')
+        time.sleep(0.06)
+
+        with time_budget(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceeded):
+                client.get('https://example.com/feed')
+
+        with patch.object(client.session, 'get', return_value=make_response(status_code=200)), \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            assert client.get('https://example.com/feed').status_code == 200
+
+        assert breakers.breaker_for('https://example.com').state == 'closed'
+
+    def test_retries_do_not_wait_past_the_budget(self):
+        """Retry-After and backoff sleeps are clipped to the budget, and spent budgets stop retrying"""
+        retry = BudgetRetry(total=3, backoff_factor=60, status_forcelist=[429], respect_retry_after_header=True)
+        throttled = Mock(headers={'Retry-After': '120'})
+        retry = retry.increment('GET', '/feed').increment('GET', '/feed')
+
+        assert retry.get_retry_after(throttled) == 120
+        with time_budget(2):
+            assert retry.get_retry_after(throttled) <= 2
+            assert retry.get_backoff_time() <= 2
+            assert retry.is_retry('GET', 429, has_retry_after=True)
+
+        with time_budget(0.01):
+            time.sleep(0.02)
+            assert not retry.is_retry('GET', 429, has_retry_after=True)
+
+
+class TestHedgedRequests:
+    """Test cases for hedged requests"""
+
+    def test_slow_primary_is_hedged(self, make_response):
+        """The duplicate's response is returned when the first request stalls"""
+        client = HttpClient(hedge_after=0.05, breakers=HostCircuitBreakers(3, 60))
+        fast = make_response(status_code=200)
+        slow = make_response(status_code=200)
+
+        def get(url, **kwargs):
+            if get.calls == 0:
+                get.calls += 1
+                time.sleep(0.3)
+                return slow
+            return fast
+        get.calls = 0
+
+        with patch.object(client.session, 'get', side_effect=get), \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            assert client.get('https://example.com/feed') is fast
+
+        time.sleep(0.35)
+        slow.close.assert_called_once()
+
+    def test_fast_primary_is_not_hedged(self, make_response):
+        """No duplicate is sent when the first request answers in time"""
+        client = HttpClient(hedge_after=1, breakers=HostCircuitBreakers(3, 60))
+
+        with patch.object(client.session, 'get', return_value=make_response(status_code=200)) as mock_get, \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            client.get('https://example.com/feed')
+
+        assert mock_get.call_count == 1
+
+
+class TestFetchDeadline:
+    """Test cases for the fetch run deadline"""
+
+    def test_units_after_deadline_are_skipped(self, fetcher, fetch_config):
+        """Once the run deadline passes, remaining units are skipped and not checkpointed"""
+
+        def slow_blogs(competitor_config):
+            time.sleep(0.2)
+            return [{'title': 'Post'}]
+
+        with patch.object(fetcher, 'fetch_blogs', side_effect=slow_blogs), \
+             patch.object(fetcher, 'fetch_tweets', return_value=[]) as tweets, \
+             patch.object(fetcher, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(fetcher, 'fetch_jobs', return_value=[]):
+            fetch_config.competitors = {'a': {'name': 'Company A'}}
+            fetch_config.fetch_deadline_seconds = 0.1
+
+            result = fetcher.fetch_all_sources()
+
+        # The budget ran out inside fetch_blogs: its items are kept but not checkpointed
+        assert result['blogs'] == [{'title': 'Post'}]
+        assert fetcher.checkpoints.load('a', 'blogs') is None
+        tweets.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
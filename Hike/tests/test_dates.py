@@ -0,0 +1,68 @@
+"""
+Unit tests for the multi-format date parser
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from rush_ci.utils.dates import DateParser, to_local_naive
+
+
+class TestDateParser:
+    """Test cases for DateParser"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = DateParser()
+
+    @pytest.mark.parametrize('value, expected_utc', [
+        ('Mon, 01 Jan 2024 12:00:00 GMT', datetime(2024, 1, 1, 12, 0)),
+        ('Mon, 01 Jan 2024 17:30:00 +0530', datetime(2024, 1, 1, 12, 0)),
+        ('2024-01-01T12:00:00Z', datetime(2024, 1, 1, 12, 0)),
+        ('2024-01-01T12:00:00.000Z', datetime(2024, 1, 1, 12, 0)),
+        ('2024-01-01T17:30:00+05:30', datetime(2024, 1, 1, 12, 0)),
+    ])
+    def test_timezone_aware_formats(self, value, expected_utc):
+        """RFC 822 and ISO 8601 dates are converted to naive local time"""
+        expected = to_local_naive(expected_utc.replace(tzinfo=timezone.utc))
+        assert self.parser.parse(value) == expected
+
+    @pytest.mark.parametrize('value, expected', [
+        ('2024-01-01 12:00:00', datetime(2024, 1, 1, 12, 0)),
+        ('2024-01-31', datetime(2024, 1, 31)),
+        ('31/01/2024', datetime(2024, 1, 31)),
+        ('01/31/2024', datetime(2024, 1, 31)),
+        ('31 January 2024', datetime(2024, 1, 31)),
+    ])
+    def test_naive_formats(self, value, expected):
+        """Numeric and long-form dates without a timezone are returned as-is"""
+        assert self.parser.parse(value) == expected
+
+    def test_unparseable_returns_default(self):
+        """Garbage and empty input fall back to the default"""
+        fallback = datetime(2000, 1, 1)
+
+        assert self.parser.parse('not a date', default=fallback) == fallback
+        assert self.parser.parse('', default=fallback) == fallback
+        assert self.parser.parse(None) is None
+
+    def test_learns_format_per_source(self):
+        """After the first hit a source's format is tried first"""
+        values = ['Mon, 01 Jan 2024 12:00:00 GMT', 'Tue, 02 Jan 2024 12:00:00 GMT']
+        self.parser.parse_batch(values, source='feed')
+        assert self.parser.learned_format('feed') == 'rfc822'
+
+        self.parser._parsers['iso8601'] = Mock(side_effect=ValueError)
+        assert self.parser.parse('Wed, 03 Jan 2024 12:00:00 GMT', source='feed') is not None
+        self.parser._parsers['iso8601'].assert_not_called()
+
+    def test_batch_is_aligned_with_input(self):
+        """parse_batch keeps one result per input, including failures"""
+        results = self.parser.parse_batch(['2024-01-01', 'nope', '2024-01-02'], source='jobs')
+
+        assert results == [datetime(2024, 1, 1), None, datetime(2024, 1, 2)]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+"""
+Unit tests for the lxml extraction engine
+"""
+
+import pytest
+
+from rush_ci.fetch import DataFetcher, JOB_SELECTORS, JOB_FIELDS
+from rush_ci.utils.extraction import SelectorSet, FieldRule, find_feed_links
+
+CAREERS_HTML = b'''
+<html><body>
+  <ul>
+    <li class="job-card"><h3>Senior Backend Engineer</h3>
+      <span class="job-location">Bangalore</span><a href="/jobs/1">Apply</a></li>
+    <li class="job-card"><h3>Product Manager</h3>
+      <div class="Location">Remote</div><a href="https://test.com/jobs/2">Apply</a></li>
+  </ul>
+</body></html>
+'''
+
+
+class TestSelectorSet:
+    """Test cases for SelectorSet"""
+
+    def test_first_matching_selector_wins(self):
+        """Selectors are tried in order and fields come from the first match"""
+        selector_set = SelectorSet(['.missing', '.job-card', 'li'], {
+            'title': FieldRule(['h3']),
+            'location': FieldRule(['span', 'div'], class_contains='location'),
+            'link': FieldRule(['a'], attribute='href')
+        })
+
+        items, matched = selector_set.extract(CAREERS_HTML)
+
+        assert matched == '.job-card'
+        assert items[0] == {'title': 'Senior Backend Engineer', 'location': 'Bangalore', 'link': '/jobs/1'}
+        assert items[1]['location'] == 'Remote'
+
+    def test_limit_and_empty_documents(self):
+        """Limits cap the item count and empty input yields nothing"""
+        selector_set = SelectorSet(['li'], {'title': FieldRule(['h3'])})
+
+        assert len(selector_set.extract(CAREERS_HTML, limit=1)[0]) == 1
+        assert selector_set.extract(b'') == ([], None)
+
+
+class TestFetcherExtraction:
+    """Test cases for DataFetcher HTML extraction"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.fetcher = DataFetcher()
+
+    def test_html_jobs(self):
+        """Careers pages yield normalised job data with absolute URLs"""
+        jobs, matched = self.fetcher._extract_html_jobs(CAREERS_HTML, 'https://test.com/careers', 'Test', JOB_SELECTORS)
+
+        assert matched == '[class*="job"]'
+        assert [job['role'] for job in jobs] == ['Senior Backend Engineer', 'Product Manager']
+        assert jobs[0]['url'] == 'https://test.com/careers/jobs/1'
+        assert jobs[1]['url'] == 'https://test.com/jobs/2'
+
+    def test_selector_sets_are_compiled_once(self):
+        """The same selector order reuses the compiled set"""
+        first = self.fetcher._extractor(JOB_SELECTORS, JOB_FIELDS)
+
+        assert self.fetcher._extractor(list(JOB_SELECTORS), JOB_FIELDS) is first
+        assert self.fetcher._extractor(['.opening'] + JOB_SELECTORS, JOB_FIELDS) is not first
+
+    def test_feed_autodiscovery(self):
+        """Only alternate links with a feed type are returned"""
+        html = b'''<html><head>
+            <link rel="stylesheet" href="/style.css">
+            <link rel="alternate" type="text/html" href="/amp">
+            <link rel="alternate" type="application/atom+xml" href="/atom.xml">
+        </head></html>'''
+
+        assert find_feed_links(html, ['application/rss+xml', 'application/atom+xml']) == ['/atom.xml']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,88 @@
+"""
+Unit tests for learned RSS feed discovery
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+BLOG_URL = 'https://test.com/blog'
+
+BLOG_HTML = b'''
+<html><head>
+  <link rel="alternate" type="application/rss+xml" href="/blog/custom-feed.xml">
+</head><body><article><h2>Post</h2><a href="/blog/1">Read</a></article></body></html>
+'''
+
+RSS = b'''<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+  <item><title>Test Blog Post</title><link>https://test.com/blog/1</link>
+  <description>Test content</description></item>
+</channel></rss>
+'''
+
+
+class TestFeedDiscovery:
+    """Test cases for DataFetcher feed discovery"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher, make_response):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+        self.make_response = make_response
+        self.competitor = {'name': 'Test Company', 'blog_url': BLOG_URL}
+
+    def _routes(self, routes):
+        def request(url, **kwargs):
+            content = routes.get(url)
+            return self.make_response(content) if content is not None else None
+        return request
+
+    def test_autodiscovery_is_learned_and_reused(self):
+        """The advertised feed is found once, then fetched directly with one request"""
+        routes = {BLOG_URL: BLOG_HTML, 'https://test.com/blog/custom-feed.xml': RSS}
+
+        with patch('rush_ci.fetch.safe_request', side_effect=self._routes(routes)) as mock_request:
+            blogs = self.fetcher.fetch_blogs(self.competitor)
+            assert [blog['title'] for blog in blogs] == ['Test Blog Post']
+
+            mock_request.reset_mock()
+            blogs = self.fetcher.fetch_blogs(self.competitor)
+
+        assert [blog['title'] for blog in blogs] == ['Test Blog Post']
+        assert [call.args[0] for call in mock_request.call_args_list] == ['https://test.com/blog/custom-feed.xml']
+        assert self.fetcher.feed_discovery.get(BLOG_URL)['feed_url'] == 'https://test.com/blog/custom-feed.xml'
+
+    def test_html_only_blog_is_remembered(self):
+        """Blogs without any feed or sitemap are scraped from HTML without re-probing feed paths"""
+        page = b'<html><body><article><h2>Post</h2><a href="/blog/1">Read</a></article></body></html>'
+
+        with patch.object(self.fetcher, '_scrape_blog_sitemap', return_value=None), \
+             patch('rush_ci.fetch.safe_request', side_effect=self._routes({BLOG_URL: page})) as mock_request:
+            blogs = self.fetcher.fetch_blogs(self.competitor)
+            assert len(blogs) == 1
+            assert self.fetcher.feed_discovery.get(BLOG_URL)['feed_url'] is None
+
+            mock_request.reset_mock()
+            blogs = self.fetcher.fetch_blogs(self.competitor)
+
+        assert len(blogs) == 1
+        assert [call.args[0] for call in mock_request.call_args_list] == [BLOG_URL]
+
+    def test_stale_record_triggers_rediscovery(self):
+        """Records older than the TTL are revalidated"""
+        self.fetcher.feed_discovery.set(BLOG_URL, {
+            'feed_url': None,
+            'checked_at': datetime.now() - timedelta(days=30)
+        })
+        routes = {BLOG_URL: BLOG_HTML, 'https://test.com/blog/custom-feed.xml': RSS}
+
+        with patch('rush_ci.fetch.safe_request', side_effect=self._routes(routes)):
+            blogs = self.fetcher.fetch_blogs(self.competitor)
+
+        assert blogs[0]['source'] == 'rss'
+        assert self.fetcher.feed_discovery.get(BLOG_URL)['feed_url'] == 'https://test.com/blog/custom-feed.xml'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,153 @@
+"""
+Unit tests for the concurrent fetch engine
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+
+def _competitors(count):
+    return {
+        f'c{i}': {
+            'name': f'Company {i}',
+            'blog_url': f'https://c{i}.example.com/blog',
+            'careers_url': f'https://c{i}.example.com/careers'
+        }
+        for i in range(count)
+    }
+
+
+class TestConcurrentFetch:
+    """Test cases for DataFetcher.fetch_all_sources_async"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+
+    def test_async_matches_sequential_output(self, fetch_config):
+        """Async mode returns the same dict, in the same order, as the sequential loop"""
+        def make(source_type):
+            return lambda competitor_config: [{'company': competitor_config['name'], 'type': source_type}]
+
+        with patch.object(self.fetcher, 'fetch_blogs', side_effect=make('blogs')), \
+             patch.object(self.fetcher, 'fetch_tweets', side_effect=make('tweets')), \
+             patch.object(self.fetcher, 'fetch_linkedin_posts', side_effect=make('linkedin')), \
+             patch.object(self.fetcher, 'fetch_jobs', side_effect=make('jobs')):
+            fetch_config.competitors = _competitors(3)
+
+            sequential = self.fetcher.fetch_all_sources()
+            fetch_config.fetch_mode = 'async'
+            concurrent = self.fetcher.fetch_all_sources()
+
+        assert set(concurrent) == {'blogs', 'tweets', 'linkedin', 'jobs'}
+        assert concurrent == sequential
+        assert [item['company'] for item in concurrent['blogs']] == ['Company 0', 'Company 1', 'Company 2']
+
+    def test_async_respects_concurrency_limits(self, fetch_config):
+        """Never more than the global limit in flight, nor more than the per-host limit per host"""
+        lock = threading.Lock()
+        in_flight = {'total': 0, 'peak': 0}
+        per_host = {}
+        per_host_peak = {}
+
+        def slow_fetch(competitor_config):
+            host = competitor_config['blog_url']
+            with lock:
+                in_flight['total'] += 1
+                in_flight['peak'] = max(in_flight['peak'], in_flight['total'])
+                per_host[host] = per_host.get(host, 0) + 1
+                per_host_peak[host] = max(per_host_peak.get(host, 0), per_host[host])
+            time.sleep(0.05)
+            with lock:
+                in_flight['total'] -= 1
+                per_host[host] -= 1
+            return []
+
+        # Every competitor shares one blog host
+        competitors = _competitors(6)
+        for competitor in competitors.values():
+            competitor['blog_url'] = 'https://shared.example.com/blog'
+
+        with patch.object(self.fetcher, 'fetch_blogs', side_effect=slow_fetch), \
+             patch.object(self.fetcher, 'fetch_tweets', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_jobs', return_value=[]):
+            fetch_config.competitors = competitors
+            fetch_config.fetch_mode = 'async'
+            fetch_config.fetch_max_concurrency = 3
+
+            self.fetcher.fetch_all_sources()
+
+        assert in_flight['peak'] <= 3
+        assert per_host_peak['https://shared.example.com/blog'] == 2
+
+    def test_failing_source_does_not_abort_run(self, fetch_config):
+        """One failing source yields an empty list for that pair only"""
+        with patch.object(self.fetcher, 'fetch_blogs', side_effect=RuntimeError('boom')), \
+             patch.object(self.fetcher, 'fetch_tweets', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_jobs', return_value=[{'role': 'Engineer'}]):
+            fetch_config.competitors = _competitors(2)
+            fetch_config.fetch_mode = 'async'
+
+            result = self.fetcher.fetch_all_sources()
+
+        assert result['blogs'] == []
+        assert len(result['jobs']) == 2
+
+    def test_async_mode_works_inside_running_loop(self, fetch_config):
+        """fetch_all_sources does not trip over an event loop already running in the caller"""
+        async def caller():
+            return self.fetcher.fetch_all_sources()
+
+        with patch.object(self.fetcher, 'fetch_blogs', return_value=[{'title': 'Post'}]), \
+             patch.object(self.fetcher, 'fetch_tweets', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_jobs', return_value=[]):
+            fetch_config.competitors = _competitors(2)
+            fetch_config.fetch_mode = 'async'
+
+            result = asyncio.run(caller())
+
+        assert len(result['blogs']) == 2
+
+    def test_async_entry_point_starts_the_run(self, fetch_config):
+        """Calling the coroutine directly still opens the run, sets the deadline and resolves Twitter users"""
+        with patch.object(self.fetcher.checkpoints, 'start_run') as start_run, \
+             patch.object(self.fetcher, 'resolve_twitter_users') as resolve_twitter_users, \
+             patch.object(self.fetcher, 'fetch_blogs', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_tweets', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(self.fetcher, 'fetch_jobs', return_value=[]):
+            fetch_config.competitors = _competitors(1)
+            fetch_config.fetch_deadline_seconds = 60
+
+            asyncio.run(self.fetcher.fetch_all_sources_async())
+
+        start_run.assert_called_once()
+        resolve_twitter_users.assert_called_once()
+        assert self.fetcher._run_deadline is not None
+
+    def test_source_host_matches_contacted_host(self):
+        """Per-host limits use the learned job board or feed host, keyed like the rate limiter"""
+        competitors = _competitors(2)
+        for key, competitor in competitors.items():
+            self.fetcher.job_adapters.set(competitor['careers_url'], {
+                'adapter': 'lever', 'url': f'https://API.lever.co/v0/postings/{key}'
+            })
+        self.fetcher.feed_discovery.set(competitors['c0']['blog_url'], {
+            'feed_url': 'https://feeds.example.net/c0.xml'
+        })
+
+        assert {self.fetcher._source_host(c, 'jobs') for c in competitors.values()} == {'api.lever.co'}
+        assert self.fetcher._source_host(competitors['c0'], 'blogs') == 'feeds.example.net'
+        assert self.fetcher._source_host(competitors['c1'], 'blogs') == 'c1.example.com'
+        assert self.fetcher._source_host(competitors['c0'], 'tweets') == 'api.twitter.com'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
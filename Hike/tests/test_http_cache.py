@@ -0,0 +1,74 @@
+"""
+Unit tests for the conditional-GET HTTP cache
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from rush_ci.utils.http_cache import HttpCache
+
+
+class TestHttpCache:
+    """Test cases for HttpCache"""
+
+    def test_store_and_load_round_trip(self, tmp_path, make_response):
+        """Validators and payload (including datetimes) survive a round trip"""
+        cache = HttpCache(tmp_path)
+        published = datetime(2024, 1, 1, 12, 0)
+        response = make_response(headers={'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 12:00:00 GMT'})
+
+        cache.store('https://test.com/feed', response, [{'title': 'Post', 'published_at': published}])
+
+        assert cache.validator_headers('https://test.com/feed') == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 12:00:00 GMT'
+        }
+        assert cache.load_payload('https://test.com/feed') == [{'title': 'Post', 'published_at': published}]
+
+    def test_responses_without_validators_are_not_cached(self, tmp_path, make_response):
+        """Nothing is stored when the server sends no ETag or Last-Modified"""
+        cache = HttpCache(tmp_path)
+        cache.store('https://test.com/feed', make_response(), [{'title': 'Post'}])
+
+        assert cache.get('https://test.com/feed') is None
+        assert cache.validator_headers('https://test.com/feed') == {}
+
+
+class TestConditionalFetch:
+    """Test cases for DataFetcher._fetch_cached"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+
+    def test_not_modified_skips_extraction(self, tmp_path, make_response):
+        """A 304 reuses cached items and never calls the extractor"""
+        cache = HttpCache(tmp_path)
+        cache.store('https://test.com/feed', make_response(headers={'ETag': '"v1"'}), [{'title': 'Cached'}])
+        extract = Mock()
+
+        with patch('rush_ci.fetch.http_cache', cache), \
+             patch('rush_ci.fetch.safe_request', return_value=make_response(status_code=304)) as mock_request:
+            items = self.fetcher._fetch_cached('https://test.com/feed', extract)
+
+        assert items == [{'title': 'Cached'}]
+        extract.assert_not_called()
+        mock_request.assert_called_once_with('https://test.com/feed', conditional=True, client=None, cache=None)
+
+    def test_full_response_is_extracted_and_cached(self, tmp_path, make_response):
+        """A 200 is extracted and its validators stored for the next run"""
+        cache = HttpCache(tmp_path)
+        response = make_response(headers={'ETag': '"v2"'}, content=b'<rss/>')
+
+        with patch('rush_ci.fetch.http_cache', cache), \
+             patch('rush_ci.fetch.safe_request', return_value=response):
+            items = self.fetcher._fetch_cached('https://test.com/feed', lambda r: [{'title': 'Fresh'}])
+
+        assert items == [{'title': 'Fresh'}]
+        assert cache.validator_headers('https://test.com/feed') == {'If-None-Match': '"v2"'}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
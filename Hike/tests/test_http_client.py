@@ -0,0 +1,72 @@
+"""
+Unit tests for the shared HTTP client
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from rush_ci.utils.http_client import HttpClient, RETRY_STATUSES
+from rush_ci.utils.helpers import safe_request
+
+
+class TestHttpClient:
+    """Test cases for HttpClient"""
+
+    def test_adapter_pools_and_retries(self):
+        """Both schemes share one adapter with the configured pool and retry policy"""
+        client = HttpClient(pool_connections=8, pool_maxsize=3, retries=2, backoff_factor=0.25)
+        adapter = client.session.get_adapter('https://example.com')
+
+        assert adapter is client.session.get_adapter('http://example.com')
+        assert adapter._pool_maxsize == 3
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.backoff_factor == 0.25
+        assert set(RETRY_STATUSES) <= set(adapter.max_retries.status_forcelist)
+
+    def test_compression_and_keep_alive_headers(self):
+        """Sessions ask for compressed, kept-alive responses"""
+        client = HttpClient()
+
+        assert client.session.headers['Accept-Encoding'] == 'gzip, deflate'
+        assert client.session.headers['Connection'] == 'keep-alive'
+
+    def test_timeout_is_split_into_connect_and_read(self):
+        """A bare timeout becomes a (connect, read) tuple"""
+        client = HttpClient(connect_timeout=5, read_timeout=30)
+
+        with patch.object(client.session, 'get') as mock_get, \
+             patch('rush_ci.utils.http_client.rate_limiter'):
+            mock_get.return_value.status_code = 200
+            client.get('https://example.com', timeout=10)
+            client.get('https://example.com')
+
+        assert mock_get.call_args_list[0].kwargs['timeout'] == (5, 10)
+        assert mock_get.call_args_list[1].kwargs['timeout'] == (5, 30)
+
+
+class TestSafeRequest:
+    """Test cases for safe_request on top of the shared client"""
+
+    def test_uses_shared_client(self):
+        """safe_request goes through the pooled client rather than bare requests.get"""
+        response = Mock()
+        response.raise_for_status.return_value = None
+
+        with patch('rush_ci.utils.helpers.http_client') as mock_client:
+            mock_client.get.return_value = response
+            assert safe_request('https://example.com/feed', timeout=15) is response
+
+        mock_client.get.assert_called_once_with('https://example.com/feed', headers={}, timeout=15)
+
+    def test_failures_are_logged(self, caplog):
+        """A failed request is logged as a warning and returns None"""
+        with patch('rush_ci.utils.helpers.http_client') as mock_client:
+            mock_client.get.side_effect = requests.ConnectionError('refused')
+            assert safe_request('https://example.com/feed') is None
+
+        assert 'Request failed for https://example.com/feed: refused' in caplog.text
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
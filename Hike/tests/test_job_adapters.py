@@ -0,0 +1,81 @@
+"""
+Unit tests for job board adapter resolution
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+
+CAREERS_URL = 'https://test.com/careers'
+
+
+class TestJobAdapters:
+    """Test cases for DataFetcher job board adapter resolution"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher, make_response):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+        self.make_response = make_response
+        self.competitor = {'name': 'Test Company', 'careers_url': CAREERS_URL}
+
+    def _fetch(self, routes):
+        # Routes ignore paging parameters, like boards that return everything at once
+        def request(url, **kwargs):
+            content = routes.get(url.split('?')[0])
+            return self.make_response(content) if content is not None else None
+
+        with patch('rush_ci.fetch.safe_request', side_effect=request) as mock_request:
+            jobs = self.fetcher.fetch_jobs(self.competitor)
+        return jobs, [call.args[0] for call in mock_request.call_args_list]
+
+    def test_lever_is_resolved_then_reused(self):
+        """Lever's bare-list payload is recognised and its adapter reused without re-probing"""
+        routes = {
+            f'{CAREERS_URL}/api/jobs': [{
+                'text': 'Backend Engineer',
+                'categories': {'location': 'Bangalore'},
+                'hostedUrl': 'https://jobs.lever.co/test/1',
+                'createdAt': int(time.time() * 1000)
+            }]
+        }
+
+        jobs, requested = self._fetch(routes)
+        assert jobs[0]['role'] == 'Backend Engineer'
+        assert jobs[0]['location'] == 'Bangalore'
+        # The short first page is followed up once at its size; the repeat ends the listing
+        assert requested == [f'{CAREERS_URL}/jobs.json?page=1&per_page=100',
+                             f'{CAREERS_URL}/api/jobs?skip=0&limit=100',
+                             f'{CAREERS_URL}/api/jobs?skip=1&limit=1']
+        assert self.fetcher.job_adapters.get(CAREERS_URL)['adapter'] == 'lever'
+
+        jobs, requested = self._fetch(routes)
+        assert len(jobs) == 1
+        assert requested == [f'{CAREERS_URL}/api/jobs?skip=0&limit=100', f'{CAREERS_URL}/api/jobs?skip=1&limit=1']
+
+    def test_html_selector_is_learned(self):
+        """The HTML adapter remembers which selector matched"""
+        page = b'<html><body><div class="opening"><h3>Designer</h3><a href="/d">Apply</a></div></body></html>'
+
+        jobs, _ = self._fetch({CAREERS_URL: page})
+
+        assert jobs[0]['role'] == 'Designer'
+        assert self.fetcher.job_adapters.get(CAREERS_URL)['adapter'] == 'html'
+        assert self.fetcher.job_adapters.get(CAREERS_URL)['selector'] == '.opening'
+
+    def test_failed_adapter_is_reprobed(self):
+        """A stored adapter that stops working triggers a fresh probe"""
+        self.fetcher.job_adapters.set(CAREERS_URL, {'adapter': 'lever', 'url': f'{CAREERS_URL}/api/jobs'})
+        routes = {f'{CAREERS_URL}/jobs.json': {'jobs': [{'title': 'PM', 'location': {'name': 'Remote'}}]}}
+
+        jobs, requested = self._fetch(routes)
+
+        assert jobs[0]['role'] == 'PM'
+        assert requested == [f'{CAREERS_URL}/api/jobs?skip=0&limit=100',
+                             f'{CAREERS_URL}/jobs.json?page=1&per_page=100',
+                             f'{CAREERS_URL}/jobs.json?page=2&per_page=1']
+        assert self.fetcher.job_adapters.get(CAREERS_URL)['adapter'] == 'greenhouse'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
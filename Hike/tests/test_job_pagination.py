@@ -0,0 +1,141 @@
+"""
+Unit tests for paginated job board ingestion and snapshot diffs
+"""
+
+import time
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs
+
+from rush_ci.parse import DataParser
+
+CAREERS_URL = 'https://test.com/careers'
+LEVER_URL = 'https://api.lever.co/v0/postings/test?mode=json'
+GREENHOUSE_URL = 'https://boards-api.greenhouse.io/v1/boards/test/jobs'
+
+
+def _lever_postings(count, created_at=None):
+    created_at = created_at or int(time.time() * 1000)
+    return [
+        {'id': f'p{i}', 'text': f'Engineer {i}', 'categories': {'location': 'Bangalore'},
+         'hostedUrl': f'https://jobs.lever.co/test/p{i}', 'createdAt': created_at}
+        for i in range(count)
+    ]
+
+
+def _lever(postings, cap=None):
+    """A Lever-style board serving skip/limit pages, optionally capping the page size"""
+    def page(url):
+        query = parse_qs(urlparse(url).query)
+        skip = int(query['skip'][0])
+        limit = min(int(query['limit'][0]), cap or 1000)
+        return postings[skip:skip + limit]
+    return page
+
+
+class TestJobPagination:
+    """Test cases for DataFetcher job board pagination"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher, make_response, fetch_config):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+        self.fetcher.job_adapters.set(CAREERS_URL, {'adapter': 'lever', 'url': LEVER_URL})
+        self.make_response = make_response
+        self.competitor = {'name': 'Test Company', 'careers_url': CAREERS_URL, 'lever_company': 'test'}
+
+    def _fetch(self, board):
+        def request(url, **kwargs):
+            return self.make_response(board(url))
+
+        with patch('rush_ci.fetch.safe_request', side_effect=request) as mock_request:
+            jobs = self.fetcher.fetch_jobs(self.competitor)
+        pages = [parse_qs(urlparse(call.args[0]).query) for call in mock_request.call_args_list]
+        return jobs, [(int(page['skip'][0]), int(page['limit'][0])) for page in pages if 'skip' in page]
+
+    def test_all_pages_are_read(self):
+        """Every posting is returned, not just the first page"""
+        jobs, pages = self._fetch(_lever(_lever_postings(250)))
+
+        assert len(jobs) == 250
+        assert len({job['job_id'] for job in jobs}) == 250
+        assert sorted(pages)[:3] == [(0, 100), (100, 100), (200, 100)]
+
+    def test_server_page_cap_is_learned(self):
+        """A board serving fewer postings than asked for is paged at its cap, remembered per board"""
+        postings = _lever_postings(120)
+
+        jobs, pages = self._fetch(_lever(postings, cap=50))
+
+        assert len(jobs) == 120
+        assert pages[:2] == [(0, 100), (50, 50)]
+        assert self.fetcher.job_adapters.get(CAREERS_URL)['page_size'] == 50
+
+        _, pages = self._fetch(_lever(postings, cap=50))
+        assert pages[0] == (0, 50)
+
+    def test_configured_page_size_wins(self):
+        """job_page_size in the competitor config overrides the default"""
+        self.competitor['job_page_size'] = 30
+
+        jobs, pages = self._fetch(_lever(_lever_postings(70)))
+
+        assert len(jobs) == 70
+        assert sorted(pages)[:3] == [(0, 30), (30, 30), (60, 30)]
+
+    def test_reported_total_stops_paging(self):
+        """Greenhouse reports its total, so a board that fits one page costs one request"""
+        board = {'jobs': [{'id': 1, 'title': 'PM', 'absolute_url': 'https://test.com/jobs/1',
+                           'updated_at': datetime.now().isoformat()}], 'meta': {'total': 1}}
+
+        with patch('rush_ci.fetch.safe_request', return_value=self.make_response(board)) as mock_request:
+            jobs = self.fetcher._fetch_json_jobs(GREENHOUSE_URL, 'Test Company', 'greenhouse')
+
+        assert [job['role'] for job in jobs] == ['PM']
+        mock_request.assert_called_once()
+
+
+class TestJobSnapshots:
+    """Test cases for diffing job boards against the last run"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+
+    def test_postings_are_flagged_against_the_last_run(self):
+        """New, updated and closed postings are told apart once a run completes"""
+        recent = datetime.now()
+
+        def job(job_id, role, posted_at=recent):
+            return {'job_id': job_id, 'role': role, 'url': '', 'posted_at': posted_at, 'content_hash': role}
+
+        first = self.fetcher._diff_job_snapshot(CAREERS_URL, [
+            job('1', 'Designer'), job('2', 'Engineer', recent - timedelta(days=60))
+        ])
+        assert [item['is_new'] for item in first] == [True, False]
+
+        self.fetcher.complete_run()
+        second = self.fetcher._diff_job_snapshot(CAREERS_URL, [job('1', 'Senior Designer'), job('3', 'PM')])
+
+        assert [(item['is_new'], item['is_updated']) for item in second] == [(False, True), (True, False)]
+        assert self.fetcher.job_snapshots.get(CAREERS_URL)['jobs'] == {'1': 'Designer', '2': 'Engineer'}
+
+    def test_only_new_postings_alert(self):
+        """Postings already open on the last run still count towards hiring trends but do not alert"""
+        parser = DataParser()
+        jobs = parser.parse_jobs([
+            {'company': 'Test Company', 'role': 'VP Engineering', 'location': 'Remote', 'is_new': False},
+            {'company': 'Test Company', 'role': 'VP Marketing', 'location': 'Remote', 'is_new': True}
+        ])['Test Company']
+
+        alerts = [parser._check_alert_conditions(item, 'jobs') for item in jobs]
+
+        assert [alert is not None for alert in alerts] == [False, True]
+        assert parser._analyze_hiring_trends(jobs)['total_jobs'] == 2
+        assert parser._analyze_hiring_trends(jobs)['new_jobs'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
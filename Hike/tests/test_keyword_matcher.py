@@ -0,0 +1,81 @@
+"""
+Unit tests for the Aho-Corasick keyword matcher
+"""
+
+import pytest
+
+from rush_ci.parse import DataParser, ItemAnalysis
+from rush_ci.utils.helpers import extract_keywords
+from rush_ci.utils.keyword_matcher import KeywordMatcher, KeywordMatch
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher"""
+
+    def test_overlapping_keywords_in_one_scan(self):
+        """Keywords sharing prefixes and suffixes are all found, with their categories"""
+        matcher = KeywordMatcher({'a': ['he', 'she', 'hers'], 'b': ['she']})
+
+        assert matcher.find_all('she and hers') == [
+            KeywordMatch('she', 'a', 0, 3),
+            KeywordMatch('she', 'b', 0, 3),
+            KeywordMatch('hers', 'a', 8, 12)
+        ]
+        assert matcher.matches('she and hers') == {'a': ['she', 'hers'], 'b': ['she']}
+
+    def test_word_boundaries_and_prefixes(self):
+        """Short keywords do not match inside words unless marked with a trailing *"""
+        matcher = KeywordMatcher({'dept': ['pr', 'bd'], 'launch': ['launch*'], 'phrase': ['work from home', 'c-level']})
+
+        assert matcher.matches('product lead, bdr team') == {}
+        assert matcher.matches('head of pr (c-level), launched a bd push') == {
+            'dept': ['pr', 'bd'], 'launch': ['launch'], 'phrase': ['c-level']
+        }
+        assert matcher.matches('work from home only') == {'phrase': ['work from home']}
+
+    def test_extract_keywords(self):
+        """The helper keeps the caller's keywords and order and ignores case"""
+        assert extract_keywords('New App Update', ['update', 'app', 'new', 'pp']) == ['update', 'app', 'new']
+        assert extract_keywords('', ['app']) == []
+
+
+class TestParserHeuristics:
+    """Test cases for the parser's keyword heuristics"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = DataParser()
+
+    def test_job_roles(self):
+        """Department and seniority no longer match keyword fragments inside other words"""
+        cases = {
+            'Product Designer': ('product', 'mid'),
+            'Senior Backend Engineer': ('engineering', 'senior'),
+            'Internal Tools Developer': ('engineering', 'mid'),
+            'Head of PR': ('marketing', 'manager'),
+            'Recruiter': ('hr', 'mid')
+        }
+
+        for role, expected in cases.items():
+            analysis = ItemAnalysis(role)
+            assert (self.parser._extract_department(analysis), self.parser._determine_seniority(analysis)) == expected
+
+    def test_sentiment_and_alert_level(self):
+        """Inflected keywords count, words merely containing a keyword do not"""
+        launched = ItemAnalysis('Zupee launched its app after a successful beta')
+        download = ItemAnalysis('Download the update')
+
+        assert self.parser._analyze_sentiment(launched) == 'positive'
+        assert self.parser._determine_alert_level(launched) == 'high'
+        assert self.parser._analyze_sentiment(download) == 'neutral'
+        assert self.parser._extract_product_mentions(download) == ['update']
+
+    def test_locations(self):
+        """Country codes match as words only"""
+        assert self.parser._check_international_expansion(ItemAnalysis('Austin, US'))
+        assert not self.parser._check_international_expansion(ItemAnalysis('Bengaluru, Karnataka'))
+        assert self.parser._check_remote_work(ItemAnalysis('Remote (WFH)'))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,126 @@
+"""
+Unit tests for head-only metadata extraction and link previews
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from rush_ci.utils.helpers import parse_html_head, extract_meta_tags
+from rush_ci.utils.link_preview import LinkPreviewFetcher, build_preview
+from rush_ci.utils.state import JsonStateStore
+
+PAGE = (
+    b'<!doctype html><html><head><meta charset="utf-8"><title>Fallback</title>'
+    b'<meta property="og:title" content="Season 5 is here">'
+    b'<meta name="description" content="Patch notes">'
+    b'<meta property="og:image" content="/img/s5.png">'
+    b'<meta property="article:published_time" content="2024-03-01T10:00:00">'
+    b'<link rel="canonical" href="/news/season-5"></head>'
+    b'<body>' + b'<p>Long body</p>' * 5000 + b'</body></html>'
+)
+
+
+def _chunks(content, size=64, consumed=None):
+    for start in range(0, len(content), size):
+        if consumed is not None:
+            consumed.append(start)
+        yield content[start:start + size]
+
+
+class TestParseHtmlHead:
+    """Test cases for streaming head parsing"""
+
+    def test_stops_at_end_of_head(self):
+        """Chunks after </head> are never pulled from the stream"""
+        consumed = []
+        head = parse_html_head(_chunks(PAGE, consumed=consumed))
+
+        assert head['title'] == 'Fallback'
+        assert head['meta']['og:title'] == 'Season 5 is here'
+        assert head['links']['canonical'] == '/news/season-5'
+        assert head['bytes_read'] < 1024
+        assert len(consumed) * 64 < 1024
+
+    def test_implicit_head_and_byte_cap(self):
+        """Documents without a <head> stop at the first body content, and max_bytes caps the read"""
+        head = parse_html_head('<title>T</title><meta name="a" content="b"><p>body</p><meta name="c" content="d">')
+        assert head['meta'] == {'a': 'b'}
+
+        capped = parse_html_head(_chunks(b'<html><head>' + b'<meta name="x" content="y">' * 1000), max_bytes=256)
+        assert capped['bytes_read'] == 256
+
+    def test_extract_meta_tags(self):
+        """extract_meta_tags keeps its name/property -> content mapping"""
+        assert extract_meta_tags(PAGE.decode()) == {
+            'og:title': 'Season 5 is here',
+            'description': 'Patch notes',
+            'og:image': '/img/s5.png',
+            'article:published_time': '2024-03-01T10:00:00'
+        }
+
+
+class TestLinkPreviewFetcher:
+    """Test cases for LinkPreviewFetcher"""
+
+    def test_build_preview(self):
+        """OpenGraph fields win over the plain head, and links are resolved"""
+        preview = build_preview(parse_html_head(PAGE), 'https://test.com/news/season-5')
+
+        assert preview['title'] == 'Season 5 is here'
+        assert preview['description'] == 'Patch notes'
+        assert preview['image'] == 'https://test.com/img/s5.png'
+        assert preview['canonical'] == 'https://test.com/news/season-5'
+        assert preview['published_at'] == datetime(2024, 3, 1, 10, 0)
+
+    def test_previews_are_cached_by_canonical_url(self, tmp_path, make_response):
+        """Tracking variants of a URL share one fetch, and later runs hit the cache"""
+        fetcher = LinkPreviewFetcher(JsonStateStore('link_previews', tmp_path), max_workers=2)
+        items = [{'url': 'https://test.com/news/season-5?utm_source=x'}, {'url': 'https://test.com/news/season-5/'}]
+
+        with patch('rush_ci.utils.link_preview.http_client') as client:
+            client.get.return_value = make_response(PAGE, headers={'Content-Type': 'text/html; charset=utf-8'},
+                                                    url='https://test.com/news/season-5?utm_source=x')
+            fetcher.enrich(items)
+            client.get.assert_called_once_with('https://test.com/news/season-5?utm_source=x', stream=True)
+
+            client.get.reset_mock()
+            reloaded = LinkPreviewFetcher(JsonStateStore('link_previews', tmp_path))
+            previews = reloaded.fetch([item['url'] for item in items])
+
+        assert client.get.call_count == 0
+        assert [item['preview']['title'] for item in items] == ['Season 5 is here'] * 2
+        assert previews[items[0]['url']]['canonical'] == 'https://test.com/news/season-5'
+
+    def test_expired_and_non_html(self, tmp_path, make_response):
+        """Stale previews are refetched, and non-HTML responses give no preview"""
+        store = JsonStateStore('link_previews', tmp_path)
+        store.set('https://test.com/report.pdf', {'title': 'Old', 'fetched_at': datetime.now() - timedelta(days=60)})
+        fetcher = LinkPreviewFetcher(store, ttl_days=30)
+
+        with patch('rush_ci.utils.link_preview.http_client') as client:
+            client.get.return_value = make_response(b'%PDF-1.4', headers={'Content-Type': 'application/pdf'})
+            assert fetcher.fetch(['https://test.com/report.pdf']) == {}
+
+        assert client.get.call_count == 1
+        client.get.return_value.close.assert_called_once()
+
+    def test_expired_entries_are_dropped_in_one_write(self, tmp_path, make_response):
+        """Saving new previews removes every expired entry with a single rewrite of the store"""
+        store = JsonStateStore('link_previews', tmp_path)
+        stale = datetime.now() - timedelta(days=60)
+        store.update({f'https://test.com/old/{i}': {'title': 'Old', 'fetched_at': stale} for i in range(5)})
+        fetcher = LinkPreviewFetcher(store, ttl_days=30)
+        page = b'<html><head><title>New</title></head><body></body></html>'
+
+        with patch('rush_ci.utils.link_preview.http_client') as client, \
+             patch.object(store, 'save', wraps=store.save) as save:
+            client.get.return_value = make_response(page, headers={'Content-Type': 'text/html'})
+            fetcher.fetch(['https://test.com/new'])
+
+        assert save.call_count == 1
+        assert list(JsonStateStore('link_previews', tmp_path).all()) == ['https://test.com/new']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
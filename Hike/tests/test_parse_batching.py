@@ -0,0 +1,189 @@
+"""
+Unit tests for spaCy model loading and per-item analysis in DataParser
+"""
+
+import sys
+import subprocess
+import pytest
+import spacy
+from pathlib import Path
+from unittest.mock import patch
+
+from rush_ci import parse
+from rush_ci.parse import DataParser, ItemAnalysis, get_nlp
+
+
+def _pipeline():
+    """A small rule-based pipeline tagging a few nouns and one organisation"""
+    nlp = spacy.blank('en')
+    nlp.add_pipe('attribute_ruler').add([[{'LOWER': 'tournament'}], [{'LOWER': 'rummy'}]], {'POS': 'NOUN'})
+    nlp.add_pipe('entity_ruler').add_patterns([{'label': 'ORG', 'pattern': 'Zupee'}])
+    return nlp
+
+
+class TestBatchedAnalysis:
+    """Test cases for DataParser._analyze_texts"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = DataParser()
+        self.nlp = _pipeline()
+
+    def test_one_pipe_pass_per_batch(self):
+        """Keywords and entities of every item come from a single nlp.pipe call"""
+        tweets = [
+            {'company': 'Zupee', 'text': 'Zupee opens a Rummy Tournament'},
+            {'company': 'Zupee', 'text': ''},
+            {'company': 'Zupee', 'text': 'Another tournament tonight'}
+        ]
+
+        with patch('rush_ci.parse.get_nlp', return_value=self.nlp), \
+             patch.object(self.nlp, 'pipe', wraps=self.nlp.pipe) as pipe:
+            parsed = self.parser.parse_tweets(tweets)['Zupee']
+
+        assert pipe.call_count == 1
+        assert [tweet['keywords'] for tweet in parsed] == [['rummy', 'tournament'], [], ['tournament']]
+        assert [tweet['entities'] for tweet in parsed] == [{'ORG': ['Zupee']}, {}, {}]
+
+    def test_matches_single_text_path(self):
+        """The batch path agrees with the per-text helpers"""
+        text = 'Zupee hosts a rummy tournament, then another Tournament'
+
+        with patch('rush_ci.parse.get_nlp', return_value=self.nlp):
+            [analysis] = self.parser._analyze_texts([text])
+
+            assert analysis.keywords == self.parser._extract_keywords_from_text(text) == ['rummy', 'tournament']
+            assert analysis.entities == self.parser._extract_entities(text) == {'ORG': ['Zupee']}
+
+    def test_worker_processes_only_for_large_batches(self):
+        """n_process is only passed on when there is more than one batch of texts"""
+        pipe_in_process = self.nlp.pipe
+
+        with patch('rush_ci.parse.get_nlp', return_value=self.nlp), \
+             patch.object(self.nlp, 'pipe', side_effect=lambda texts, **kwargs: pipe_in_process(texts)) as pipe, \
+             patch('rush_ci.parse.config') as mock_config:
+            mock_config.nlp_batch_size = 2
+            mock_config.nlp_n_process = 4
+
+            self.parser._analyze_texts(['rummy'] * 2)
+            assert pipe.call_args.kwargs == {'batch_size': 2, 'n_process': 1}
+
+            self.parser._analyze_texts(['rummy'] * 3)
+            assert pipe.call_args.kwargs == {'batch_size': 2, 'n_process': 4}
+
+    def test_without_model(self):
+        """Without a spaCy model keywords fall back to plain words and entities are empty"""
+        with patch('rush_ci.parse.get_nlp', return_value=None):
+            analyses = self.parser._analyze_texts(['Big rummy tournament', ''])
+
+        assert [(analysis.keywords, analysis.entities) for analysis in analyses] == [
+            (['rummy', 'tournament'], {}), ([], {})
+        ]
+
+
+class TestItemAnalysis:
+    """Test cases for reusing each item's analysis across parsing and alerts"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = DataParser()
+        self.nlp = _pipeline()
+
+    def test_alerts_reuse_parsed_analysis(self):
+        """Parsing and alerting a batch runs spaCy once and decides each alert level once"""
+        blogs = [
+            {'company': 'Zupee', 'title': 'Zupee raises Series B', 'content': 'New rummy tournament', 'url': 'https://z.com/b'},
+            {'company': 'Zupee', 'title': 'Weekly recap', 'content': 'Tournament winners', 'url': 'https://z.com/r'}
+        ]
+
+        with patch('rush_ci.parse.get_nlp', return_value=self.nlp), \
+             patch.object(self.nlp, 'pipe', wraps=self.nlp.pipe) as pipe, \
+             patch.object(type(self.nlp), '__call__', side_effect=AssertionError('item analysed twice')), \
+             patch.object(self.parser.alert_rules, 'evaluate', wraps=self.parser.alert_rules.evaluate) as evaluate:
+            parsed = self.parser.parse_stream(iter([('blogs', blogs)]))
+
+        assert pipe.call_count == 1
+        assert evaluate.call_count == 2
+        assert [blog['alert_level'] for blog in parsed['insights']['blogs']['Zupee']] == ['high', 'low']
+        assert parsed['alerts'][0]['url'] == 'https://z.com/b'
+        assert parsed['alerts'][0]['keywords'] == parsed['insights']['blogs']['Zupee'][0]['keywords']
+
+    def test_summaries_reuse_parsed_analysis(self):
+        """Product updates, market movements and opportunities match each item's keywords only once"""
+        blogs = [
+            {'company': 'Zupee', 'title': 'Zupee raises Series B funding', 'content': 'New rummy game launch'},
+            {'company': 'Zupee', 'title': 'Weekly recap', 'content': 'Ludo winners'}
+        ]
+
+        with patch('rush_ci.parse.get_nlp', return_value=None), \
+             patch.object(parse.KEYWORD_MATCHER, 'matches', wraps=parse.KEYWORD_MATCHER.matches) as matches:
+            analyses = self.parser.analyze_items('blogs', blogs)
+            insights = {'Zupee': {'blogs': self.parser.parse_blogs(blogs, analyses)['Zupee']}}
+            by_text = {analysis.text: analysis for analysis in analyses}
+
+            summaries = self.parser.generate_company_summaries(insights, by_text)
+            trends = self.parser.analyze_trends(insights, by_text)
+
+        assert matches.call_count == 2
+        assert [update['title'] for update in summaries['Zupee']['product_updates']] == ['Zupee raises Series B funding']
+        assert trends['market_movements'] == ['Funding activity: Zupee', 'Product launches: Zupee']
+
+    def test_keywords_are_tagged_on_original_case(self):
+        """Keywords come from the cased Doc shared with the entities, so proper nouns are left out"""
+        nlp = spacy.blank('en')
+        nlp.add_pipe('attribute_ruler').add_patterns([
+            {'patterns': [[{'TEXT': 'Rummy'}]], 'attrs': {'POS': 'PROPN'}},
+            {'patterns': [[{'TEXT': 'rummy'}], [{'LOWER': 'night'}]], 'attrs': {'POS': 'NOUN'}}
+        ])
+
+        with patch('rush_ci.parse.get_nlp', return_value=nlp):
+            [cased, lowered] = self.parser._analyze_texts(['Rummy Night', 'rummy night'])
+
+        assert cased.keywords == ['night']
+        assert lowered.keywords == ['rummy', 'night']
+
+    def test_extractors_read_the_analysis(self):
+        """Mention, hashtag and sentiment extractors work off one ItemAnalysis"""
+        analysis = ItemAnalysis('Launch of #RummyCup with @Zupee, backed by Series A funding')
+
+        with patch('rush_ci.parse.get_nlp', return_value=None):
+            assert self.parser._analyze_sentiment(analysis) == 'positive'
+            assert self.parser._extract_funding_mentions(analysis) == ['funding', 'series', 'backed']
+            assert self.parser._extract_hashtags(analysis) == ['#RummyCup']
+            assert self.parser._extract_mentions(analysis) == ['@Zupee']
+            assert self.parser._determine_alert_level(analysis) == analysis.alert_level == 'high'
+
+
+class TestGetNlp:
+    """Test cases for lazy model loading"""
+
+    @pytest.fixture(autouse=True)
+    def _unloaded(self):
+        with patch.multiple(parse, _nlp=None, _nlp_loaded=False):
+            yield
+
+    def test_loaded_once_without_unused_pipes(self):
+        """The model is loaded on first use only, with the parser and lemmatizer excluded"""
+        with patch('spacy.load', return_value=_pipeline()) as load:
+            assert get_nlp() is get_nlp()
+
+        load.assert_called_once_with('en_core_web_sm', exclude=['parser', 'senter', 'lemmatizer'])
+
+    def test_missing_model(self):
+        """A missing model is reported once and parsing falls back to plain keywords"""
+        with patch('spacy.load', side_effect=OSError('no model')) as load:
+            assert get_nlp() is None
+            assert DataParser()._extract_keywords_from_text('Rummy tournament') == ['rummy', 'tournament']
+
+        assert load.call_count == 1
+
+    def test_import_does_not_load_spacy(self):
+        """Importing the parser leaves spaCy unimported"""
+        code = 'import sys, rush_ci.parse; print("spacy" in sys.modules)'
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                check=True, cwd=Path(__file__).parents[1])
+        assert result.stdout.strip() == 'False'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,100 @@
+"""
+Unit tests for adaptive polling cadence
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from rush_ci.utils.poll_schedule import PollScheduler
+from rush_ci.utils.state import JsonStateStore
+
+MEDIUM = {'name': 'Test Company', 'priority': 'medium'}
+HIGH = {'name': 'Test Company', 'priority': 'high'}
+
+
+class TestPollScheduler:
+    """Test cases for PollScheduler"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.now = datetime(2024, 1, 1, 12, 0)
+
+    def _poll(self, scheduler, new_items, hours_later, competitor=MEDIUM, source_type='tweets'):
+        self.now += timedelta(hours=hours_later)
+        next_poll = scheduler.observe('test', competitor, source_type, new_items, now=self.now)
+        scheduler.commit()
+        return (next_poll - self.now).total_seconds() / 60
+
+    def test_busy_sources_are_polled_more_often(self, tmp_path):
+        """The interval follows the smoothed publish rate, within the source's bounds"""
+        scheduler = PollScheduler(JsonStateStore('poll_schedule', tmp_path))
+
+        assert self._poll(scheduler, 0, 0) == 30
+        busy = [self._poll(scheduler, 8, 1) for _ in range(6)]
+
+        assert busy == sorted(busy, reverse=True)
+        assert busy[0] < 30
+        assert busy[-1] == 15
+
+    def test_quiet_sources_back_off_to_the_maximum(self, tmp_path):
+        """Polls that find nothing double the interval up to POLL_MAX"""
+        scheduler = PollScheduler(JsonStateStore('poll_schedule', tmp_path))
+
+        intervals = [self._poll(scheduler, 0, 24, source_type='blogs') for _ in range(10)]
+
+        assert intervals[:3] == [120, 240, 480]
+        assert intervals[-1] == 10080
+
+    def test_high_priority_competitors_are_favoured(self, tmp_path):
+        """A high-priority competitor with the same history is polled sooner"""
+        medium = PollScheduler(JsonStateStore('medium', tmp_path))
+        high = PollScheduler(JsonStateStore('high', tmp_path))
+
+        def history(scheduler, competitor):
+            self.now = datetime(2024, 1, 1, 12, 0)
+            self._poll(scheduler, 5, 0, competitor=competitor, source_type='jobs')
+            return self._poll(scheduler, 1, 24, competitor=competitor, source_type='jobs')
+
+        assert history(high, HIGH) == pytest.approx(history(medium, MEDIUM) / 2)
+
+    def test_due_only_after_next_poll(self, tmp_path):
+        """Units never polled are due; others once their next poll time passes"""
+        scheduler = PollScheduler(JsonStateStore('poll_schedule', tmp_path))
+        assert scheduler.is_due('test', 'jobs', self.now)
+
+        minutes = self._poll(scheduler, 0, 0, source_type='jobs')
+
+        assert not scheduler.is_due('test', 'jobs', self.now + timedelta(minutes=minutes - 1))
+        assert scheduler.is_due('test', 'jobs', self.now + timedelta(minutes=minutes))
+
+
+class TestDueFetch:
+    """Test cases for fetching only the due competitor/source pairs"""
+
+    def test_only_due_units_are_fetched(self, fetcher, fetch_config):
+        """A completed run schedules each pair; the next due-only run skips the ones not due"""
+        competitors = {'test': {'name': 'Test Company', 'priority': 'high'}}
+
+        with patch.object(fetcher, 'fetch_blogs', return_value=[]) as fetch_blogs, \
+             patch.object(fetcher, 'fetch_tweets', return_value=[{'text': 'hi'}]), \
+             patch.object(fetcher, 'fetch_linkedin_posts', return_value=[]), \
+             patch.object(fetcher, 'fetch_jobs', return_value=[]):
+            fetch_config.competitors = competitors
+
+            fetcher.fetch_all_sources(due_only=True)
+            fetcher.complete_run()
+            assert fetcher.fetch_units(due_only=True) == []
+
+            fetcher.poll_schedule.store.set('test:blogs', {
+                **fetcher.poll_schedule.store.get('test:blogs'), 'next_poll': datetime.now() - timedelta(minutes=1)
+            })
+            fetch_blogs.reset_mock()
+            data = fetcher.fetch_all_sources(due_only=True)
+
+        fetch_blogs.assert_called_once()
+        assert data == {'blogs': [], 'tweets': [], 'linkedin': [], 'jobs': []}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
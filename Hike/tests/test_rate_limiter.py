@@ -0,0 +1,65 @@
+"""
+Unit tests for the per-host rate limiter
+"""
+
+import pytest
+from unittest.mock import patch
+
+from rush_ci.utils.rate_limiter import TokenBucket, HostRateLimiter
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket"""
+
+    def test_burst_is_free_then_waits(self):
+        """Requests within the burst never wait; the next one waits 1/rate"""
+        with patch('rush_ci.utils.rate_limiter.time.monotonic', return_value=100.0):
+            bucket = TokenBucket(rate=0.5, burst=2)
+
+            assert bucket.reserve() == 0.0
+            assert bucket.reserve() == 0.0
+            assert bucket.reserve() == pytest.approx(2.0)
+            assert bucket.reserve() == pytest.approx(4.0)
+
+    def test_refills_over_time(self):
+        """Idle time refills the bucket up to its capacity"""
+        with patch('rush_ci.utils.rate_limiter.time.monotonic') as mock_clock:
+            mock_clock.return_value = 0.0
+            bucket = TokenBucket(rate=1.0, burst=1)
+            assert bucket.reserve() == 0.0
+
+            mock_clock.return_value = 60.0
+            assert bucket.reserve() == 0.0
+            assert bucket.reserve() == pytest.approx(1.0)
+
+
+class TestHostRateLimiter:
+    """Test cases for HostRateLimiter"""
+
+    def test_hosts_are_independent(self):
+        """Hitting different hosts never waits; hitting the same host again does"""
+        limiter = HostRateLimiter({'default': {'rate': 0.5, 'burst': 1}, 'hosts': {}})
+
+        with patch('rush_ci.utils.rate_limiter.time.sleep') as mock_sleep:
+            for i in range(5):
+                limiter.acquire(f'https://site{i}.example.com/feed')
+            mock_sleep.assert_not_called()
+
+            limiter.acquire('https://site0.example.com/rss')
+            mock_sleep.assert_called_once()
+
+    def test_per_host_overrides(self):
+        """Host entries override the default rate and burst"""
+        limiter = HostRateLimiter({
+            'default': {'rate': 0.1, 'burst': 1},
+            'hosts': {'api.twitter.com': {'rate': 10, 'burst': 3}}
+        })
+
+        with patch('rush_ci.utils.rate_limiter.time.sleep') as mock_sleep:
+            for _ in range(3):
+                limiter.acquire('api.twitter.com')
+            mock_sleep.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
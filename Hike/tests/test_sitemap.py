@@ -0,0 +1,164 @@
+"""
+Unit tests for sitemap change detection
+"""
+
+import gzip
+import pytest
+from unittest.mock import patch
+
+from rush_ci.utils.sitemap import SitemapWatcher, iter_sitemap, open_sitemap_stream, sitemap_candidates
+
+BLOG_URL = 'https://test.com/blog'
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def _urlset(*pages):
+    entries = ''.join(f'<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>' for loc, lastmod in pages)
+    return f'<?xml version="1.0"?><urlset {NS}>{entries}</urlset>'.encode()
+
+
+def _index(*sitemaps):
+    entries = ''.join(f'<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>' for loc, lastmod in sitemaps)
+    return f'<?xml version="1.0"?><sitemapindex {NS}>{entries}</sitemapindex>'.encode()
+
+
+class TestSitemapParsing:
+    """Test cases for streaming sitemap parsing"""
+
+    def test_plain_and_gzipped(self, make_response):
+        """Gzipped sitemaps are detected by content, not by name"""
+        content = _urlset(('https://test.com/blog/a', '2024-01-01'))
+
+        for body in (content, gzip.compress(content)):
+            entries = list(iter_sitemap(open_sitemap_stream(make_response(body))))
+            assert entries == [('url', 'https://test.com/blog/a', '2024-01-01')]
+
+    def test_candidates_prefer_robots(self):
+        """Sitemaps declared in robots.txt are tried before conventional paths"""
+        robots = 'User-agent: *\nSitemap: https://test.com/custom-sitemap.xml\n'
+
+        assert sitemap_candidates(BLOG_URL, robots) == [
+            'https://test.com/custom-sitemap.xml',
+            'https://test.com/sitemap.xml',
+            'https://test.com/sitemap_index.xml'
+        ]
+
+
+class TestSitemapWatcher:
+    """Test cases for SitemapWatcher"""
+
+    def test_only_new_or_changed_pages_are_reported(self, make_response):
+        """Pages are diffed on lastmod and filtered to the blog prefix"""
+        files = {'https://test.com/sitemap.xml': _urlset(
+            ('https://test.com/blog/a', '2024-01-01'),
+            ('https://test.com/blog/b', '2024-01-05'),
+            ('https://test.com/pricing', '2024-01-05')
+        )}
+        watcher = SitemapWatcher(lambda url: make_response(files[url]))
+
+        changed, snapshot = watcher.changes('https://test.com/sitemap.xml', BLOG_URL + '/', {})
+        assert [loc for loc, _ in changed] == ['https://test.com/blog/a', 'https://test.com/blog/b']
+
+        files['https://test.com/sitemap.xml'] = _urlset(
+            ('https://test.com/blog/a', '2024-01-01'),
+            ('https://test.com/blog/b', '2024-01-09'),
+            ('https://test.com/blog/c', '2024-01-10')
+        )
+        changed, _ = watcher.changes('https://test.com/sitemap.xml', BLOG_URL + '/', snapshot)
+        assert changed == [('https://test.com/blog/b', '2024-01-09'), ('https://test.com/blog/c', '2024-01-10')]
+
+    def test_unchanged_child_sitemaps_are_not_downloaded(self, make_response):
+        """An index whose children kept their lastmod costs one request"""
+        files = {
+            'https://test.com/sitemap_index.xml': _index(
+                ('https://test.com/posts.xml', '2024-01-01'), ('https://test.com/pages.xml', '2024-01-01')
+            ),
+            'https://test.com/posts.xml': _urlset(('https://test.com/blog/a', '2024-01-01')),
+            'https://test.com/pages.xml': _urlset(('https://test.com/about', '2024-01-01'))
+        }
+        requested = []
+
+        def fetch(url):
+            requested.append(url)
+            return make_response(files[url])
+
+        watcher = SitemapWatcher(fetch)
+        _, snapshot = watcher.changes('https://test.com/sitemap_index.xml', BLOG_URL + '/', {})
+        requested.clear()
+
+        changed, carried = watcher.changes('https://test.com/sitemap_index.xml', BLOG_URL + '/', snapshot)
+
+        assert changed == []
+        assert requested == ['https://test.com/sitemap_index.xml']
+        assert carried['https://test.com/posts.xml']['pages'] == {'https://test.com/blog/a': '2024-01-01'}
+
+
+class TestSitemapBlogs:
+    """Test cases for DataFetcher sitemap-driven blog scraping"""
+
+    def test_changed_posts_only(self, fetcher, make_response):
+        """The first run baselines the sitemap; later runs fetch only changed posts"""
+        files = {'https://test.com/sitemap.xml': _urlset(('https://test.com/blog/a', '2024-01-01T10:00:00'))}
+        pages = {
+            'https://test.com/blog/a': b'<html><head><title>Post A</title></head><body><article><p>Alpha</p></article></body></html>',
+            'https://test.com/blog/b': b'<html><head><title>Post B</title></head><body><article><p>Beta</p></article></body></html>'
+        }
+
+        def request(url, **kwargs):
+            return make_response(pages[url]) if url in pages else None
+
+        with patch('rush_ci.fetch.safe_request', side_effect=request), \
+             patch('rush_ci.utils.articles.safe_request', side_effect=request) as article_request, \
+             patch.object(fetcher, '_stream_request', side_effect=lambda url: make_response(files[url]) if url in files else None):
+            blogs = fetcher._scrape_blog_sitemap(BLOG_URL, 'Test Company')
+            assert [(blog['title'], blog['source']) for blog in blogs] == [('Post A', 'sitemap')]
+
+            files['https://test.com/sitemap.xml'] = _urlset(
+                ('https://test.com/blog/a', '2024-01-01T10:00:00'), ('https://test.com/blog/b', '2024-01-02T10:00:00')
+            )
+            article_request.reset_mock()
+            blogs = fetcher._scrape_blog_sitemap(BLOG_URL, 'Test Company')
+
+        assert [blog['content'] for blog in blogs] == ['Beta']
+        assert [call.args[0] for call in article_request.call_args_list] == ['https://test.com/blog/b']
+        assert fetcher.sitemaps.get(BLOG_URL)['sitemap_url'] == 'https://test.com/sitemap.xml'
+
+    def test_deferred_pages_are_retried_from_unchanged_child_sitemaps(self, fetcher, make_response):
+        """A page that failed to fetch is retried next run even though its child sitemap kept its lastmod"""
+        files = {
+            'https://test.com/sitemap.xml': _index(('https://test.com/posts.xml', '2024-01-01')),
+            'https://test.com/posts.xml': _urlset(('https://test.com/blog/a', '2024-01-01T10:00:00'))
+        }
+        pages = {}
+
+        def request(url, **kwargs):
+            return make_response(pages[url]) if url in pages else None
+
+        with patch('rush_ci.fetch.safe_request', side_effect=request), \
+             patch('rush_ci.utils.articles.safe_request', side_effect=request), \
+             patch.object(fetcher, '_stream_request', side_effect=lambda url: make_response(files[url]) if url in files else None):
+            assert fetcher._scrape_blog_sitemap(BLOG_URL, 'Test Company') == []
+
+            pages['https://test.com/blog/a'] = b'<html><head><title>Post A</title></head><body><article><p>Alpha</p></article></body></html>'
+            blogs = fetcher._scrape_blog_sitemap(BLOG_URL, 'Test Company')
+
+        assert [blog['title'] for blog in blogs] == ['Post A']
+        assert fetcher.sitemaps.get(BLOG_URL)['snapshot']['https://test.com/posts.xml']['lastmod'] == '2024-01-01'
+
+    def test_no_sitemap_falls_back(self, fetcher):
+        """Sites without a readable sitemap return None so the listing page is scraped"""
+        with patch('rush_ci.fetch.safe_request', return_value=None) as robots, \
+             patch.object(fetcher, '_stream_request', return_value=None) as stream:
+            assert fetcher._scrape_blog_sitemap(BLOG_URL, 'Test Company') is None
+            assert stream.call_count == 2
+
+            # The miss is remembered, so the next run does not probe again
+            assert fetcher._scrape_blog_sitemap(BLOG_URL, 'Test Company') is None
+
+        assert robots.call_count == 1
+        assert stream.call_count == 2
+        assert fetcher.sitemaps.get(BLOG_URL)['sitemap_url'] is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
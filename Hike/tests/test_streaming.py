@@ -0,0 +1,117 @@
+"""
+Unit tests for streaming fetch -> parse pipelining
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+
+from rush_ci.parse import DataParser
+
+
+def _competitors(count):
+    return {
+        f'c{i}': {'name': f'Company {i}', 'blog_url': f'https://c{i}.example.com/blog'}
+        for i in range(count)
+    }
+
+
+def _blog(company, title):
+    return {'company': company, 'title': title, 'content': 'Series A funding announced', 'url': '', 'source': 'rss'}
+
+
+class TestIterSources:
+    """Test cases for DataFetcher.iter_sources"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+
+    def _patch_sources(self, blogs):
+        return [
+            patch.object(self.fetcher, 'fetch_blogs', side_effect=blogs),
+            patch.object(self.fetcher, 'fetch_tweets', return_value=[]),
+            patch.object(self.fetcher, 'fetch_linkedin_posts', return_value=[]),
+            patch.object(self.fetcher, 'fetch_jobs', return_value=[])
+        ]
+
+    @pytest.mark.parametrize('fetch_mode', ['sequential', 'async'])
+    def test_yields_every_pair(self, fetch_mode, fetch_config):
+        """One batch per competitor/source pair, in both fetch modes"""
+        patches = self._patch_sources(lambda c: [_blog(c['name'], 'Post')])
+
+        with patches[0], patches[1], patches[2], patches[3]:
+            fetch_config.competitors = _competitors(3)
+            fetch_config.fetch_mode = fetch_mode
+
+            batches = list(self.fetcher.iter_sources(queue_size=1))
+
+        assert len(batches) == 12
+        blog_batches = [items for source_type, items in batches if source_type == 'blogs']
+        assert sorted(items[0]['company'] for items in blog_batches) == ['Company 0', 'Company 1', 'Company 2']
+
+    def test_batches_arrive_before_fetch_completes(self, fetch_config):
+        """The consumer sees the first batch while a later fetch is still blocked"""
+        release = threading.Event()
+
+        def blogs(competitor_config):
+            if competitor_config['name'] == 'Company 1':
+                release.wait(5)
+            return [_blog(competitor_config['name'], 'Post')]
+
+        patches = self._patch_sources(blogs)
+
+        with patches[0], patches[1], patches[2], patches[3]:
+            fetch_config.competitors = _competitors(2)
+
+            stream = self.fetcher.iter_sources()
+            first = next(stream)
+            assert not release.is_set()
+            release.set()
+            rest = list(stream)
+
+        assert first == ('blogs', [_blog('Company 0', 'Post')])
+        assert len(rest) == 7
+
+    def test_fetch_errors_are_raised_to_consumer(self):
+        """An error outside the per-source guard surfaces from the iterator"""
+        with patch.object(self.fetcher, 'fetch_all_sources', side_effect=RuntimeError('boom')):
+            with pytest.raises(RuntimeError):
+                list(self.fetcher.iter_sources())
+
+
+class TestParseStream:
+    """Test cases for DataParser.parse_stream"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = DataParser()
+
+    def test_matches_batch_parsing(self):
+        """Merging per-batch results gives the same insights and alerts as parse_all_data"""
+        raw_data = {
+            'blogs': [_blog('Company 0', 'First'), _blog('Company 1', 'Second'), _blog('Company 0', 'Third')],
+            'jobs': [{'company': 'Company 1', 'role': 'VP Engineering', 'location': 'Remote'}]
+        }
+        batches = [
+            ('jobs', raw_data['jobs']),
+            ('blogs', raw_data['blogs'][:1]),
+            ('tweets', []),
+            ('blogs', raw_data['blogs'][1:])
+        ]
+
+        collected = {}
+        streamed = self.parser.parse_stream(iter(batches), collected)
+        batch = self.parser.parse_all_data(raw_data)
+
+        assert streamed['insights'] == batch['insights']
+        assert sorted(alert['text'] for alert in streamed['alerts']) == \
+            sorted(alert['text'] for alert in batch['alerts'])
+        assert [alert['level'] for alert in streamed['alerts']] == [alert['level'] for alert in batch['alerts']]
+        assert collected['blogs'] == [raw_data['blogs'][0]] + raw_data['blogs'][1:]
+        assert collected['tweets'] == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,85 @@
+"""
+Unit tests for incremental Twitter fetching
+"""
+
+import pytest
+from unittest.mock import patch
+
+
+class TestTwitterFetching:
+    """Test cases for DataFetcher Twitter fetching"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher, fetch_config):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+        self.competitor = {'name': 'Test Company', 'twitter_handle': 'TestCo'}
+
+    def test_handles_resolved_in_one_batch_and_cached(self, make_response):
+        """All handles go through one users/by call; cached handles are not looked up again"""
+        lookup = make_response({'data': [
+            {'id': '1', 'username': 'TestCo'},
+            {'id': '2', 'username': 'other'}
+        ]})
+
+        with patch('rush_ci.fetch.http_client') as mock_client:
+            mock_client.get.return_value = lookup
+
+            assert self.fetcher.resolve_twitter_users(['TestCo', 'other']) == {'testco': '1', 'other': '2'}
+            assert self.fetcher.resolve_twitter_users(['testco']) == {'testco': '1'}
+
+        mock_client.get.assert_called_once()
+        assert mock_client.get.call_args.kwargs['params'] == {'usernames': 'other,testco'}
+
+    def test_since_id_watermark(self, make_response):
+        """Polls after the first only ask for tweets newer than the stored watermark"""
+        self.fetcher.twitter_users.set('testco', '1')
+        first_poll = make_response({
+            'data': [{'id': '200', 'text': 'Big launch today', 'created_at': '2024-01-01T12:00:00.000Z'}],
+            'meta': {'newest_id': '200'}
+        })
+        second_poll = make_response({'meta': {'result_count': 0}})
+
+        with patch('rush_ci.fetch.http_client') as mock_client:
+            mock_client.get.side_effect = [first_poll, second_poll]
+
+            tweets = self.fetcher.fetch_tweets(self.competitor)
+            assert [tweet['tweet_id'] for tweet in tweets] == ['200']
+            assert 'since_id' not in mock_client.get.call_args.kwargs['params']
+
+            # The since_id only advances once the run completes
+            assert self.fetcher.twitter_since_ids.get('testco') is None
+            self.fetcher.complete_run()
+
+            assert self.fetcher.fetch_tweets(self.competitor) == []
+
+        assert mock_client.get.call_args.kwargs['params']['since_id'] == '200'
+        assert self.fetcher.twitter_since_ids.get('testco') == '200'
+
+    def test_new_tweets_are_paginated(self, make_response):
+        """Every page of new tweets is read; a failed page keeps the since_id for the next run"""
+        self.fetcher.twitter_users.set('testco', '1')
+        self.fetcher.twitter_since_ids.set('testco', '100')
+        pages = [
+            make_response({'data': [{'id': '300', 'text': 'Newest', 'created_at': '2024-01-03T12:00:00.000Z'}],
+                       'meta': {'newest_id': '300', 'next_token': 'p2'}}),
+            make_response({'data': [{'id': '200', 'text': 'Older', 'created_at': '2024-01-02T12:00:00.000Z'}],
+                       'meta': {'newest_id': '200'}})
+        ]
+
+        with patch('rush_ci.fetch.http_client') as mock_client:
+            mock_client.get.side_effect = [pages[0], make_response({}, status_code=503)]
+            assert self.fetcher.fetch_tweets(self.competitor) == []
+
+            mock_client.get.side_effect = pages
+            tweets = self.fetcher.fetch_tweets(self.competitor)
+            self.fetcher.complete_run()
+
+        assert [tweet['tweet_id'] for tweet in tweets] == ['300', '200']
+        assert mock_client.get.call_args.kwargs['params']['pagination_token'] == 'p2'
+        assert mock_client.get.call_args.kwargs['params']['since_id'] == '100'
+        assert self.fetcher.twitter_since_ids.get('testco') == '300'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,116 @@
+"""
+Unit tests for watermark-based recency pushdown
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+from rush_ci.parse import DataParser
+
+FEED_URL = 'https://test.com/blog/feed'
+CAREERS_URL = 'https://test.com/careers'
+JOBS_URL = 'https://test.com/careers/jobs.json'
+
+
+def _rss(*posts):
+    items = ''.join(
+        f'<item><title>{title}</title><link>https://test.com/blog/{title}</link>'
+        f'<pubDate>{format_datetime(published_at.astimezone())}</pubDate></item>'
+        for title, published_at in posts
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'.encode()
+
+
+class TestWatermarks:
+    """Test cases for DataFetcher watermarks"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher, make_response):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+        self.make_response = make_response
+        self.now = datetime.now().replace(microsecond=0)
+
+    def _fetch_feed(self, content=b'', status_code=200):
+        response = self.make_response(content, status_code, headers={'ETag': '"v1"'})
+        with patch('rush_ci.fetch.safe_request', return_value=response):
+            return self.fetcher._fetch_feed(FEED_URL, 'Test Company')
+
+    def test_first_run_keeps_recent_posts_only(self):
+        """Without a watermark only posts from the initial window are delivered, newest first"""
+        rss = _rss(('old', self.now - timedelta(days=30)),
+                   ('new', self.now - timedelta(hours=1)),
+                   ('newer', self.now - timedelta(minutes=5)))
+
+        blogs = self._fetch_feed(rss)
+
+        assert [blog['title'] for blog in blogs] == ['newer', 'new']
+
+    def test_later_runs_get_only_the_delta(self):
+        """Once a run completes, posts up to its newest are never delivered again"""
+        first = _rss(('a', self.now - timedelta(hours=2)), ('b', self.now - timedelta(hours=1)))
+        second = _rss(('c', self.now), ('a', self.now - timedelta(hours=2)), ('b', self.now - timedelta(hours=1)))
+
+        assert len(self._fetch_feed(first)) == 2
+
+        # Not completed yet: a retry sees the same delta
+        assert len(self._fetch_feed(first)) == 2
+
+        self.fetcher.complete_run()
+        assert [blog['title'] for blog in self._fetch_feed(second)] == ['c']
+        assert self.fetcher.watermarks.get(f'feed:{FEED_URL}') == {
+            'newest': self.now - timedelta(hours=1), 'ids': ['https://test.com/blog/b']
+        }
+
+    def test_not_modified_feed_is_revalidated(self):
+        """A 304 reuses the cached posts minus those the watermark has passed"""
+        rss = _rss(('a', self.now - timedelta(hours=1)))
+
+        assert len(self._fetch_feed(rss)) == 1
+        assert len(self._fetch_feed(status_code=304)) == 1
+
+        self.fetcher.complete_run()
+        assert self._fetch_feed(status_code=304) == []
+
+    def test_job_board_is_diffed_against_the_last_run(self):
+        """Every open posting comes back in board order, flagged against the last run; only new ones alert"""
+        self.fetcher.job_adapters.set(CAREERS_URL, {'adapter': 'greenhouse', 'url': JOBS_URL})
+        competitor = {'name': 'Test Company', 'careers_url': CAREERS_URL}
+
+        def board(*jobs):
+            return self.make_response({'jobs': [
+                {'id': job_id, 'title': title, 'location': {'name': location},
+                 'absolute_url': f'https://test.com/jobs/{job_id}', 'updated_at': updated_at.isoformat()}
+                for job_id, title, location, updated_at in jobs
+            ], 'meta': {'total': len(jobs)}})
+
+        first = board((1, 'VP Design', 'Bangalore', self.now - timedelta(days=60)),
+                      (2, 'VP Engineering', 'Bangalore', self.now - timedelta(days=1)))
+        second = board((2, 'VP Engineering', 'Bangalore', self.now - timedelta(days=1)),
+                       (3, 'VP Product', 'Bangalore', self.now),
+                       (1, 'VP Design', 'Remote', self.now))
+
+        with patch('rush_ci.fetch.safe_request', side_effect=[first, second]):
+            jobs = self.fetcher.fetch_jobs(competitor)
+            # Without a snapshot only recent postings count as new
+            assert [(job['role'], job['is_new'], job['is_updated']) for job in jobs] == [
+                ('VP Design', False, False), ('VP Engineering', True, False)
+            ]
+
+            self.fetcher.complete_run()
+            jobs = self.fetcher.fetch_jobs(competitor)
+
+        assert [(job['role'], job['is_new'], job['is_updated']) for job in jobs] == [
+            ('VP Engineering', False, False), ('VP Product', True, False), ('VP Design', False, True)
+        ]
+
+        parser = DataParser()
+        parsed = parser.parse_jobs(jobs)['Test Company']
+        alerts = [parser._check_alert_conditions(item, 'jobs') for item in parsed]
+        assert [item['role'] for item, alert in zip(parsed, alerts) if alert is not None] == ['VP Product']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,198 @@
+"""
+Unit tests for the WebSub subscriber
+"""
+
+import hmac
+import hashlib
+import pytest
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+from urllib.parse import urlparse
+
+from rush_ci.fetch import DataFetcher
+from rush_ci.utils.circuit_breaker import HostCircuitBreakers
+from rush_ci.utils.http_client import http_client
+from rush_ci.utils.state import JsonStateStore
+from rush_ci.utils.websub import WebSubSubscriber, find_hub
+
+FEED_URL = 'https://test.com/blog/feed'
+HUB_URL = 'https://hub.test.com/'
+CALLBACK_URL = 'https://ci.test/websub'
+
+
+def _rss(*posts):
+    items = ''.join(
+        f'<item><title>{title}</title><link>https://test.com/blog/{title}</link>'
+        f'<pubDate>{format_datetime(published_at.astimezone())}</pubDate></item>'
+        for title, published_at in posts
+    )
+    return (f'<?xml version="1.0"?><rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+            f'<title>T</title><atom:link rel="hub" href="{HUB_URL}"/>'
+            f'<atom:link rel="self" href="{FEED_URL}"/>{items}</channel></rss>').encode()
+
+
+class LocalHub:
+    """Stand-in hub: verifies intent on subscribe and signs what it publishes"""
+
+    def __init__(self, subscriber):
+        self.subscriber = subscriber
+        self.subscriptions = {}
+
+    def post(self, url, data, **kwargs):
+        token = urlparse(data['hub.callback']).path.rsplit('/', 1)[-1]
+        challenge = f"challenge-{len(self.subscriptions)}"
+        echoed = self.subscriber.verify(token, {
+            'hub.mode': data['hub.mode'], 'hub.topic': data['hub.topic'],
+            'hub.challenge': challenge, 'hub.lease_seconds': str(data['hub.lease_seconds'])
+        })
+        if echoed == challenge:
+            self.subscriptions[data['hub.topic']] = (token, data['hub.secret'])
+        return Mock(status_code=202)
+
+    def publish(self, topic, body, secret=None):
+        token, subscribed_secret = self.subscriptions[topic]
+        digest = hmac.new((secret or subscribed_secret).encode(), body, hashlib.sha256).hexdigest()
+        return token, f'sha256={digest}'
+
+
+class TestWebSub:
+    """Test cases for WebSub subscriptions and pushes"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fetcher, make_response):
+        """Setup test fixtures"""
+        self.fetcher = fetcher
+        self.fetcher.websub = WebSubSubscriber(CALLBACK_URL, fetcher.websub.store, lease_seconds=3600 * 48)
+        self.hub = LocalHub(self.fetcher.websub)
+        self.make_response = make_response
+        self.now = datetime.now().replace(microsecond=0)
+
+    def _poll(self, content):
+        with patch('rush_ci.fetch.safe_request', return_value=self.make_response(content)), \
+             patch('rush_ci.utils.http_client.rate_limiter'), \
+             patch.object(http_client.session, 'post', side_effect=self.hub.post) as mock_post:
+            blogs = self.fetcher._fetch_feed(FEED_URL, 'Test Company')
+        return blogs, mock_post
+
+    def test_hub_is_found_in_the_feed(self):
+        """atom:link rel=hub/self in an RSS channel are read"""
+        assert find_hub(self.make_response(_rss(('a', self.now)))) == (HUB_URL, FEED_URL)
+        assert find_hub(self.make_response(b'<rss><channel><title>T</title></channel></rss>')) == (None, None)
+
+    def test_polled_feed_is_subscribed_once(self):
+        """A feed advertising a hub is subscribed and verified; later polls send nothing"""
+        _, mock_post = self._poll(_rss(('a', self.now)))
+        record = self.fetcher.websub.store.get(self.fetcher.websub.token_for(FEED_URL))
+
+        assert mock_post.call_count == 1
+        assert record['state'] == 'active'
+        assert record['expires_at'] > self.now + timedelta(days=1)
+
+        _, mock_post = self._poll(_rss(('a', self.now), ('b', self.now)))
+        assert mock_post.call_count == 0
+
+    def test_pushed_posts_skip_what_polling_saw(self):
+        """Signed pushes deliver only posts past the feed's watermark"""
+        self._poll(_rss(('a', self.now - timedelta(hours=1))))
+        self.fetcher.complete_run()
+
+        body = _rss(('b', self.now), ('a', self.now - timedelta(hours=1)))
+        token, signature = self.hub.publish(FEED_URL, body)
+        subscription = self.fetcher.websub.authenticate(token, body, signature)
+        blogs, watermark = self.fetcher.receive_feed_push(subscription['feed_url'], subscription['company'], body)
+
+        assert [blog['title'] for blog in blogs] == ['b']
+
+        self.fetcher.commit_feed_push(FEED_URL, watermark)
+        assert self.fetcher.receive_feed_push(FEED_URL, 'Test Company', body) == ([], None)
+
+    def test_completed_runs_do_not_commit_pushes(self):
+        """A push whose posts were not handled is delivered again, even after a run completes meanwhile"""
+        self._poll(_rss(('a', self.now - timedelta(hours=1))))
+        self.fetcher.complete_run()
+
+        body = _rss(('b', self.now))
+        self.fetcher.receive_feed_push(FEED_URL, 'Test Company', body)
+        self.fetcher.complete_run()
+
+        assert [blog['title'] for blog in self.fetcher.receive_feed_push(FEED_URL, 'Test Company', body)[0]] == ['b']
+
+    def test_processes_share_state_files(self, state_dir):
+        """The web app's verifications and pushes survive the scheduler's writes from its older copy"""
+        scheduler = WebSubSubscriber(CALLBACK_URL, JsonStateStore('websub_subscriptions', state_dir), lease_seconds=3600 * 48)
+        scheduler_watermarks = JsonStateStore('watermarks', state_dir)
+        self._poll(_rss(('a', self.now - timedelta(hours=1))))
+        token = self.fetcher.websub.token_for(FEED_URL)
+        scheduler_watermarks.get(f'feed:{FEED_URL}')
+        scheduler.store.get(token)
+
+        # The web app advances the watermark with a push, then the scheduler commits an older run
+        body = _rss(('b', self.now))
+        self.fetcher.commit_feed_push(FEED_URL, self.fetcher.receive_feed_push(FEED_URL, 'Test Company', body)[1])
+        scheduler_watermarks.merge({f'feed:{FEED_URL}': {'newest': self.now - timedelta(hours=1), 'ids': ['a']}},
+                                   DataFetcher._merge_watermark)
+        scheduler.store.set('other', {'state': 'pending'})
+
+        assert scheduler.store.get(token)['state'] == 'active'
+        assert JsonStateStore('watermarks', state_dir).get(f'feed:{FEED_URL}')['newest'] == self.now
+        assert self.fetcher.websub.store.get('other') == {'state': 'pending'}
+
+    def test_forged_pushes_and_verifications_are_rejected(self):
+        """Bad signatures and verifications for topics we never asked for are refused"""
+        self._poll(_rss(('a', self.now)))
+
+        body = _rss(('evil', self.now))
+        token, signature = self.hub.publish(FEED_URL, body, secret='guessed')
+
+        assert self.fetcher.websub.authenticate(token, body, signature) is None
+        assert self.fetcher.websub.authenticate(token, body, None) is None
+        assert self.fetcher.websub.verify(token, {'hub.mode': 'subscribe', 'hub.topic': 'https://other.com/feed',
+                                                  'hub.challenge': 'x'}) is None
+
+    def test_verifications_without_a_pending_request_are_rejected(self):
+        """Once active, a forged subscribe or unsubscribe for the topic changes nothing"""
+        self._poll(_rss(('a', self.now)))
+        token = self.fetcher.websub.token_for(FEED_URL)
+        record = self.fetcher.websub.store.get(token)
+
+        for mode in ('subscribe', 'unsubscribe', 'denied'):
+            assert self.fetcher.websub.verify(token, {'hub.mode': mode, 'hub.topic': FEED_URL, 'hub.challenge': 'x',
+                                                      'hub.lease_seconds': '999999999'}) is None
+        assert self.fetcher.websub.store.get(token) == record
+
+    def test_callback_token_is_random(self):
+        """The callback token cannot be derived from the feed URL"""
+        self._poll(_rss(('a', self.now)))
+        token = self.fetcher.websub.token_for(FEED_URL)
+
+        assert token not in (hashlib.sha1(FEED_URL.encode()).hexdigest(), hashlib.sha256(FEED_URL.encode()).hexdigest())
+        assert len(token) >= 32
+
+    def test_subscribe_goes_through_the_circuit_breaker(self):
+        """A hub whose circuit is open is not contacted"""
+        breakers = HostCircuitBreakers(failure_threshold=1, cooldown=60)
+        breakers.record_failure(HUB_URL)
+
+        with patch.object(http_client, 'breakers', breakers):
+            _, mock_post = self._poll(_rss(('a', self.now)))
+
+        assert mock_post.call_count == 0
+        assert self.fetcher.websub.store.get(self.fetcher.websub.token_for(FEED_URL))['state'] == 'pending'
+
+    def test_expiring_leases_are_renewed(self):
+        """Subscriptions within a day of lapsing are re-requested"""
+        self._poll(_rss(('a', self.now)))
+        token = self.fetcher.websub.token_for(FEED_URL)
+        record = self.fetcher.websub.store.get(token)
+        self.fetcher.websub.store.set(token, {**record, 'expires_at': datetime.now() + timedelta(hours=2)})
+
+        with patch('rush_ci.utils.http_client.rate_limiter'), \
+             patch.object(http_client.session, 'post', side_effect=self.hub.post):
+            assert self.fetcher.websub.renew_expiring() == 1
+
+        assert self.fetcher.websub.store.get(token)['expires_at'] > datetime.now() + timedelta(days=1)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
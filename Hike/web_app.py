@@ -159,6 +159,48 @@ def api_data():
         logger.error(f"Error getting data: {e}")
         return jsonify({'error': str(e)})
 
+@app.route('/websub/<token>', methods=['GET'])
+def websub_verify(token):
+    """WebSub verification of intent from a hub"""
+    try:
+        global ci_system
+        if ci_system is None:
+            ci_system = RushCISystem()
+        
+        challenge = ci_system.fetcher.websub.verify(token, request.args)
+        if challenge is None:
+            return 'Unknown subscription', 404
+        
+        return challenge, 200, {'Content-Type': 'text/plain'}
+    except Exception as e:
+        logger.error(f"Error verifying WebSub subscription: {e}")
+        return 'Error', 500
+
+@app.route('/websub/<token>', methods=['POST'])
+def websub_push(token):
+    """WebSub content distribution: parse and alert on the pushed entries"""
+    try:
+        global ci_system
+        if ci_system is None:
+            ci_system = RushCISystem()
+        
+        body = request.get_data()
+        subscription = ci_system.fetcher.websub.authenticate(token, body, request.headers.get('X-Hub-Signature'))
+        
+        # Hubs must get a 2xx even for pushes we ignore, or they retry them
+        if subscription is None:
+            return '', 202
+        
+        # Acknowledge straight away; parsing and alerting run in the background
+        thread = threading.Thread(target=ci_system.process_feed_push, args=(subscription, body))
+        thread.daemon = True
+        thread.start()
+        
+        return '', 202
+    except Exception as e:
+        logger.error(f"Error receiving WebSub push: {e}")
+        return '', 202
+
 @app.route('/briefs')
 def briefs():
     """Page to view weekly briefs"""